@@ -0,0 +1,35 @@
+"""add open blocking milestones index
+
+Revision ID: a7b8c9d0e1f2
+Revises: f5a6b7c8d9e0
+Create Date: 2025-10-10 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b8c9d0e1f2"
+down_revision: str | Sequence[str] | None = "f5a6b7c8d9e0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GET /api/milestones/blocking reads the first N entries of this index up to the
+    # horizon; only open blocking milestones are indexed, so it stays small
+    op.create_index(
+        "idx_milestones_open_blocking_due",
+        "milestones",
+        ["due"],
+        postgresql_where=sa.text("blocking AND status <> 'done'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_milestones_open_blocking_due", table_name="milestones")
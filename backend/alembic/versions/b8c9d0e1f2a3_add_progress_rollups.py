@@ -0,0 +1,86 @@
+"""add progress rollups
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2025-10-11 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: str | Sequence[str] | None = "a7b8c9d0e1f2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _counter(name: str) -> sa.Column[int]:
+    return sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Task counters per project (see StatusRollup in core.rollup)
+    op.create_table(
+        "project_progress",
+        sa.Column("project_id", UUID(as_uuid=True), nullable=False),
+        _counter("task_count"),
+        _counter("tasks_done"),
+        _counter("tasks_blocked"),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id"),
+        sa.CheckConstraint(
+            "task_count >= 0 AND tasks_done >= 0 AND tasks_blocked >= 0",
+            name="check_project_progress_counts",
+        ),
+    )
+    op.execute(
+        """
+        INSERT INTO project_progress (project_id, task_count, tasks_done, tasks_blocked)
+        SELECT p.id,
+               count(t.id),
+               count(t.id) FILTER (WHERE t.status = 'done'),
+               count(t.id) FILTER (WHERE t.status = 'blocked')
+        FROM projects AS p
+        LEFT JOIN tasks AS t ON t.project_id = p.id
+        GROUP BY p.id
+        """
+    )
+
+    # Milestone counters per goal
+    op.create_table(
+        "goal_progress",
+        sa.Column("goal_id", UUID(as_uuid=True), nullable=False),
+        _counter("milestone_count"),
+        _counter("milestones_done"),
+        _counter("milestones_blocked"),
+        sa.ForeignKeyConstraint(["goal_id"], ["goals.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("goal_id"),
+        sa.CheckConstraint(
+            "milestone_count >= 0 AND milestones_done >= 0 AND milestones_blocked >= 0",
+            name="check_goal_progress_counts",
+        ),
+    )
+    op.execute(
+        """
+        INSERT INTO goal_progress (goal_id, milestone_count, milestones_done, milestones_blocked)
+        SELECT g.id,
+               count(m.id),
+               count(m.id) FILTER (WHERE m.status = 'done'),
+               count(m.id) FILTER (WHERE m.status = 'blocked')
+        FROM goals AS g
+        LEFT JOIN milestones AS m ON m.goal_id = g.id
+        GROUP BY g.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("goal_progress")
+    op.drop_table("project_progress")
@@ -0,0 +1,36 @@
+"""add goals keyset pagination index
+
+Revision ID: c7d8e9f0a1b2
+Revises: b1c2d3e4f5a6
+Create Date: 2025-10-08 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d8e9f0a1b2"
+down_revision: str | Sequence[str] | None = "b1c2d3e4f5a6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Matches the keyset order (is_done, date_updated DESC, id DESC) of GET /api/goals;
+    # it also covers the plain is_done filter, so the single-column index is dropped.
+    op.create_index(
+        "idx_goals_is_done_date_updated_id",
+        "goals",
+        ["is_done", sa.text("date_updated DESC"), sa.text("id DESC")],
+    )
+    op.drop_index("idx_goals_is_done", table_name="goals")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("idx_goals_is_done", "goals", ["is_done"])
+    op.drop_index("idx_goals_is_done_date_updated_id", table_name="goals")
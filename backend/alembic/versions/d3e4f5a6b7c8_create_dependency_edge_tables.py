@@ -0,0 +1,69 @@
+"""create project and task dependency edge tables
+
+Revision ID: d3e4f5a6b7c8
+Revises: c7d8e9f0a1b2
+Create Date: 2025-10-09 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision: str = "d3e4f5a6b7c8"
+down_revision: str | Sequence[str] | None = "c7d8e9f0a1b2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (edge table, owner column, referenced table)
+_EDGE_TABLES = (
+    ("project_dependencies", "project_id", "projects"),
+    ("task_dependencies", "task_id", "tasks"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, owner, target in _EDGE_TABLES:
+        # Owner rows cascade; the referenced side keeps the default NO ACTION so a
+        # dependency cannot be deleted while something still depends on it.
+        op.create_table(
+            table,
+            sa.Column(owner, UUID(as_uuid=True), nullable=False),
+            sa.Column("depends_on_id", UUID(as_uuid=True), nullable=False),
+            sa.PrimaryKeyConstraint(owner, "depends_on_id"),
+            sa.ForeignKeyConstraint([owner], [f"{target}.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["depends_on_id"], [f"{target}.id"]),
+        )
+        # Reverse direction: "who depends on X" is an index seek
+        op.create_index(f"idx_{table}_depends_on_id", table, ["depends_on_id", owner])
+
+    # Backfill from the dependency arrays, skipping dangling references
+    op.execute(
+        """
+        INSERT INTO project_dependencies (project_id, depends_on_id)
+        SELECT DISTINCT src.id, dep.id
+        FROM projects AS src
+        CROSS JOIN LATERAL unnest(src.dependencies) AS edge(depends_on_id)
+        JOIN projects AS dep ON dep.id = edge.depends_on_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO task_dependencies (task_id, depends_on_id)
+        SELECT DISTINCT src.id, dep.id
+        FROM tasks AS src
+        CROSS JOIN LATERAL unnest(src.dependencies) AS edge(depends_on_id)
+        JOIN tasks AS dep ON dep.id = edge.depends_on_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _, _ in reversed(_EDGE_TABLES):
+        op.drop_index(f"idx_{table}_depends_on_id", table_name=table)
+        op.drop_table(table)
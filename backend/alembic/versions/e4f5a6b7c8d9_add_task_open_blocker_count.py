@@ -0,0 +1,58 @@
+"""add task open blocker count
+
+Revision ID: e4f5a6b7c8d9
+Revises: d3e4f5a6b7c8
+Create Date: 2025-10-09 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e4f5a6b7c8d9"
+down_revision: str | Sequence[str] | None = "d3e4f5a6b7c8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "tasks",
+        sa.Column("open_blocker_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_check_constraint("check_task_open_blocker_count", "tasks", "open_blocker_count >= 0")
+
+    # Backfill: dependencies whose status is not yet done
+    op.execute(
+        """
+        UPDATE tasks AS t
+        SET open_blocker_count = open.n
+        FROM (
+            SELECT e.task_id, count(*) AS n
+            FROM task_dependencies AS e
+            JOIN tasks AS dep ON dep.id = e.depends_on_id
+            WHERE dep.status <> 'done'
+            GROUP BY e.task_id
+        ) AS open
+        WHERE open.task_id = t.id
+        """
+    )
+
+    # Ready list (GET /api/tasks/unblocked) is a range scan over this partial index
+    op.create_index(
+        "idx_tasks_unblocked",
+        "tasks",
+        ["project_id", sa.text("date_created DESC")],
+        postgresql_where=sa.text("open_blocker_count = 0 AND status <> 'done'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_tasks_unblocked", table_name="tasks")
+    op.drop_constraint("check_task_open_blocker_count", "tasks", type_="check")
+    op.drop_column("tasks", "open_blocker_count")
@@ -0,0 +1,41 @@
+"""add milestones filter indexes
+
+Revision ID: f5a6b7c8d9e0
+Revises: e4f5a6b7c8d9
+Create Date: 2025-10-10 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f5a6b7c8d9e0"
+down_revision: str | Sequence[str] | None = "e4f5a6b7c8d9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Trailing columns match the `sort=due` order (due NULLS FIRST, date_created DESC)
+_DUE_ORDER = [sa.text("due NULLS FIRST"), sa.text("date_created DESC")]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # goal_id [+ due window]: also the per-goal list order and the goals FK lookup,
+    # so the single-column goal_id index is dropped
+    op.create_index("idx_milestones_goal_id_due", "milestones", ["goal_id", *_DUE_ORDER])
+    op.drop_index("idx_milestones_goal_id", table_name="milestones")
+
+    # status [+ due window], e.g. open milestones due this week; replaces idx_milestones_status
+    op.create_index("idx_milestones_status_due", "milestones", ["status", *_DUE_ORDER])
+    op.drop_index("idx_milestones_status", table_name="milestones")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("idx_milestones_status", "milestones", ["status"])
+    op.drop_index("idx_milestones_status_due", table_name="milestones")
+    op.create_index("idx_milestones_goal_id", "milestones", ["goal_id"])
+    op.drop_index("idx_milestones_goal_id_due", table_name="milestones")
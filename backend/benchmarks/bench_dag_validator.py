@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark DagValidator on long dependency chains (10^4 .. 10^6 nodes).
+
+Reports wall time and peak traced memory per node for an acyclic chain and for a
+chain closed into a cycle. Linear behaviour shows up as flat per-node figures.
+Exits non-zero if the per-node cost at 10^6 exceeds 3x the cost at 10^4.
+
+Usage:
+    uv run python benchmarks/bench_dag_validator.py
+"""
+
+from __future__ import annotations
+
+from itertools import pairwise
+import sys
+import time
+import tracemalloc
+from uuid import UUID, uuid4
+
+from ai_life_backend.projects.services.dag_validator import DagValidator
+
+SIZES = (10_000, 100_000, 1_000_000)
+MAX_PER_NODE_GROWTH = 3.0
+
+
+def chain(size: int, *, closed: bool) -> dict[UUID, list[UUID]]:
+    """Build n0 -> n1 -> ... -> n(size-1), optionally with a back edge to n0."""
+    nodes = [uuid4() for _ in range(size)]
+    graph = {a: [b] for a, b in pairwise(nodes)}
+    graph[nodes[-1]] = [nodes[0]] if closed else []
+    return graph
+
+
+def measure(graph: dict[UUID, list[UUID]]) -> tuple[float, int, int]:
+    """Return (seconds, peak traced bytes, cycle length) for one find_cycle_path call."""
+    validator = DagValidator()
+    start = time.perf_counter()
+    cycle = validator.find_cycle_path(graph)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    validator.find_cycle_path(graph)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(cycle) if cycle else 0
+
+
+def main() -> int:
+    """Run the benchmark and print a table."""
+    print(f"{'nodes':>10} {'shape':>8} {'seconds':>9} {'ns/node':>9} {'B/node':>8} {'cycle':>9}")
+    per_node: dict[int, float] = {}
+    for size in SIZES:
+        for closed in (False, True):
+            elapsed, peak, cycle_len = measure(chain(size, closed=closed))
+            ns_per_node = elapsed / size * 1e9
+            per_node[size] = max(per_node.get(size, 0.0), ns_per_node)
+            shape = "cycle" if closed else "acyclic"
+            print(
+                f"{size:>10} {shape:>8} {elapsed:>9.3f} {ns_per_node:>9.0f} "
+                f"{peak / size:>8.0f} {cycle_len:>9}"
+            )
+    growth = per_node[SIZES[-1]] / per_node[SIZES[0]]
+    print(f"per-node time growth {SIZES[0]} -> {SIZES[-1]}: {growth:.2f}x")
+    return 0 if growth <= MAX_PER_NODE_GROWTH else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
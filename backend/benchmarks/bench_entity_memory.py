@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Measure per-object memory of slotted domain entities over 1M tasks.
+
+Builds 1M `Task` instances and 1M instances of an equivalent frozen dataclass
+without `slots=True` (what `Task` used to be), all sharing the same field values,
+so tracemalloc reports only the per-object overhead that `InMemoryTaskRepository`
+pays for every resident task. Exits non-zero if slots do not save memory.
+
+Usage:
+    uv run python benchmarks/bench_entity_memory.py
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import fields, make_dataclass
+from datetime import UTC, datetime
+import gc
+import sys
+import tracemalloc
+from typing import Any
+from uuid import uuid4
+
+from ai_life_backend.projects.domain.task import (
+    Task,
+    TaskClarity,
+    TaskContinuity,
+    TaskEnergy,
+    TaskRisk,
+    TaskSize,
+)
+
+COUNT = 1_000_000
+
+DictTask = make_dataclass("DictTask", [(f.name, f.type) for f in fields(Task)], frozen=True)
+
+
+def task_kwargs() -> dict[str, Any]:
+    """Field values shared by every instance."""
+    now = datetime.now(UTC)
+    return {
+        "id": uuid4(),
+        "project_id": uuid4(),
+        "title": "Task",
+        "status": "todo",
+        "dependencies": [],
+        "size": TaskSize.M,
+        "energy": TaskEnergy.FOCUS,
+        "continuity": TaskContinuity.CHAIN,
+        "clarity": TaskClarity.CLEAR,
+        "risk": TaskRisk.GREEN,
+        "context": "",
+        "date_created": now,
+        "date_updated": now,
+    }
+
+
+def traced_bytes(factory: Callable[..., object], kwargs: dict[str, Any]) -> int:
+    """Return bytes still allocated after building COUNT instances."""
+    gc.collect()
+    tracemalloc.start()
+    instances = [factory(**kwargs) for _ in range(COUNT)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return current
+
+
+def main() -> int:
+    """Run the benchmark and print per-object figures."""
+    kwargs = task_kwargs()
+    slotted = traced_bytes(Task, kwargs)
+    with_dict = traced_bytes(DictTask, kwargs)
+    print(f"{COUNT} tasks (shared field values)")
+    print(
+        f"{'__dict__ dataclass':<20} {with_dict / 2**20:>8.1f} MiB {with_dict / COUNT:>6.0f} B/obj"
+    )
+    print(f"{'slots dataclass':<20} {slotted / 2**20:>8.1f} MiB {slotted / COUNT:>6.0f} B/obj")
+    print(f"saved {(with_dict - slotted) / COUNT:.0f} B/obj ({1 - slotted / with_dict:.0%})")
+    return 0 if slotted < with_dict else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Benchmark JSON rendering of 10k-item goal, milestone and task lists.
+
+Compares the standard library encoder behind FastAPI's `JSONResponse` with the
+orjson-based `FastJSONResponse` on the JSON-compatible content a response-model
+route hands to its response class. For tasks it also times the full route path
+before (per-item `TaskResponse.model_validate`) and after (`trusted_json_response`).
+
+Usage:
+    uv run python benchmarks/bench_json_rendering.py
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+import json
+import sys
+import time
+from typing import Any
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from ai_life_backend.core.httpkit import FastJSONResponse
+from ai_life_backend.core.public import trusted_json_response
+from ai_life_backend.goals.api.schemas import GoalListResponse, GoalResponse
+from ai_life_backend.goals.domain import Goal
+from ai_life_backend.milestones.api.schemas import MilestoneListResponse, MilestoneResponse
+from ai_life_backend.milestones.domain.milestone import Milestone
+from ai_life_backend.projects.api.schemas import TaskResponse, task_list_adapter
+from ai_life_backend.projects.domain.task import (
+    Task,
+    TaskClarity,
+    TaskContinuity,
+    TaskEnergy,
+    TaskRisk,
+    TaskSize,
+)
+
+ITEMS = 10_000
+REPEAT = 5
+
+task_response_adapter = TypeAdapter(list[TaskResponse])
+
+
+def make_goals(count: int) -> list[Goal]:
+    """Build domain goals."""
+    now = datetime.now(UTC)
+    return [Goal(uuid4(), f"Goal {i}", i % 2 == 0, now, now) for i in range(count)]
+
+
+def make_milestones(count: int) -> list[Milestone]:
+    """Build domain milestones, half of them with a due date."""
+    now = datetime.now(UTC)
+    goal_id = uuid4()
+    return [
+        Milestone(
+            id=uuid4(),
+            goal_id=goal_id,
+            title=f"Milestone {i}",
+            due=now if i % 2 else None,
+            status="todo",
+            demo_criterion="Demo it",
+            blocking=i % 3 == 0,
+            date_created=now,
+            date_updated=now,
+        )
+        for i in range(count)
+    ]
+
+
+def make_tasks(count: int) -> list[Task]:
+    """Build domain tasks with one dependency each."""
+    now = datetime.now(UTC)
+    project_id = uuid4()
+    return [
+        Task(
+            id=uuid4(),
+            project_id=project_id,
+            title=f"Task {i}",
+            status="todo",
+            dependencies=[uuid4()],
+            size=TaskSize.M,
+            energy=TaskEnergy.FOCUS,
+            continuity=TaskContinuity.CHAIN,
+            clarity=TaskClarity.CLEAR,
+            risk=TaskRisk.GREEN,
+            context="",
+            date_created=now,
+            date_updated=now,
+        )
+        for i in range(count)
+    ]
+
+
+def route_content() -> dict[str, Any]:
+    """JSON-compatible content of each list route, as produced by its response model."""
+    goals = GoalListResponse(goals=[GoalResponse.model_validate(g) for g in make_goals(ITEMS)])
+    milestones = MilestoneListResponse(
+        milestones=[MilestoneResponse.model_validate(m) for m in make_milestones(ITEMS)]
+    )
+    tasks = [TaskResponse.model_validate(t) for t in make_tasks(ITEMS)]
+    return {
+        "goals": goals.model_dump(mode="json"),
+        "milestones": milestones.model_dump(mode="json"),
+        "tasks": task_response_adapter.dump_python(tasks, mode="json"),
+    }
+
+
+def render_stdlib(content: object) -> bytes:
+    """Previous default response class."""
+    return bytes(JSONResponse(content).body)
+
+
+def render_orjson(content: object) -> bytes:
+    """New default response class."""
+    return bytes(FastJSONResponse(content).body)
+
+
+def list_tasks_validated(tasks: list[Task]) -> bytes:
+    """Previous `list_tasks`: validate every item, serialize, render with the stdlib."""
+    validated = [TaskResponse.model_validate(t) for t in tasks]
+    return render_stdlib(task_response_adapter.dump_python(validated, mode="json"))
+
+
+def list_tasks_trusted(tasks: list[Task]) -> bytes:
+    """New `list_tasks`."""
+    return bytes(trusted_json_response(task_list_adapter, tasks).body)
+
+
+def best_of(fn: Callable[[Any], Any], arg: Any) -> float:
+    """Return the best wall time of REPEAT runs."""
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn(arg)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def report(name: str, before: float, after: float) -> None:
+    """Print one before/after line in per-item costs."""
+    print(
+        f"{name:<24} {before / ITEMS * 1e6:>7.2f} -> {after / ITEMS * 1e6:>6.2f} us/item "
+        f"({before / after:.1f}x)"
+    )
+
+
+def main() -> int:
+    """Run the benchmark and print per-item costs."""
+    contents = route_content()
+    for name, content in contents.items():
+        if json.loads(render_orjson(content)) != json.loads(render_stdlib(content)):
+            print(f"{name}: orjson output differs from the stdlib encoder")
+            return 1
+
+    print(f"{ITEMS} items per list, best of {REPEAT}")
+    for name, content in contents.items():
+        report(f"render {name}", best_of(render_stdlib, content), best_of(render_orjson, content))
+    tasks = make_tasks(ITEMS)
+    report(
+        "list_tasks end-to-end",
+        best_of(list_tasks_validated, tasks),
+        best_of(list_tasks_trusted, tasks),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
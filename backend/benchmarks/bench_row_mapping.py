@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark row -> domain mapping and list serialization for 100k goals.
+
+Compares the previous path (keyword construction from `row.<attr>`, per-item
+`GoalResponse.model_validate`, response-model serialization) with `RowMapper`
+plus `trusted_json_response`. Rows are real SQLAlchemy `Row` objects, so the
+figures exclude only the database driver.
+
+Usage:
+    uv run python benchmarks/bench_row_mapping.py
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+import sys
+import time
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.engine import Row
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+
+from ai_life_backend.core.public import RowMapper, trusted_json_response
+from ai_life_backend.goals.api.schemas import (
+    GoalListPayload,
+    GoalListResponse,
+    GoalResponse,
+    goal_list_adapter,
+)
+from ai_life_backend.goals.domain import Goal
+from ai_life_backend.goals.repository.postgres_goal_repository import goals_table
+
+ROWS = 100_000
+REPEAT = 3
+
+
+def make_rows(count: int) -> list[Row[Any]]:
+    """Build `select(goals)` rows without a database."""
+    now = datetime.now(UTC)
+    values = [(uuid4(), f"Goal {i}", i % 2 == 0, now, now) for i in range(count)]
+    return IteratorResult(SimpleResultMetaData(list(goals_table.c.keys())), iter(values)).all()
+
+
+def map_by_attribute(rows: list[Row[Any]]) -> list[Goal]:
+    """Previous repository mapping."""
+    return [
+        Goal(
+            id=row.id,
+            title=row.title,
+            is_done=row.is_done,
+            date_created=row.date_created,
+            date_updated=row.date_updated,
+        )
+        for row in rows
+    ]
+
+
+def serialize_validated(goals: list[Goal]) -> bytes:
+    """Previous route path: validate every item, then the response model again."""
+    response = GoalListResponse(goals=[GoalResponse.model_validate(g) for g in goals])
+    return GoalListResponse.model_validate(response).model_dump_json().encode()
+
+
+def serialize_trusted(goals: list[Goal]) -> bytes:
+    """New route path."""
+    return bytes(trusted_json_response(goal_list_adapter, GoalListPayload(goals)).body)
+
+
+def best_of(fn: Callable[[Any], Any], arg: Any) -> float:
+    """Return the best wall time of REPEAT runs."""
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn(arg)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    """Run the benchmark and print per-row costs."""
+    rows = make_rows(ROWS)
+    mapper = RowMapper(Goal, goals_table)
+    goals = mapper.many(rows)
+    if map_by_attribute(rows) != goals:
+        print("RowMapper output differs from attribute mapping")
+        return 1
+
+    results = {
+        "map: row.<attr> kwargs": best_of(map_by_attribute, rows),
+        "map: RowMapper.many": best_of(mapper.many, rows),
+        "serialize: model_validate": best_of(serialize_validated, goals),
+        "serialize: trusted adapter": best_of(serialize_trusted, goals),
+    }
+    print(f"{ROWS} rows, best of {REPEAT}")
+    for name, seconds in results.items():
+        print(f"{name:<28} {seconds:>8.3f}s {seconds / ROWS * 1e6:>8.2f} us/row")
+    before = results["map: row.<attr> kwargs"] + results["serialize: model_validate"]
+    after = results["map: RowMapper.many"] + results["serialize: trusted adapter"]
+    print(
+        f"end-to-end {before / ROWS * 1e6:.2f} -> {after / ROWS * 1e6:.2f} us/row "
+        f"({before / after:.1f}x)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Export all goals, milestones, projects, tasks and dependency edges as NDJSON.
+
+Usage:
+    python scripts/export_ndjson.py                      # to stdout
+    python scripts/export_ndjson.py -o export.ndjson     # to a file
+    python scripts/export_ndjson.py --batch-size 5000
+
+The database is selected by DATABASE_URL. Rows are streamed through a server-side
+cursor and written as they arrive, so memory stays flat for any data size.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import sys
+from typing import BinaryIO
+
+# Ensure backend/src is importable
+ROOT = Path(__file__).resolve().parents[1]  # .../backend
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+try:
+    from ai_life_backend.database import dispose_engine, get_engine
+    from ai_life_backend.transfer.public import DEFAULT_BATCH_SIZE, stream_export
+except ModuleNotFoundError as e:
+    print(f"[ERROR] Missing Python package: {e.name}", file=sys.stderr)
+    print(
+        "Fix: run from the project environment, e.g. `uv run python scripts/export_ndjson.py`",
+        file=sys.stderr,
+    )
+    sys.exit(1)
+
+
+async def export(out: BinaryIO, batch_size: int) -> None:
+    """Write the export stream to `out`, then close the engine."""
+    try:
+        async for chunk in stream_export(get_engine(), batch_size):
+            out.write(chunk)
+    finally:
+        out.flush()
+        await dispose_engine()
+
+
+def main() -> None:
+    """Parse arguments and run the export."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--out", type=Path, help="output file (default: stdout)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    if args.out is None:
+        asyncio.run(export(sys.stdout.buffer, args.batch_size))
+        return
+    with args.out.open("wb") as out:
+        asyncio.run(export(out, args.batch_size))
+    print(f"✓ Export written to: {args.out}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
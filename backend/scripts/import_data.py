@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Bulk-import goals, milestones, projects and tasks from NDJSON or CSV.
+
+Usage:
+    python scripts/import_data.py export.ndjson           # export format
+    python scripts/import_data.py tasks.csv --kind task   # one entity type per CSV
+
+The database is selected by DATABASE_URL. The batch is COPYed into staging tables,
+validated set-based and committed atomically; on any problem nothing is written
+and the problems are printed. Running API processes pick the new rows up in their
+read caches within CACHE_TTL_SECONDS.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import sys
+
+# Ensure backend/src is importable
+ROOT = Path(__file__).resolve().parents[1]  # .../backend
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+try:
+    from ai_life_backend.database import dispose_engine, get_engine
+    from ai_life_backend.transfer.public import (
+        ImportBatch,
+        ImportValidationError,
+        import_batch,
+        parse_csv,
+        parse_ndjson,
+    )
+except ModuleNotFoundError as e:
+    print(f"[ERROR] Missing Python package: {e.name}", file=sys.stderr)
+    print(
+        "Fix: run from the project environment, e.g. `uv run python scripts/import_data.py`",
+        file=sys.stderr,
+    )
+    sys.exit(1)
+
+
+def read_batch(path: Path, kind: str | None) -> ImportBatch:
+    """Parse the input file; CSV needs the entity kind."""
+    if path.suffix.lower() == ".csv":
+        if kind is None:
+            print("[ERROR] --kind is required for CSV input", file=sys.stderr)
+            sys.exit(2)
+        return parse_csv(kind, path.read_text(encoding="utf-8-sig"))
+    with path.open("rb") as lines:
+        return parse_ndjson(lines)
+
+
+async def run(batch: ImportBatch) -> int:
+    """Import the batch and report the outcome; returns the exit code."""
+    try:
+        summary = await import_batch(get_engine(), batch)
+    except ImportValidationError as e:
+        print(f"[ERROR] Import rejected, nothing was written ({len(e.errors)} shown):")
+        for problem in e.errors:
+            print(f"  - {problem}")
+        return 1
+    finally:
+        await dispose_engine()
+    print(
+        f"✓ Imported {summary.goals} goals, {summary.milestones} milestones, "
+        f"{summary.projects} projects, {summary.tasks} tasks"
+    )
+    return 0
+
+
+def main() -> None:
+    """Parse arguments and run the import."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path, help="NDJSON (export format) or CSV file")
+    parser.add_argument("--kind", choices=["goal", "milestone", "project", "task"])
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(read_batch(args.path, args.kind))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Check or rebuild the goal and project progress rollup tables.
+
+Usage:
+    python scripts/rebuild_rollups.py            # recount every rollup row
+    python scripts/rebuild_rollups.py --check    # report drift only, exit 1 if any
+
+The database is selected by DATABASE_URL. The API keeps the rollups current in the
+same transaction as each milestone and task write; this script is the recovery path
+after writes that bypassed it (manual SQL, restores). The rebuild runs in a single
+transaction.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import sys
+
+# Ensure backend/src is importable
+ROOT = Path(__file__).resolve().parents[1]  # .../backend
+SRC = ROOT / "src"
+sys.path.insert(0, str(SRC))
+
+try:
+    from ai_life_backend.database import dispose_engine, get_engine
+    from ai_life_backend.overview.public import ROLLUPS
+except ModuleNotFoundError as e:
+    print(f"[ERROR] Missing Python package: {e.name}", file=sys.stderr)
+    print(
+        "Fix: run from the project environment, e.g. `uv run python scripts/rebuild_rollups.py`",
+        file=sys.stderr,
+    )
+    sys.exit(1)
+
+
+async def run(check: bool) -> int:
+    """Report drift per rollup table, then rebuild unless `check`; returns the exit code."""
+    drifted = 0
+    try:
+        async with get_engine().begin() as conn:
+            for name, rollup in ROLLUPS.items():
+                rows = (await conn.execute(rollup.drift())).all()
+                drifted += len(rows)
+                print(f"{name}: {len(rows)} drifted rows")
+                for row in rows:
+                    print(f"  - {dict(row._mapping)}")
+                if not check:
+                    await conn.execute(rollup.recount())
+    finally:
+        await dispose_engine()
+    if check:
+        return 1 if drifted else 0
+    print(f"✓ Rebuilt {', '.join(ROLLUPS)} ({drifted} rows corrected)")
+    return 0
+
+
+def main() -> None:
+    """Parse arguments and run the check or rebuild."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="report drift without writing")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.check)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,57 +1,127 @@
 """AI Life OS FastAPI application with goals management API."""
 
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+import logging
 from typing import Any
 
 from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.exceptions import HTTPException
+
+from ai_life_backend.container import dispose_container, get_container
+from ai_life_backend.core.public import (
+    CompressionMiddleware,
+    CompressionSettings,
+    FastJSONResponse,
+)
+from ai_life_backend.database import PoolSettings, pool_status, warm_up
+from ai_life_backend.errors import http_exception_handler, validation_exception_handler
 from ai_life_backend.goals.public import goals_router
 from ai_life_backend.milestones.public import milestones_router
+from ai_life_backend.overview.public import overview_router
+from ai_life_backend.projects.public import projects_router, tasks_router
+from ai_life_backend.transfer.public import transfer_router
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncGenerator[None]:
+    """Build the container and pre-warm its pool on startup; dispose it on shutdown."""
+    container = get_container()
+    settings = PoolSettings.from_env()
+    try:
+        await warm_up(container.engine, settings.warmup)
+    except (OSError, SQLAlchemyError) as e:
+        # The API still starts; requests will connect lazily once the database is up
+        logger.warning("Connection pool warm-up failed: %s", e)
+    try:
+        yield
+    finally:
+        await dispose_container()
+
 
 app = FastAPI(
     title="AI Life OS API",
     description="Goals Management MVP - Backend API",
     version="0.1.0",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
+# Errors, including framework 404/405/422 responses, are RFC 7807 Problem documents
+app.exception_handler(HTTPException)(http_exception_handler)
+app.exception_handler(RequestValidationError)(validation_exception_handler)
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PATCH", "DELETE"],
-    allow_headers=["Content-Type"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["Content-Type", "If-None-Match"],
+    expose_headers=["ETag"],
 )
 
+# Large lists and the NDJSON export are compressed; small bodies skip it (COMPRESSION_*)
+_compression = CompressionSettings.from_env()
+if _compression.enabled:
+    app.add_middleware(CompressionMiddleware, settings=_compression)
+
 
+# Before goals_router, whose /goals/{goal_id} would otherwise claim /goals/overview
+app.include_router(overview_router, prefix="/api", tags=["overview"])
 app.include_router(goals_router, prefix="/api", tags=["goals"])
 app.include_router(milestones_router, prefix="/api", tags=["milestones"])
+app.include_router(projects_router, prefix="/api", tags=["projects"])
+app.include_router(tasks_router, prefix="/api", tags=["tasks"])
+app.include_router(transfer_router, prefix="/api", tags=["transfer"])
 
 
-@app.get(
-    "/health",
-    tags=["health"],
-    responses={
-        400: {
-            "description": "Bad Request",
-            "content": {
-                "application/problem+json": {"schema": {"$ref": "#/components/schemas/Problem"}}
-            },
+_HEALTH_RESPONSES: dict[int | str, dict[str, Any]] = {
+    400: {
+        "description": "Bad Request",
+        "content": {
+            "application/problem+json": {"schema": {"$ref": "#/components/schemas/Problem"}}
         },
-        500: {
-            "description": "Server Error",
-            "content": {
-                "application/problem+json": {"schema": {"$ref": "#/components/schemas/Problem"}}
-            },
+    },
+    500: {
+        "description": "Server Error",
+        "content": {
+            "application/problem+json": {"schema": {"$ref": "#/components/schemas/Problem"}}
         },
     },
+}
+
+
+@app.get(
+    "/health",
+    tags=["health"],
+    responses=_HEALTH_RESPONSES,
 )
 async def health_check() -> dict[str, str]:
     """Health check endpoint."""
     return {"status": "ok"}
 
 
+@app.get("/health/db", tags=["health"], responses=_HEALTH_RESPONSES)
+async def database_pool_status() -> dict[str, Any]:
+    """Connection pool statistics (size, checked in/out, overflow) for diagnostics."""
+    return pool_status(get_container().engine)
+
+
+@app.get("/health/cache", tags=["health"], responses=_HEALTH_RESPONSES)
+async def read_cache_status() -> dict[str, Any]:
+    """Read cache statistics (hits, misses, evictions, size) for diagnostics."""
+    cache = get_container().cache
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.backend.stats()}
+
+
 def custom_openapi() -> dict[str, Any]:
     """Generate custom OpenAPI schema with RFC7807 Problem schema."""
     if app.openapi_schema:
@@ -97,6 +167,9 @@ def custom_openapi() -> dict[str, Any]:
     schema["tags"] = [
         {"name": "goals", "description": "Goals management endpoints"},
         {"name": "milestones", "description": "Milestones management endpoints"},
+        {"name": "projects", "description": "Projects management endpoints"},
+        {"name": "tasks", "description": "Tasks management endpoints"},
+        {"name": "transfer", "description": "Bulk export and import endpoints"},
         {"name": "health", "description": "Health checks"},
     ]
 
@@ -0,0 +1,123 @@
+"""Application-scoped dependency container.
+
+One container per process owns the engine and the repositories, so route
+dependencies and in-process public ports share the same instances (and whatever
+caches they hold) instead of constructing a repository per call.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ai_life_backend.core.public import CacheSettings, ReadThroughCache, TTLCache
+from ai_life_backend.database import dispose_engine, get_engine
+from ai_life_backend.goals.repository.cached_goal_repository import (
+    ALL_KEY as ALL_GOALS_KEY,
+    CachedGoalRepository,
+    status_key,
+)
+from ai_life_backend.goals.repository.postgres_goal_repository import PostgresGoalRepository
+from ai_life_backend.milestones.repository.cached_milestone_repository import (
+    ALL_KEY as ALL_MILESTONES_KEY,
+    CachedMilestoneRepository,
+    goal_list_key,
+)
+from ai_life_backend.milestones.repository.postgres_milestone_repository import (
+    PostgresMilestoneRepository,
+)
+from ai_life_backend.projects.repository.cached_task_repository import CachedTaskRepository
+from ai_life_backend.projects.repository.postgres_project_repository import (
+    PostgresProjectRepository,
+)
+from ai_life_backend.projects.repository.postgres_task_repository import PostgresTaskRepository
+from ai_life_backend.projects.services.next_task import NextTaskScheduler
+from ai_life_backend.projects.services.schedule import ProjectScheduler, schedule_key
+
+
+@dataclass(frozen=True, slots=True)
+class Container:
+    """Process-wide engine, repositories, services and the optional read cache."""
+
+    engine: AsyncEngine
+    goals: PostgresGoalRepository
+    milestones: PostgresMilestoneRepository
+    projects: PostgresProjectRepository
+    tasks: PostgresTaskRepository
+    scheduler: ProjectScheduler
+    next_tasks: NextTaskScheduler
+    cache: ReadThroughCache | None = None
+
+    @classmethod
+    def build(cls, engine: AsyncEngine, cache: CacheSettings | None = None) -> Container:
+        """Wire every repository to the given engine.
+
+        Goal and milestone reads and project schedules go through an in-process TTL
+        cache unless the cache settings (default: `CACHE_*` environment) disable it.
+        """
+        settings = CacheSettings.from_env() if cache is None else cache
+        projects = PostgresProjectRepository(engine)
+        if not settings.enabled:
+            tasks = PostgresTaskRepository(engine)
+            scheduler = ProjectScheduler(tasks)
+            return cls(
+                engine=engine,
+                goals=PostgresGoalRepository(engine),
+                milestones=PostgresMilestoneRepository(engine),
+                projects=projects,
+                tasks=tasks,
+                scheduler=scheduler,
+                next_tasks=NextTaskScheduler(tasks, projects, scheduler),
+            )
+        read_cache = ReadThroughCache(TTLCache(settings.ttl_seconds, settings.max_entries))
+        milestones = CachedMilestoneRepository(engine, read_cache)
+        cached_tasks = CachedTaskRepository(engine, read_cache)
+        cached_scheduler = ProjectScheduler(cached_tasks, read_cache)
+        return cls(
+            engine=engine,
+            goals=CachedGoalRepository(engine, read_cache, cascade_keys=milestones.keys_for_goal),
+            milestones=milestones,
+            projects=projects,
+            tasks=cached_tasks,
+            scheduler=cached_scheduler,
+            next_tasks=NextTaskScheduler(cached_tasks, projects, cached_scheduler),
+            cache=read_cache,
+        )
+
+    async def invalidate_bulk_insert(
+        self, milestone_goal_ids: Iterable[UUID], task_project_ids: Iterable[UUID] = ()
+    ) -> None:
+        """Drop cached lists and schedules that rows written outside the repositories joined.
+
+        Only list and schedule keys are affected: the new rows have ids that were
+        never cached.
+        """
+        if self.cache is not None:
+            await self.cache.invalidate(
+                ALL_GOALS_KEY,
+                status_key(False),
+                status_key(True),
+                ALL_MILESTONES_KEY,
+                *(goal_list_key(goal_id) for goal_id in milestone_goal_ids),
+                *(schedule_key(project_id) for project_id in task_project_ids),
+            )
+
+
+@lru_cache(maxsize=1)
+def get_container() -> Container:
+    """Return the process container, building it on first use.
+
+    The app lifespan builds it at startup; callers outside a running app (tests,
+    scripts) get the same lazily created instance.
+    """
+    return Container.build(get_engine())
+
+
+async def dispose_container() -> None:
+    """Drop the container and close its engine's pooled connections."""
+    get_container.cache_clear()
+    await dispose_engine()
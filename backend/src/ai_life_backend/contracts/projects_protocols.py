@@ -2,9 +2,11 @@
 Version: 0.1.0
 Define typing.Protocol interfaces here for cross-module use.
 """
+from collections.abc import AsyncIterator
 from typing import Protocol, runtime_checkable
 from uuid import UUID
 
+from ai_life_backend.projects.domain.closure import ClosureDirection, TaskClosureEntry
 from ai_life_backend.projects.domain.project import Project
 from ai_life_backend.projects.domain.task import Task
 
@@ -17,6 +19,10 @@ class ProjectReader(Protocol):
         """Retrieve project by ID."""
         ...
 
+    async def get_many(self, project_ids: list[UUID]) -> list[Project]:
+        """Retrieve all existing projects among the given IDs (missing IDs are skipped)."""
+        ...
+
     async def list_all(self) -> list[Project]:
         """List all projects."""
         ...
@@ -25,6 +31,10 @@ class ProjectReader(Protocol):
         """List projects for a specific goal."""
         ...
 
+    async def list_dependents(self, project_id: UUID) -> list[Project]:
+        """List projects that depend on the given project."""
+        ...
+
 
 @runtime_checkable
 class TaskReader(Protocol):
@@ -34,6 +44,10 @@ class TaskReader(Protocol):
         """Retrieve task by ID."""
         ...
 
+    async def get_many(self, task_ids: list[UUID]) -> list[Task]:
+        """Retrieve all existing tasks among the given IDs (missing IDs are skipped)."""
+        ...
+
     async def list_all(self) -> list[Task]:
         """List all tasks."""
         ...
@@ -41,3 +55,23 @@ class TaskReader(Protocol):
     async def list_by_project(self, project_id: UUID) -> list[Task]:
         """List tasks for a specific project."""
         ...
+
+    async def list_dependents(self, task_id: UUID) -> list[Task]:
+        """List tasks that depend on the given task."""
+        ...
+
+    async def list_unblocked(self, project_id: UUID | None = None) -> list[Task]:
+        """List open tasks whose dependencies are all done (optionally per project)."""
+        ...
+
+    async def list_closure(
+        self, task_id: UUID, direction: ClosureDirection, max_depth: int
+    ) -> list[TaskClosureEntry]:
+        """List the tasks within `max_depth` dependency edges, in topological order."""
+        ...
+
+    def stream_closure(
+        self, task_id: UUID, direction: ClosureDirection, max_depth: int
+    ) -> AsyncIterator[list[TaskClosureEntry]]:
+        """Yield the same closure in batches, without loading it whole."""
+        ...
@@ -0,0 +1,23 @@
+"""All-or-nothing batch writes reported per item."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+MAX_BATCH_ITEMS = 200
+
+
+class BatchRejectedError(ValueError):
+    """Raised when any item of a batch is invalid; nothing has been written."""
+
+    def __init__(self, errors: Mapping[int, str]) -> None:
+        """Keep one problem per offending item, keyed by its index in the batch."""
+        self.errors = dict(sorted(errors.items()))
+        super().__init__(f"Batch rejected ({len(self.errors)} invalid item(s))")
+
+
+class BatchConflictError(BatchRejectedError):
+    """Raised when rows targeted by a batch changed after it was validated."""
@@ -0,0 +1,164 @@
+"""Pluggable read-through cache used by repository decorators.
+
+`CacheBackend` is the extension point: `TTLCache` keeps entries in process, while a
+shared backend (e.g. Redis) only needs to implement the same async methods.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import time
+from typing import Protocol, TypeVar, cast, runtime_checkable
+
+from ai_life_backend.core.env import env_int
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Hit/miss counters of a cache backend."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def as_dict(self, size: int) -> dict[str, int | float]:
+        """Serialize counters with the current size and hit ratio."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": size,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Key/value store behind `ReadThroughCache`. `None` is never stored."""
+
+    async def get(self, key: str) -> object | None:
+        """Return the cached value or None on a miss."""
+        ...
+
+    async def set(self, key: str, value: object) -> None:
+        """Store a value under `key`."""
+        ...
+
+    async def delete(self, *keys: str) -> None:
+        """Remove keys (missing keys are ignored)."""
+        ...
+
+    def stats(self) -> dict[str, int | float]:
+        """Return hit/miss counters for diagnostics."""
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class CacheSettings:
+    """In-process cache sizing, read from `CACHE_*` environment variables.
+
+    Attributes:
+        ttl_seconds: Entry lifetime; 0 disables caching (CACHE_TTL_SECONDS)
+        max_entries: LRU capacity; 0 disables caching (CACHE_MAX_ENTRIES)
+    """
+
+    ttl_seconds: int = 30
+    max_entries: int = 1024
+
+    @property
+    def enabled(self) -> bool:
+        """Whether repositories should be wrapped with a cache."""
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    @classmethod
+    def from_env(cls) -> CacheSettings:
+        """Build settings from the environment, falling back to the defaults."""
+        defaults = cls()
+        return cls(
+            ttl_seconds=env_int("CACHE_TTL_SECONDS", defaults.ttl_seconds),
+            max_entries=env_int("CACHE_MAX_ENTRIES", defaults.max_entries),
+        )
+
+
+class TTLCache:
+    """In-process cache with per-entry TTL and least-recently-used eviction."""
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty cache; `clock` is injectable for tests."""
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        """Number of stored entries (expired ones included until touched)."""
+        return len(self._entries)
+
+    async def get(self, key: str) -> object | None:
+        """Return a live entry and mark it most recently used."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            if entry is not None:
+                del self._entries[key]
+            self._stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return entry[1]
+
+    async def set(self, key: str, value: object) -> None:
+        """Store an entry, evicting least recently used ones above capacity."""
+        self._entries[key] = (self._clock() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    async def delete(self, *keys: str) -> None:
+        """Remove keys (missing keys are ignored)."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, int | float]:
+        """Return hit/miss/eviction counters with the current size."""
+        return self._stats.as_dict(len(self._entries))
+
+
+class ReadThroughCache:
+    """Read-through helper with write invalidation over a `CacheBackend`.
+
+    Every invalidation bumps an epoch; a load that started before the latest
+    invalidation does not write its (possibly stale) result back.
+    """
+
+    def __init__(self, backend: CacheBackend) -> None:
+        """Wrap a backend."""
+        self.backend = backend
+        self._epoch = 0
+
+    async def get_or_load(self, key: str, load: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for `key`, loading and storing it on a miss."""
+        cached = await self.backend.get(key)
+        if cached is not None:
+            return cast(T, cached)
+        epoch = self._epoch
+        value = await load()
+        if value is not None and epoch == self._epoch:
+            await self.backend.set(key, value)
+        return value
+
+    async def invalidate(self, *keys: str) -> None:
+        """Drop keys after a write."""
+        self._epoch += 1
+        await self.backend.delete(*keys)
@@ -0,0 +1,227 @@
+"""Response compression (brotli or gzip) with a size threshold and streaming support.
+
+Complete bodies smaller than the threshold are sent as is, so small responses cost
+no compression CPU. Streamed bodies (e.g. the NDJSON export) are compressed chunk
+by chunk and flushed after every chunk, so the client can decode each record batch
+as soon as it arrives. Brotli is used only when the optional `brotli` package is
+installed; gzip needs nothing beyond the standard library.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import importlib
+from typing import TYPE_CHECKING, Any, Protocol
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from ai_life_backend.core.env import env_bool, env_int
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+MAX_GZIP_LEVEL = 9
+MAX_BROTLI_QUALITY = 11
+
+
+def _load_brotli() -> ModuleType | None:
+    """Return the optional `brotli` module, or None when it is not installed."""
+    try:
+        return importlib.import_module("brotli")
+    except ImportError:
+        return None
+
+
+_brotli = _load_brotli()
+
+
+@dataclass(frozen=True, slots=True)
+class CompressionSettings:
+    """Response compression, read from `COMPRESSION_*` environment variables.
+
+    Attributes:
+        enabled: Compress responses at all (COMPRESSION_ENABLED)
+        minimum_size: Complete bodies below this many bytes are sent uncompressed
+            (COMPRESSION_MIN_SIZE); streamed bodies are always compressed
+        gzip_level: zlib level 1-9 (COMPRESSION_GZIP_LEVEL)
+        brotli_quality: Brotli quality 0-11 (COMPRESSION_BROTLI_QUALITY)
+    """
+
+    enabled: bool = True
+    minimum_size: int = 1024
+    gzip_level: int = 6
+    brotli_quality: int = 4
+
+    def __post_init__(self) -> None:
+        """Reject levels zlib or brotli would refuse at request time."""
+        if not 1 <= self.gzip_level <= MAX_GZIP_LEVEL:
+            msg = f"gzip level must be between 1 and {MAX_GZIP_LEVEL}, got {self.gzip_level}"
+            raise ValueError(msg)
+        if not 0 <= self.brotli_quality <= MAX_BROTLI_QUALITY:
+            msg = (
+                f"brotli quality must be between 0 and {MAX_BROTLI_QUALITY}, "
+                f"got {self.brotli_quality}"
+            )
+            raise ValueError(msg)
+
+    @classmethod
+    def from_env(cls) -> CompressionSettings:
+        """Build settings from the environment, falling back to the defaults."""
+        defaults = cls()
+        return cls(
+            enabled=env_bool("COMPRESSION_ENABLED", default=defaults.enabled),
+            minimum_size=env_int("COMPRESSION_MIN_SIZE", defaults.minimum_size),
+            gzip_level=env_int("COMPRESSION_GZIP_LEVEL", defaults.gzip_level),
+            brotli_quality=env_int("COMPRESSION_BROTLI_QUALITY", defaults.brotli_quality),
+        )
+
+
+class _Encoder(Protocol):
+    def stream(self, chunk: bytes) -> bytes:
+        """Compress a chunk and flush, so everything so far can be decoded."""
+        ...
+
+    def finish(self, chunk: bytes) -> bytes:
+        """Compress the last chunk and end the stream."""
+        ...
+
+
+class _GzipEncoder:
+    def __init__(self, level: int) -> None:
+        self._zlib = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def stream(self, chunk: bytes) -> bytes:
+        return self._zlib.compress(chunk) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, chunk: bytes) -> bytes:
+        return self._zlib.compress(chunk) + self._zlib.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self, brotli: ModuleType, quality: int) -> None:
+        self._brotli: Any = brotli.Compressor(quality=quality)
+
+    def stream(self, chunk: bytes) -> bytes:
+        return bytes(self._brotli.process(chunk) + self._brotli.flush())
+
+    def finish(self, chunk: bytes) -> bytes:
+        return bytes(self._brotli.process(chunk) + self._brotli.finish())
+
+
+def negotiate_encoding(accept_encoding: str, *, brotli: bool = _brotli is not None) -> str | None:
+    """Pick `br` or `gzip` from an `Accept-Encoding` header, or None for identity.
+
+    The server prefers brotli (when available) over gzip; codings with `q=0` are
+    refused, and `*` accepts whichever of them is not refused by name.
+    """
+    accepted: set[str] = set()
+    refused: set[str] = set()
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            is_refused = bool(params.strip()) and float(quality) <= 0
+        except ValueError:
+            is_refused = True
+        (refused if is_refused else accepted).add(name.strip())
+    for coding in ("br", "gzip") if brotli else ("gzip",):
+        if coding in accepted or ("*" in accepted and coding not in refused):
+            return coding
+    return None
+
+
+class _CompressingSend:
+    """`send` wrapper for one response; holds the start message until the first body."""
+
+    def __init__(
+        self, send: Send, encoding: str, encoder: Callable[[], _Encoder], minimum: int
+    ) -> None:
+        self._send = send
+        self._encoding = encoding
+        self._new_encoder = encoder
+        self._minimum = minimum
+        self._start: Message | None = None
+        self._encoder: _Encoder | None = None
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+        elif self._start is not None:
+            start, self._start = self._start, None
+            await self._first(start, message)
+        elif self._encoder is not None and message["type"] == "http.response.body":
+            await self._send(self._encode(self._encoder, message))
+        else:
+            await self._send(message)
+
+    def _compressible(self, start: Message, message: Message) -> bool:
+        if message["type"] != "http.response.body":
+            return False
+        if "content-encoding" in Headers(raw=start["headers"]):
+            return False
+        return bool(message.get("more_body")) or len(message.get("body", b"")) >= self._minimum
+
+    async def _first(self, start: Message, message: Message) -> None:
+        if not self._compressible(start, message):
+            await self._send(start)
+            await self._send(message)
+            return
+        self._encoder = self._new_encoder()
+        message = self._encode(self._encoder, message)
+        headers = MutableHeaders(raw=start["headers"])
+        headers["Content-Encoding"] = self._encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            # The compressed bytes differ from the identity representation
+            headers["ETag"] = f"W/{etag}"
+        if message["more_body"]:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(message["body"]))
+        await self._send(start)
+        await self._send(message)
+
+    @staticmethod
+    def _encode(encoder: _Encoder, message: Message) -> Message:
+        body, more = message.get("body", b""), message.get("more_body", False)
+        encoded = encoder.stream(body) if more else encoder.finish(body)
+        return {"type": "http.response.body", "body": encoded, "more_body": more}
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing response bodies with brotli or gzip.
+
+    The coding is negotiated from `Accept-Encoding`. Responses that already carry a
+    `Content-Encoding`, and complete bodies below `settings.minimum_size`, pass
+    through untouched. Compressed responses get `Vary: Accept-Encoding` and a weak
+    ETag (so `If-None-Match` still matches via `etag_matches`).
+    """
+
+    def __init__(self, app: ASGIApp, settings: CompressionSettings | None = None) -> None:
+        """Wrap `app`; settings default to `CompressionSettings()`."""
+        self.app = app
+        self.settings = settings or CompressionSettings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Compress the response if the client accepts a supported coding."""
+        encoding = None
+        if scope["type"] == "http" and self.settings.enabled:
+            encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        wrapped = _CompressingSend(
+            send, encoding, self._encoder_factory(encoding), self.settings.minimum_size
+        )
+        await self.app(scope, receive, wrapped)
+
+    def _encoder_factory(self, encoding: str) -> Callable[[], _Encoder]:
+        brotli = _brotli
+        if encoding == "br" and brotli is not None:
+            return lambda: _BrotliEncoder(brotli, self.settings.brotli_quality)
+        return lambda: _GzipEncoder(self.settings.gzip_level)
@@ -0,0 +1,35 @@
+"""Typed readers for environment-driven settings."""
+
+from __future__ import annotations
+
+import os
+
+_TRUE = frozenset({"1", "true", "yes", "on"})
+_FALSE = frozenset({"0", "false", "no", "off"})
+
+
+def env_int(name: str, default: int) -> int:
+    """Read a non-negative integer environment variable."""
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = -1
+    if value < 0:
+        msg = f"{name} must be a non-negative integer, got {raw!r}"
+        raise ValueError(msg)
+    return value
+
+
+def env_bool(name: str, *, default: bool) -> bool:
+    """Read a boolean environment variable (1/0, true/false, yes/no, on/off)."""
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    value = raw.strip().lower()
+    if value not in _TRUE | _FALSE:
+        msg = f"{name} must be a boolean, got {raw!r}"
+        raise ValueError(msg)
+    return value in _TRUE
@@ -0,0 +1,55 @@
+"""Strong ETags from `date_updated` and `If-None-Match` short-circuiting."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from hashlib import blake2b
+from typing import TYPE_CHECKING
+
+from fastapi import Response
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+
+def _quoted(*parts: object) -> str:
+    """Hash parts into a quoted strong entity tag."""
+    digest = blake2b("\x1f".join(map(str, parts)).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _stamp(moment: datetime | None) -> str:
+    """Normalize a timestamp so DB aggregates and loaded entities hash identically."""
+    return moment.astimezone(UTC).isoformat() if moment is not None else "-"
+
+
+def entity_etag(entity_id: UUID, date_updated: datetime) -> str:
+    """ETag of a single entity; every write refreshes `date_updated`."""
+    return _quoted(entity_id, _stamp(date_updated))
+
+
+def list_etag(scope: str, count: int, last_updated: datetime | None) -> str:
+    """ETag of a list from its size and newest `date_updated`.
+
+    Creates and updates raise the maximum and deletes lower the count, so both can
+    come from one `count(*), max(date_updated)` aggregate without loading rows.
+
+    Args:
+        scope: Resource and filter the list was read with (e.g. "goals:done")
+        count: Number of items in the list
+        last_updated: Newest `date_updated` in the list (None when empty)
+    """
+    return _quoted(scope, count, _stamp(last_updated))
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an `If-None-Match` header matches `etag` (weak comparison, RFC 9110)."""
+    if if_none_match is None:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the current ETag."""
+    return Response(status_code=304, headers={"ETag": etag})
@@ -2,9 +2,40 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, TypeVar
+
+from fastapi import APIRouter, Response
+from fastapi.responses import JSONResponse
+import orjson
+from pydantic import TypeAdapter
+
+from ai_life_backend.contracts.core_protocols import RFC7807_MIME
+
+T = TypeVar("T")
+
+# UTC datetimes end in "Z", as in Pydantic's own JSON output
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson; the application's default response class.
+
+    orjson encodes UUIDs, datetimes, enums and dataclasses natively and is several
+    times faster than the standard library encoder on large lists.
+    """
+
+    @staticmethod
+    def render(content: object) -> bytes:
+        """Encode `content` as compact UTF-8 JSON."""
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+class ProblemJSONResponse(FastJSONResponse):
+    """RFC 7807 Problem Details body (see `core.problem`) rendered with orjson."""
+
+    media_type = RFC7807_MIME
 
-from fastapi import APIRouter
 
 # Unified set of responses with RFC7807 (only application/problem+json)
 PROBLEM_RESPONSES: dict[int | str, dict[str, Any]] = {
@@ -39,8 +70,29 @@ def make_public_router(internal_router: APIRouter) -> APIRouter:
     """Wrap internal router to apply unified Problem error declarations.
 
     Applies unified RFC 7807 Problem Details error declarations to all operations.
-    Uses explicit $ref references instead of model definitions.
+    Uses explicit $ref references instead of model definitions. Routes render with
+    `FastJSONResponse` unless they choose another response class.
     """
-    outer = APIRouter(responses=PROBLEM_RESPONSES)
+    outer = APIRouter(responses=PROBLEM_RESPONSES, default_response_class=FastJSONResponse)
     outer.include_router(internal_router)
     return outer
+
+
+def trusted_json_response(
+    adapter: TypeAdapter[T],
+    content: T,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Serialize trusted domain objects straight to JSON.
+
+    Skips per-item `model_validate` and FastAPI's response-model re-validation, so it
+    is meant for data just read from the database. Keep `response_model=` on the route
+    so the OpenAPI schema is unchanged.
+    """
+    return Response(
+        content=adapter.dump_json(content),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
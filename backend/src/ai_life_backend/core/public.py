@@ -5,10 +5,41 @@ This is the module's facade; internal structure may change without breaking cons
 """
 
 from fastapi import APIRouter
-from .httpkit import PROBLEM_RESPONSES, make_public_router
+
+from .batch import MAX_BATCH_ITEMS, BatchConflictError, BatchRejectedError
+from .cache import CacheBackend, CacheSettings, ReadThroughCache, TTLCache
+from .compression import CompressionMiddleware, CompressionSettings
+from .etag import entity_etag, etag_matches, list_etag, not_modified
+from .httpkit import (
+    PROBLEM_RESPONSES,
+    FastJSONResponse,
+    ProblemJSONResponse,
+    make_public_router,
+    trusted_json_response,
+)
+from .rollup import StatusRollup
+from .rows import RowMapper
 
 __all__ = [
     "APIRouter",            # re-exported typing aid for router signatures (optional)
+    "BatchConflictError",   # batch targets changed after validation (409)
+    "BatchRejectedError",   # batch rejected with per-item problems (422)
+    "CacheBackend",         # pluggable cache store protocol
+    "CacheSettings",        # CACHE_* environment settings
+    "CompressionMiddleware",  # brotli/gzip response compression with a size threshold
+    "CompressionSettings",  # COMPRESSION_* environment settings
+    "entity_etag",          # strong ETag of one entity from id + date_updated
+    "etag_matches",         # If-None-Match comparison
+    "FastJSONResponse",     # orjson-rendered default response class
+    "list_etag",            # strong ETag of a list from count + max(date_updated)
     "make_public_router",   # wrapper applying unified RFC7807 responses
+    "MAX_BATCH_ITEMS",      # upper bound on items per batch request
+    "not_modified",         # empty 304 response with the ETag header
     "PROBLEM_RESPONSES",    # shared responses mapping
+    "ProblemJSONResponse",  # orjson-rendered application/problem+json response
+    "ReadThroughCache",     # read-through helper with write invalidation
+    "RowMapper",            # precompiled row -> domain dataclass mapper
+    "StatusRollup",         # per-parent total/done/blocked counters kept in a table
+    "TTLCache",             # in-process TTL + LRU cache backend
+    "trusted_json_response",  # JSON from trusted domain objects, no re-validation
 ]
@@ -0,0 +1,120 @@
+"""Per-parent status rollups (total / done / blocked children) kept in a table.
+
+Writers keep a rollup row current in the same transaction as the child write:
+single-row writes apply a delta (`shift`), set-based writes (batches, imports)
+recount the touched parents (`recount`). Reads are then one primary-key lookup
+regardless of the number of children. `drift` compares the stored counters with
+a full recount, for `scripts/rebuild_rollups.py --check`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy import any_, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+
+from ai_life_backend.database import uuid_array
+
+if TYPE_CHECKING:
+    from sqlalchemy import Insert, Select, Table, TableClause
+
+DONE = "done"
+BLOCKED = "blocked"
+
+
+def _weights(status: str | None) -> tuple[int, int, int]:
+    """Contribution of one child with `status` (None: no child) to the counters."""
+    if status is None:
+        return 0, 0, 0
+    return 1, int(status == DONE), int(status == BLOCKED)
+
+
+@dataclass(frozen=True, slots=True)
+class StatusRollup:
+    """Counters of a parent's children by status, stored one row per parent.
+
+    Attributes:
+        table: Rollup table: the parent key, then the total, done and blocked counters
+        children: Child table with `id`, `status` and the parent key column
+        parents: Parent table (only `id` is read)
+    """
+
+    table: Table
+    children: Table
+    parents: TableClause
+
+    @property
+    def key(self) -> str:
+        """Name of the parent key column, in both the rollup and the child table."""
+        return str(self.table.c[0].name)
+
+    @property
+    def counters(self) -> tuple[str, str, str]:
+        """Names of the total, done and blocked counter columns."""
+        total, done, blocked = (column.name for column in list(self.table.c)[1:4])
+        return total, done, blocked
+
+    def shift(self, parent_id: UUID, before: str | None, after: str | None) -> Insert | None:
+        """Upsert the delta of one child going from status `before` to `after`.
+
+        `before=None` is a new child, `after=None` a deleted one. Returns None when
+        the counters do not change (e.g. a non-status update).
+        """
+        delta = [a - b for a, b in zip(_weights(after), _weights(before), strict=True)]
+        if not any(delta):
+            return None
+        values = dict(zip(self.counters, delta, strict=True))
+        stmt = insert(self.table).values({self.key: parent_id, **values})
+        return stmt.on_conflict_do_update(
+            index_elements=[self.key],
+            set_={name: self.table.c[name] + stmt.excluded[name] for name in self.counters},
+        )
+
+    def actual(self, parent_ids: Collection[UUID] | None = None) -> Select[Any]:
+        """Count the children of every parent (or of the given ones) from scratch."""
+        child, parent = self.children, self.parents
+        total, done, blocked = self.counters
+        stmt = (
+            select(
+                parent.c.id.label(self.key),
+                func.count(child.c.id).label(total),
+                func.count(child.c.id).filter(child.c.status == DONE).label(done),
+                func.count(child.c.id).filter(child.c.status == BLOCKED).label(blocked),
+            )
+            .select_from(parent.outerjoin(child, child.c[self.key] == parent.c.id))
+            .group_by(parent.c.id)
+        )
+        if parent_ids is not None:
+            stmt = stmt.where(parent.c.id == any_(uuid_array(parent_ids)))
+        return stmt
+
+    def recount(self, parent_ids: Collection[UUID] | None = None) -> Insert:
+        """Overwrite the counters of the given parents (default: all) with a recount."""
+        columns = [self.key, *self.counters]
+        stmt = insert(self.table).from_select(columns, self.actual(parent_ids))
+        return stmt.on_conflict_do_update(
+            index_elements=[self.key],
+            set_={name: stmt.excluded[name] for name in self.counters},
+        )
+
+    def drift(self) -> Select[Any]:
+        """Parents whose stored counters differ from a recount (missing rows count as 0).
+
+        Rows: the parent key, `stored_<counter>` and `<counter>` (actual) columns.
+        """
+        actual = self.actual().subquery("actual")
+        stored = {name: func.coalesce(self.table.c[name], 0) for name in self.counters}
+        return (
+            select(
+                actual.c[self.key],
+                *[value.label(f"stored_{name}") for name, value in stored.items()],
+                *[actual.c[name] for name in self.counters],
+            )
+            .select_from(actual.outerjoin(self.table, self.table.c[self.key] == actual.c[self.key]))
+            .where(or_(*[value != actual.c[name] for name, value in stored.items()]))
+            .order_by(actual.c[self.key])
+        )
@@ -0,0 +1,73 @@
+"""Precompiled row → domain mapping shared by the Postgres repositories."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import fields
+from itertools import starmap
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from sqlalchemy import Table
+from sqlalchemy.engine import Row
+
+if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
+
+T = TypeVar("T", bound="DataclassInstance")
+
+Converter = Callable[[Any], Any]
+
+
+class RowMapper(Generic[T]):
+    """Build domain dataclasses from rows of a table by position.
+
+    Column positions are resolved once against the table's column order, so mapping
+    a row is one `itemgetter` call plus a positional constructor call instead of a
+    keyword argument per `row.<attr>` lookup. Converters (e.g. enum constructors)
+    are applied only to the fields that need them.
+
+    Rows must come from `select(table)` (all columns, table order).
+    """
+
+    __slots__ = ("_convert", "_entity", "_getter")
+
+    def __init__(
+        self,
+        entity: type[T],
+        table: Table,
+        converters: Mapping[str, Converter] | None = None,
+    ) -> None:
+        """Resolve the column position of every dataclass field of `entity`."""
+        columns = list(table.c.keys())
+        names = [f.name for f in fields(entity)]
+        missing = [name for name in names if name not in columns]
+        if missing:
+            msg = f"Table {table.name} has no column for fields {missing}"
+            raise ValueError(msg)
+        positions = [columns.index(name) for name in names]
+        self._entity: Callable[..., T] = entity
+        self._getter: Callable[[Row[Any]], tuple[Any, ...]] = itemgetter(*positions)
+        converters = converters or {}
+        self._convert: list[tuple[int, Converter]] = [
+            (i, converters[name]) for i, name in enumerate(names) if name in converters
+        ]
+
+    def __call__(self, row: Row[Any]) -> T:
+        """Map a single row."""
+        if self._convert:
+            return self._entity(*self._apply(self._getter(row)))
+        return self._entity(*self._getter(row))
+
+    def many(self, rows: Iterable[Row[Any]]) -> list[T]:
+        """Map a sequence of rows."""
+        if self._convert:
+            return [self(row) for row in rows]
+        return list(starmap(self._entity, map(self._getter, rows)))
+
+    def _apply(self, values: tuple[Any, ...]) -> list[Any]:
+        """Run the configured converters over positional values."""
+        converted = list(values)
+        for i, convert in self._convert:
+            converted[i] = convert(converted[i])
+        return converted
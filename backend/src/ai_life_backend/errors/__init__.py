@@ -1,14 +1,20 @@
 """Error handling and RFC 7807 Problem Details implementation."""
 
-from fastapi import HTTPException, Request
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from starlette.exceptions import HTTPException
 
-from .models import Problem
+from ai_life_backend.core import problem
+from ai_life_backend.core.public import ProblemJSONResponse
 
 
-def http_exception_handler(_request: Request, exc: HTTPException) -> JSONResponse:
-    """Handle FastAPI HTTPException and return a Problem Details JSON response.
+def http_exception_handler(_request: Request, exc: HTTPException) -> ProblemJSONResponse:
+    """Handle HTTPException and return a Problem Details JSON response.
+
+    A `detail` built by `core.http_error` is already a Problem and is sent as is.
+    A plain string detail is the Problem's `title`, as before; it is repeated under
+    `detail`, which clients of FastAPI's default `{"detail": ...}` body read.
 
     Parameters
     ----------
@@ -19,18 +25,24 @@ def http_exception_handler(_request: Request, exc: HTTPException) -> JSONRespons
 
     Returns:
     -------
-    JSONResponse
+    ProblemJSONResponse
         A JSON response formatted according to RFC 7807 Problem Details.
     """
-    body = Problem(title=exc.detail or "HTTP Error", status=exc.status_code).model_dump()
-    return JSONResponse(
-        status_code=exc.status_code, content=body, media_type="application/problem+json"
-    )
+    if isinstance(exc.detail, dict):
+        body = exc.detail
+    else:
+        message = exc.detail or "HTTP Error"
+        body = problem(title=message, status=exc.status_code, detail=message)
+    return ProblemJSONResponse(body, status_code=exc.status_code, headers=exc.headers)
 
 
-def validation_exception_handler(_request: Request, exc: RequestValidationError) -> JSONResponse:
+def validation_exception_handler(
+    _request: Request, exc: RequestValidationError
+) -> ProblemJSONResponse:
     """Handle FastAPI RequestValidationError and return a Problem Details JSON response.
 
+    The individual validation errors are kept in an `errors` extension member.
+
     Parameters
     ----------
     _request : Request
@@ -40,8 +52,9 @@ def validation_exception_handler(_request: Request, exc: RequestValidationError)
 
     Returns:
     -------
-    JSONResponse
+    ProblemJSONResponse
         A JSON response formatted according to RFC 7807 Problem Details.
     """
-    body = Problem(title="Validation Error", status=422, detail=str(exc.errors())).model_dump()
-    return JSONResponse(status_code=422, content=body, media_type="application/problem+json")
+    errors = jsonable_encoder(exc.errors())
+    body = problem(title="Validation Error", status=422, detail=f"{len(errors)} invalid field(s)")
+    return ProblemJSONResponse({**body, "errors": errors}, status_code=422)
@@ -3,26 +3,44 @@
 from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-
-from ai_life_backend.database import get_engine
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+
+from ai_life_backend.container import get_container
+from ai_life_backend.core.public import (
+    entity_etag,
+    etag_matches,
+    list_etag,
+    not_modified,
+    trusted_json_response,
+)
 from ai_life_backend.goals.api.schemas import (
     GoalCreateRequest,
+    GoalListPayload,
     GoalListResponse,
     GoalResponse,
     GoalUpdateRequest,
+    goal_list_adapter,
 )
+from ai_life_backend.goals.domain import GoalCursor
 from ai_life_backend.goals.repository.postgres_goal_repository import PostgresGoalRepository
 
 router = APIRouter(prefix="/goals", tags=["goals"])
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
 
 def get_repository() -> PostgresGoalRepository:
-    return PostgresGoalRepository(get_engine())
+    return get_container().goals
 
 
 RepoDep = Annotated[PostgresGoalRepository, Depends(get_repository)]
 StatusFilter = Annotated[Literal["active", "done"] | None, Query()]
+PageLimit = Annotated[int | None, Query(ge=1, le=MAX_PAGE_SIZE)]
+PageCursor = Annotated[str | None, Query()]
+IfNoneMatch = Annotated[str | None, Header()]
+
+_IS_DONE_BY_STATUS: dict[str | None, bool | None] = {None: None, "active": False, "done": True}
 
 
 @router.post("", response_model=GoalResponse, status_code=201)
@@ -34,22 +52,71 @@ async def create_goal(request: GoalCreateRequest, repo: RepoDep) -> GoalResponse
         raise HTTPException(status_code=422, detail=str(e)) from e
 
 
+async def _full_list(
+    repo: PostgresGoalRepository, status: str | None, if_none_match: str | None
+) -> Response:
+    """Return the unpaginated goal list with an ETag, or 304 if the client's is current.
+
+    The 304 check runs a `count`/`max(date_updated)` aggregate instead of loading rows;
+    the ETag sent with a body is computed from the goals actually returned.
+    """
+    is_done = _IS_DONE_BY_STATUS[status]
+    scope = f"goals:{status}"
+    if if_none_match is not None:
+        etag = list_etag(scope, *await repo.list_version(is_done))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    goals = await repo.list_all() if is_done is None else await repo.list_by_status(is_done)
+    last_updated = max((goal.date_updated for goal in goals), default=None)
+    return trusted_json_response(
+        goal_list_adapter,
+        GoalListPayload(goals),
+        headers={"ETag": list_etag(scope, len(goals), last_updated)},
+    )
+
+
 @router.get("", response_model=GoalListResponse)
-async def list_goals(repo: RepoDep, status: StatusFilter = None) -> GoalListResponse:
-    if status == "active":
-        goals = await repo.list_by_status(False)
-    elif status == "done":
-        goals = await repo.list_by_status(True)
-    else:
-        goals = await repo.list_all()
-    return GoalListResponse(goals=[GoalResponse.model_validate(g) for g in goals])
+async def list_goals(
+    repo: RepoDep,
+    status: StatusFilter = None,
+    limit: PageLimit = None,
+    cursor: PageCursor = None,
+    if_none_match: IfNoneMatch = None,
+) -> Response:
+    """List goals, optionally one keyset page at a time.
+
+    Without `limit` and `cursor` the full list is returned with an ETag and honours
+    `If-None-Match` (304). With either of them the response holds at most `limit`
+    goals (default 50) and `next_cursor` points to the following page. Goals read
+    from the database are serialized without re-validation.
+    """
+    if limit is None and cursor is None:
+        return await _full_list(repo, status, if_none_match)
+
+    try:
+        after = GoalCursor.decode(cursor) if cursor is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    goals, next_cursor = await repo.list_page(
+        limit or DEFAULT_PAGE_SIZE, after, _IS_DONE_BY_STATUS[status]
+    )
+    payload = GoalListPayload(goals, next_cursor.encode() if next_cursor is not None else None)
+    return trusted_json_response(goal_list_adapter, payload)
 
 
 @router.get("/{goal_id}", response_model=GoalResponse)
-async def get_goal(goal_id: UUID, repo: RepoDep) -> GoalResponse:
+async def get_goal(
+    goal_id: UUID, repo: RepoDep, response: Response, if_none_match: IfNoneMatch = None
+) -> GoalResponse | Response:
+    """Get a goal by ID; answers 304 without a body when `If-None-Match` is current."""
     goal = await repo.get_by_id(goal_id)
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
+    etag = entity_etag(goal.id, goal.date_updated)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return GoalResponse.model_validate(goal)
 
 
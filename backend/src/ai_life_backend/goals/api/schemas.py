@@ -1,9 +1,12 @@
 """Pydantic schemas for Goals API."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+from ai_life_backend.goals.domain import Goal
 
 
 class GoalCreateRequest(BaseModel):
@@ -50,9 +53,24 @@ class GoalResponse(BaseModel):
 
 
 class GoalListResponse(BaseModel):
-    """Response schema for list of goals."""
+    """Response schema for list of goals.
+
+    `next_cursor` is set only for paginated requests that have more results.
+    """
 
     goals: list[GoalResponse]
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class GoalListPayload:
+    """Wire shape of GoalListResponse, serialized straight from domain goals."""
+
+    goals: list[Goal]
+    next_cursor: str | None = None
+
+
+goal_list_adapter = TypeAdapter(GoalListPayload)
 
 
 class ErrorResponse(BaseModel):
@@ -1,5 +1,6 @@
 """Domain entities for goals module."""
 
+from .cursor import GoalCursor
 from .goal import Goal
 
-__all__ = ["Goal"]
+__all__ = ["Goal", "GoalCursor"]
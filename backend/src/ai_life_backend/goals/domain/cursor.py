@@ -0,0 +1,62 @@
+"""Opaque keyset cursor for paginated goal listings."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+import json
+from uuid import UUID
+
+from .goal import Goal
+
+
+@dataclass(frozen=True)
+class GoalCursor:
+    """Position of the last goal on a page in `(is_done, date_updated DESC, id DESC)` order.
+
+    Attributes:
+        is_done: Completion status of the last goal on the page
+        date_updated: Last modification timestamp of that goal
+        id: Unique identifier of that goal (tie-breaker)
+    """
+
+    is_done: bool
+    date_updated: datetime
+    id: UUID
+
+    @staticmethod
+    def after(goal: Goal) -> GoalCursor:
+        """Build the cursor that resumes right after the given goal."""
+        return GoalCursor(is_done=goal.is_done, date_updated=goal.date_updated, id=goal.id)
+
+    def encode(self) -> str:
+        """Serialize the cursor into an opaque URL-safe token."""
+        payload = json.dumps(
+            [self.is_done, self.date_updated.isoformat(), str(self.id)], separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode(token: str) -> GoalCursor:
+        """Parse a token produced by `encode`.
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            is_done, date_updated, goal_id = json.loads(base64.urlsafe_b64decode(padded))
+            cursor = GoalCursor(
+                is_done=is_done,
+                date_updated=datetime.fromisoformat(date_updated),
+                id=UUID(goal_id),
+            )
+        except (binascii.Error, TypeError, ValueError) as e:
+            msg = "Invalid cursor"
+            raise ValueError(msg) from e
+        if not isinstance(cursor.is_done, bool) or cursor.date_updated.tzinfo is None:
+            msg = "Invalid cursor"
+            raise ValueError(msg)
+        return cursor
@@ -7,7 +7,7 @@ from uuid import UUID
 MAX_TITLE_LENGTH = 255
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Goal:
     """Immutable domain entity representing a personal goal.
 
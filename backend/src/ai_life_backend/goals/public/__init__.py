@@ -9,20 +9,19 @@ from uuid import UUID
 
 from fastapi import APIRouter
 
+from ai_life_backend.container import get_container
 from ai_life_backend.contracts.core_protocols import (
     RFC7807_MIME,
     ProblemDict,
 )
 from ai_life_backend.core.public import make_public_router
-from ai_life_backend.database import get_engine
 from ai_life_backend.goals.api.routes import router as _internal_router
 from ai_life_backend.goals.domain import Goal
-from ai_life_backend.goals.repository.postgres_goal_repository import PostgresGoalRepository
 
 # ---------- In-process DTO & read-only port ----------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoalDTO:
     """Read-only DTO for same-process consumers. No ORM exposure."""
 
@@ -49,7 +48,7 @@ async def list_goals(status: Literal["all", "active", "done"] = "all") -> list[G
 
     Ordering: active first, then by date_updated DESC.
     """
-    repo = PostgresGoalRepository(get_engine())
+    repo = get_container().goals
     if status == "active":
         goals = await repo.list_by_status(False)
     elif status == "done":
@@ -62,7 +61,7 @@ async def list_goals(status: Literal["all", "active", "done"] = "all") -> list[G
 
 async def get_goal(id: UUID) -> GoalDTO | None:
     """Retrieve a single goal by ID (read-only)."""
-    repo = PostgresGoalRepository(get_engine())
+    repo = get_container().goals
     goal = await repo.get_by_id(id)
     return None if goal is None else GoalDTO.from_domain(goal)
 
@@ -1,5 +1,6 @@
 """Repository implementations for goals module."""
 
+from .cached_goal_repository import CachedGoalRepository
 from .postgres_goal_repository import PostgresGoalRepository
 
-__all__ = ["PostgresGoalRepository"]
+__all__ = ["CachedGoalRepository", "PostgresGoalRepository"]
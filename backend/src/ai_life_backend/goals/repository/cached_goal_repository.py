@@ -0,0 +1,107 @@
+"""Read-through cached GoalRepository."""
+
+from collections.abc import Awaitable, Callable
+from functools import partial
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ai_life_backend.core.public import ReadThroughCache
+from ai_life_backend.goals.domain import Goal
+
+from .postgres_goal_repository import PostgresGoalRepository
+
+ALL_KEY = "goals:all"
+
+
+def goal_key(goal_id: UUID) -> str:
+    """Cache key of a single goal."""
+    return f"goal:{goal_id}"
+
+
+def status_key(is_done: bool) -> str:
+    """Cache key of the goal list filtered by completion status."""
+    return f"goals:status:{is_done}"
+
+
+class CachedGoalRepository(PostgresGoalRepository):
+    """PostgresGoalRepository whose point and list reads go through a cache.
+
+    Writes invalidate only the keys they can affect: the goal itself, the full
+    list and the status list(s) the goal was or is now in. Keyset pages
+    (`list_page`) are not cached.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        cache: ReadThroughCache,
+        cascade_keys: Callable[[UUID], Awaitable[list[str]]] | None = None,
+    ) -> None:
+        """Initialize repository.
+
+        Args:
+            engine: Database engine
+            cache: Shared read-through cache
+            cascade_keys: Returns keys of other modules' entries removed by the
+                `ON DELETE CASCADE` of a goal; called before the delete
+        """
+        super().__init__(engine)
+        self._cache = cache
+        self._cascade_keys = cascade_keys
+
+    async def get_by_id(self, goal_id: UUID) -> Goal | None:
+        """Retrieve goal by ID (cached)."""
+        return await self._cache.get_or_load(goal_key(goal_id), partial(super().get_by_id, goal_id))
+
+    async def list_all(self) -> list[Goal]:
+        """List all goals (cached), sorted by is_done ASC, date_updated DESC."""
+        goals = await self._cache.get_or_load(ALL_KEY, self._load_all)
+        return list(goals)
+
+    async def list_by_status(self, is_done: bool) -> list[Goal]:
+        """List goals filtered by completion status (cached)."""
+        goals = await self._cache.get_or_load(
+            status_key(is_done), partial(self._load_by_status, is_done)
+        )
+        return list(goals)
+
+    async def _load_all(self) -> tuple[Goal, ...]:
+        """Load the full list as an immutable tuple for sharing through the cache."""
+        return tuple(await super().list_all())
+
+    async def _load_by_status(self, is_done: bool) -> tuple[Goal, ...]:
+        """Load one status list as an immutable tuple."""
+        return tuple(await super().list_by_status(is_done))
+
+    async def create(self, title: str) -> Goal:
+        """Create new goal and invalidate the lists it joins."""
+        goal = await super().create(title)
+        await self._cache.invalidate(ALL_KEY, status_key(goal.is_done))
+        return goal
+
+    async def update(
+        self,
+        goal_id: UUID,
+        title: str | None = None,
+        is_done: bool | None = None,
+    ) -> Goal | None:
+        """Update goal and invalidate its key and the lists it was or is in."""
+        goal = await super().update(goal_id, title=title, is_done=is_done)
+        if goal is None:
+            return None
+        statuses = (False, True) if is_done is not None else (goal.is_done,)
+        await self._cache.invalidate(
+            goal_key(goal_id), ALL_KEY, *(status_key(done) for done in statuses)
+        )
+        return goal
+
+    async def delete(self, goal_id: UUID) -> bool:
+        """Delete goal and invalidate its key, every goal list and cascaded entries."""
+        cascaded = await self._cascade_keys(goal_id) if self._cascade_keys else []
+        deleted = await super().delete(goal_id)
+        if deleted:
+            await self._cache.invalidate(
+                goal_key(goal_id), ALL_KEY, status_key(False), status_key(True), *cascaded
+            )
+        return deleted
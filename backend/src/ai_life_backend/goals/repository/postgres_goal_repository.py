@@ -4,11 +4,24 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import Boolean, Column, DateTime, MetaData, String, Table, delete, select, update
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    MetaData,
+    String,
+    Table,
+    delete,
+    func,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
-from ai_life_backend.goals.domain import Goal
+from ai_life_backend.core.public import RowMapper
+from ai_life_backend.goals.domain import Goal, GoalCursor
 
 metadata = MetaData()
 
@@ -24,6 +37,8 @@ goals_table = Table(
     Column("date_updated", DateTime(timezone=True), nullable=False),
 )
 
+_to_goal = RowMapper(Goal, goals_table)
+
 
 class PostgresGoalRepository:
     """PostgreSQL implementation of GoalRepository Protocol."""
@@ -42,14 +57,7 @@ class PostgresGoalRepository:
             result = await conn.execute(
                 goals_table.insert().values(title=title).returning(goals_table)
             )
-            row = result.one()
-            return Goal(
-                id=row.id,
-                title=row.title,
-                is_done=row.is_done,
-                date_created=row.date_created,
-                date_updated=row.date_updated,
-            )
+            return _to_goal(result.one())
 
     async def get_by_id(self, goal_id: UUID) -> Goal | None:
         """Retrieve goal by ID."""
@@ -58,13 +66,7 @@ class PostgresGoalRepository:
             row = result.one_or_none()
             if not row:
                 return None
-            return Goal(
-                id=row.id,
-                title=row.title,
-                is_done=row.is_done,
-                date_created=row.date_created,
-                date_updated=row.date_updated,
-            )
+            return _to_goal(row)
 
     async def list_all(self) -> list[Goal]:
         """List all goals, sorted by is_done ASC, date_updated DESC."""
@@ -74,16 +76,7 @@ class PostgresGoalRepository:
                     goals_table.c.is_done, goals_table.c.date_updated.desc()
                 )
             )
-            return [
-                Goal(
-                    id=row.id,
-                    title=row.title,
-                    is_done=row.is_done,
-                    date_created=row.date_created,
-                    date_updated=row.date_updated,
-                )
-                for row in result.all()
-            ]
+            return _to_goal.many(result.all())
 
     async def list_by_status(self, is_done: bool) -> list[Goal]:
         """List goals filtered by completion status, sorted by date_updated DESC."""
@@ -93,16 +86,68 @@ class PostgresGoalRepository:
                 .where(goals_table.c.is_done == is_done)
                 .order_by(goals_table.c.date_updated.desc())
             )
-            return [
-                Goal(
-                    id=row.id,
-                    title=row.title,
-                    is_done=row.is_done,
-                    date_created=row.date_created,
-                    date_updated=row.date_updated,
-                )
-                for row in result.all()
-            ]
+            return _to_goal.many(result.all())
+
+    async def list_version(self, is_done: bool | None = None) -> tuple[int, datetime | None]:
+        """Return `(count, max(date_updated))` of the goal list without loading rows.
+
+        Args:
+            is_done: Optional completion status filter (as in `list_by_status`)
+        """
+        stmt = select(func.count(), func.max(goals_table.c.date_updated))
+        if is_done is not None:
+            stmt = stmt.where(goals_table.c.is_done == is_done)
+        async with self._engine.connect() as conn:
+            count, last_updated = (await conn.execute(stmt)).one()
+            return count, last_updated
+
+    async def list_page(
+        self, limit: int, after: GoalCursor | None = None, is_done: bool | None = None
+    ) -> tuple[list[Goal], GoalCursor | None]:
+        """List one keyset page of goals in `(is_done, date_updated DESC, id DESC)` order.
+
+        Each status partition is read with an index range seek on
+        `idx_goals_is_done_date_updated_id`, so later pages cost the same as the first.
+
+        Args:
+            limit: Maximum number of goals to return
+            after: Cursor of the last goal on the previous page (None for the first page)
+            is_done: Optional completion status filter
+
+        Returns:
+            Goals of the page and the cursor of the next page (None on the last page)
+        """
+        partitions = [False, True] if is_done is None else [is_done]
+        if after is not None:
+            partitions = [done for done in partitions if done >= after.is_done]
+
+        goals: list[Goal] = []
+        async with self._engine.connect() as conn:
+            for done in partitions:
+                seek = after if after is not None and after.is_done == done else None
+                goals.extend(await self._seek(conn, done, seek, limit + 1 - len(goals)))
+                if len(goals) > limit:
+                    break
+
+        page = goals[:limit]
+        next_cursor = GoalCursor.after(page[-1]) if len(goals) > limit else None
+        return page, next_cursor
+
+    @staticmethod
+    async def _seek(
+        conn: AsyncConnection, is_done: bool, after: GoalCursor | None, limit: int
+    ) -> list[Goal]:
+        """Read up to `limit` goals of one status partition, strictly after the cursor."""
+        stmt = select(goals_table).where(goals_table.c.is_done == is_done)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(goals_table.c.date_updated, goals_table.c.id)
+                < tuple_(after.date_updated, after.id)
+            )
+        result = await conn.execute(
+            stmt.order_by(goals_table.c.date_updated.desc(), goals_table.c.id.desc()).limit(limit)
+        )
+        return _to_goal.many(result.all())
 
     async def update(
         self,
@@ -140,13 +185,7 @@ class PostgresGoalRepository:
             row = result.one_or_none()
             if not row:
                 return None
-            return Goal(
-                id=row.id,
-                title=row.title,
-                is_done=row.is_done,
-                date_created=row.date_created,
-                date_updated=row.date_updated,
-            )
+            return _to_goal(row)
 
     async def delete(self, goal_id: UUID) -> bool:
         """Permanently delete a goal."""
@@ -1,19 +1,37 @@
 """FastAPI router for Milestones API."""
 
+from datetime import UTC, datetime, timedelta
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from pydantic import AwareDatetime
 
-from ai_life_backend.database import get_engine
+from ai_life_backend.container import get_container
+from ai_life_backend.core.public import (
+    BatchRejectedError,
+    entity_etag,
+    etag_matches,
+    list_etag,
+    not_modified,
+    trusted_json_response,
+)
 from ai_life_backend.milestones.api.schemas import (
+    BatchItemStatus,
+    MilestoneBatchRequest,
+    MilestoneBatchResponse,
+    MilestoneBatchResult,
     MilestoneCreateRequest,
+    MilestoneListPayload,
+    MilestoneListQuery,
     MilestoneListResponse,
     MilestoneResponse,
     MilestoneUpdateRequest,
+    milestone_list_adapter,
 )
 from ai_life_backend.milestones.domain.milestone import (
     CreateMilestoneInput,
+    MilestoneFilter,
     UpdateMilestoneInput,
 )
 from ai_life_backend.milestones.repository.postgres_milestone_repository import (
@@ -25,10 +43,21 @@ router = APIRouter(prefix="/milestones", tags=["milestones"])
 
 def get_repository() -> PostgresMilestoneRepository:
     """Dependency to get the milestone repository."""
-    return PostgresMilestoneRepository(get_engine())
+    return get_container().milestones
 
 
 RepoDep = Annotated[PostgresMilestoneRepository, Depends(get_repository)]
+IfNoneMatch = Annotated[str | None, Header()]
+ListQuery = Annotated[MilestoneListQuery, Query()]
+
+DEFAULT_BLOCKING_HORIZON = timedelta(days=7)
+DEFAULT_BLOCKING_LIMIT = 20
+MAX_BLOCKING_LIMIT = 100
+BlockingHorizon = Annotated[
+    AwareDatetime | None,
+    Query(description="Include milestones due at or before this time (default: in 7 days)"),
+]
+BlockingLimit = Annotated[int, Query(ge=1, le=MAX_BLOCKING_LIMIT)]
 
 
 @router.post("", response_model=MilestoneResponse, status_code=201)
@@ -60,32 +89,142 @@ async def create_milestone(request: MilestoneCreateRequest, repo: RepoDep) -> Mi
         raise HTTPException(status_code=422, detail=str(e)) from e
 
 
+_BATCH_STATUS: dict[str, BatchItemStatus] = {
+    "create": "created",
+    "update": "updated",
+    "delete": "deleted",
+}
+
+
+@router.post(
+    ":batch",
+    response_model=MilestoneBatchResponse,
+    responses={422: {"model": MilestoneBatchResponse, "description": "Batch rejected"}},
+)
+async def apply_milestone_batch(
+    request: MilestoneBatchRequest, repo: RepoDep, response: Response
+) -> MilestoneBatchResponse:
+    """Create, update and delete milestones in one all-or-nothing transaction.
+
+    Args:
+        request: Items to apply, in order
+        repo: Milestone repository
+        response: Outgoing response (its status becomes 422 on rejection)
+
+    Returns:
+        Per-item results; if any item is invalid nothing is written and every item
+        is reported as rejected (with its problem) or skipped
+    """
+    try:
+        written = await repo.apply_batch([item.to_domain() for item in request.items])
+    except BatchRejectedError as e:
+        response.status_code = 422
+        return MilestoneBatchResponse(
+            applied=False,
+            results=[
+                MilestoneBatchResult(
+                    index=index,
+                    op=item.op,
+                    status="rejected" if index in e.errors else "skipped",
+                    error=e.errors.get(index),
+                )
+                for index, item in enumerate(request.items)
+            ],
+        )
+    return MilestoneBatchResponse(
+        applied=True,
+        results=[
+            MilestoneBatchResult(
+                index=index,
+                op=item.op,
+                status=_BATCH_STATUS[item.op],
+                milestone=MilestoneResponse.model_validate(written[index]),
+            )
+            for index, item in enumerate(request.items)
+        ],
+    )
+
+
 @router.get("", response_model=MilestoneListResponse)
-async def list_milestones(repo: RepoDep) -> MilestoneListResponse:
-    """List all milestones.
+async def list_milestones(
+    repo: RepoDep, query: ListQuery, if_none_match: IfNoneMatch = None
+) -> Response:
+    """List milestones, optionally filtered by goal, status, due window and blocking.
+
+    Filters are applied in SQL against indexed columns. Milestones read from the
+    database are serialized without re-validation. When `If-None-Match` carries the
+    current ETag the response is an empty 304, decided by a `count`/`max(date_updated)`
+    aggregate over the same filter without loading rows.
 
     Args:
         repo: Milestone repository
+        query: Filters and sort order
+        if_none_match: ETag of the client's cached copy
 
     Returns:
-        List of all milestones
+        The matching milestones
+
+    Raises:
+        HTTPException: If `due_from` is later than `due_to` (422)
     """
-    milestones = await repo.list_all()
-    return MilestoneListResponse(
-        milestones=[MilestoneResponse.model_validate(m) for m in milestones]
+    try:
+        filters = query.to_domain()
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    scope = "milestones" if filters == MilestoneFilter() else f"milestones:{filters!r}"
+    if if_none_match is not None:
+        etag = list_etag(scope, *await repo.list_version(filters))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    milestones = await repo.list_filtered(filters)
+    last_updated = max((milestone.date_updated for milestone in milestones), default=None)
+    return trusted_json_response(
+        milestone_list_adapter,
+        MilestoneListPayload(milestones),
+        headers={"ETag": list_etag(scope, len(milestones), last_updated)},
     )
 
 
+@router.get("/blocking", response_model=MilestoneListResponse)
+async def list_open_blocking_milestones(
+    repo: RepoDep,
+    horizon: BlockingHorizon = None,
+    limit: BlockingLimit = DEFAULT_BLOCKING_LIMIT,
+) -> Response:
+    """List overdue and upcoming blocking milestones that are not done.
+
+    Served from a partial index on `due` over open blocking milestones, reading at
+    most `limit` index entries whatever the total number of milestones.
+
+    Args:
+        repo: Milestone repository
+        horizon: Latest due time to include (default: 7 days from now)
+        limit: Maximum number of milestones
+
+    Returns:
+        Up to `limit` milestones due at or before the horizon, earliest (most
+        overdue) first
+    """
+    until = horizon if horizon is not None else datetime.now(UTC) + DEFAULT_BLOCKING_HORIZON
+    milestones = await repo.list_open_blocking_due(until, limit)
+    return trusted_json_response(milestone_list_adapter, MilestoneListPayload(milestones))
+
+
 @router.get("/{milestone_id}", response_model=MilestoneResponse)
-async def get_milestone(milestone_id: UUID, repo: RepoDep) -> MilestoneResponse:
+async def get_milestone(
+    milestone_id: UUID, repo: RepoDep, response: Response, if_none_match: IfNoneMatch = None
+) -> MilestoneResponse | Response:
     """Get a milestone by ID.
 
     Args:
         milestone_id: The milestone ID
         repo: Milestone repository
+        response: Outgoing response (receives the ETag header)
+        if_none_match: ETag of the client's cached copy
 
     Returns:
-        The milestone
+        The milestone, or an empty 304 if the client's copy is current
 
     Raises:
         HTTPException: If milestone not found (404)
@@ -93,6 +232,10 @@ async def get_milestone(milestone_id: UUID, repo: RepoDep) -> MilestoneResponse:
     milestone = await repo.get_by_id(milestone_id)
     if not milestone:
         raise HTTPException(status_code=404, detail="Milestone not found")
+    etag = entity_etag(milestone.id, milestone.date_updated)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return MilestoneResponse.model_validate(milestone)
 
 
@@ -1,10 +1,24 @@
 """Pydantic schemas for Milestones API."""
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal
+from typing import Annotated, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+from ai_life_backend.core.public import MAX_BATCH_ITEMS
+from ai_life_backend.milestones.domain.milestone import (
+    CreateMilestoneInput,
+    Milestone,
+    MilestoneBatchCreate,
+    MilestoneBatchDelete,
+    MilestoneBatchItem,
+    MilestoneBatchUpdate,
+    MilestoneFilter,
+    MilestoneSort,
+    UpdateMilestoneInput,
+)
 
 # Status type matching the unified status set from the spec
 MilestoneStatus = Literal["todo", "doing", "done", "blocked"]
@@ -69,3 +83,123 @@ class MilestoneListResponse(BaseModel):
     """Response schema for list of milestones."""
 
     milestones: list[MilestoneResponse]
+
+
+@dataclass(frozen=True, slots=True)
+class MilestoneListPayload:
+    """Wire shape of MilestoneListResponse, serialized straight from domain milestones."""
+
+    milestones: list[Milestone]
+
+
+milestone_list_adapter = TypeAdapter(MilestoneListPayload)
+
+
+class MilestoneListQuery(BaseModel):
+    """Query parameters of GET /api/milestones; every filter is optional."""
+
+    goal_id: UUID | None = Field(default=None, description="Only milestones of this goal")
+    status: list[MilestoneStatus] = Field(
+        default_factory=list, description="Only these statuses (repeat the parameter)"
+    )
+    due_from: datetime | None = Field(default=None, description="Due at or after (inclusive)")
+    due_to: datetime | None = Field(default=None, description="Due at or before (inclusive)")
+    blocking: bool | None = Field(default=None, description="Only (non-)blocking milestones")
+    sort: MilestoneSort = Field(
+        default="created",
+        description="created: newest first; due: by due date (undated first), then newest",
+    )
+
+    def to_domain(self) -> MilestoneFilter:
+        """Convert to the repository filter (raises ValueError for an empty due window)."""
+        return MilestoneFilter(
+            goal_id=self.goal_id,
+            statuses=tuple(dict.fromkeys(self.status)),
+            due_from=self.due_from,
+            due_to=self.due_to,
+            blocking=self.blocking,
+            sort=self.sort,
+        )
+
+
+# Batch schemas
+BatchOp = Literal["create", "update", "delete"]
+BatchItemStatus = Literal["created", "updated", "deleted", "rejected", "skipped"]
+
+
+class MilestoneBatchCreateItem(MilestoneCreateRequest):
+    """Batch item creating a milestone."""
+
+    op: Literal["create"]
+
+    def to_domain(self) -> MilestoneBatchItem:
+        """Convert to the domain batch item."""
+        return MilestoneBatchCreate(
+            CreateMilestoneInput(
+                goal_id=self.goal_id,
+                title=self.title,
+                status=self.status,
+                demo_criterion=self.demo_criterion,
+                blocking=self.blocking,
+                due=self.due,
+            )
+        )
+
+
+class MilestoneBatchUpdateItem(MilestoneUpdateRequest):
+    """Batch item updating a milestone."""
+
+    op: Literal["update"]
+    id: UUID
+
+    def to_domain(self) -> MilestoneBatchItem:
+        """Convert to the domain batch item."""
+        return MilestoneBatchUpdate(
+            self.id,
+            UpdateMilestoneInput(
+                title=self.title,
+                due=self.due,
+                status=self.status,
+                demo_criterion=self.demo_criterion,
+                blocking=self.blocking,
+            ),
+        )
+
+
+class MilestoneBatchDeleteItem(BaseModel):
+    """Batch item deleting a milestone."""
+
+    op: Literal["delete"]
+    id: UUID
+
+    def to_domain(self) -> MilestoneBatchItem:
+        """Convert to the domain batch item."""
+        return MilestoneBatchDelete(self.id)
+
+
+class MilestoneBatchRequest(BaseModel):
+    """Request schema for an all-or-nothing batch of milestone writes."""
+
+    items: list[
+        Annotated[
+            MilestoneBatchCreateItem | MilestoneBatchUpdateItem | MilestoneBatchDeleteItem,
+            Field(discriminator="op"),
+        ]
+    ] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class MilestoneBatchResult(BaseModel):
+    """Outcome of one batch item; `milestone` is the written (or deleted) milestone."""
+
+    index: int
+    op: BatchOp
+    status: BatchItemStatus
+    milestone: MilestoneResponse | None = None
+    error: str | None = None
+
+
+class MilestoneBatchResponse(BaseModel):
+    """Response schema for a batch; `applied` is false when nothing was written."""
+
+    applied: bool
+    results: list[MilestoneBatchResult]
@@ -2,10 +2,14 @@
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 MAX_TITLE_LENGTH = 255
 
+# "created": date_created DESC (as list_all); "due": due (nulls first), then date_created DESC
+MilestoneSort = Literal["created", "due"]
+
 
 @dataclass(frozen=True)
 class CreateMilestoneInput:
@@ -30,7 +34,7 @@ class UpdateMilestoneInput:
     blocking: bool | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Milestone:
     """Immutable domain entity representing a milestone.
 
@@ -67,3 +71,55 @@ class Milestone:
         if len(self.demo_criterion) > MAX_TITLE_LENGTH:
             msg = f"Demo criterion cannot exceed {MAX_TITLE_LENGTH} characters"
             raise ValueError(msg)
+
+
+@dataclass(frozen=True, slots=True)
+class MilestoneBatchCreate:
+    """Batch item creating a milestone."""
+
+    data: CreateMilestoneInput
+
+
+@dataclass(frozen=True, slots=True)
+class MilestoneBatchUpdate:
+    """Batch item updating an existing milestone."""
+
+    id: UUID
+    data: UpdateMilestoneInput
+
+
+@dataclass(frozen=True, slots=True)
+class MilestoneBatchDelete:
+    """Batch item deleting an existing milestone."""
+
+    id: UUID
+
+
+MilestoneBatchItem = MilestoneBatchCreate | MilestoneBatchUpdate | MilestoneBatchDelete
+
+
+@dataclass(frozen=True, slots=True)
+class MilestoneFilter:
+    """Server-side filter and order of a milestone list; unset fields match everything.
+
+    Attributes:
+        goal_id: Only milestones of this goal
+        statuses: Only milestones in one of these statuses
+        due_from: Only milestones due at or after this time (excludes undated ones)
+        due_to: Only milestones due at or before this time (excludes undated ones)
+        blocking: Only blocking (True) or non-blocking (False) milestones
+        sort: Result order
+    """
+
+    goal_id: UUID | None = None
+    statuses: tuple[str, ...] = ()
+    due_from: datetime | None = None
+    due_to: datetime | None = None
+    blocking: bool | None = None
+    sort: MilestoneSort = "created"
+
+    def __post_init__(self) -> None:
+        """Reject an empty due window."""
+        if self.due_from is not None and self.due_to is not None and self.due_from > self.due_to:
+            msg = "due_from must not be later than due_to"
+            raise ValueError(msg)
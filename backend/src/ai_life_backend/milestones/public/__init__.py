@@ -8,22 +8,19 @@ from uuid import UUID
 
 from fastapi import APIRouter
 
+from ai_life_backend.container import get_container
 from ai_life_backend.contracts.core_protocols import (
     RFC7807_MIME,
     ProblemDict,
 )
 from ai_life_backend.core.public import make_public_router
-from ai_life_backend.database import get_engine
 from ai_life_backend.milestones.api.routes import router as _internal_router
 from ai_life_backend.milestones.domain.milestone import Milestone
-from ai_life_backend.milestones.repository.postgres_milestone_repository import (
-    PostgresMilestoneRepository,
-)
 
 # ---------- In-process DTO & read-only port ----------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MilestoneDTO:
     """Read-only DTO for same-process consumers. No ORM exposure."""
 
@@ -58,7 +55,7 @@ async def list_milestones() -> list[MilestoneDTO]:
 
     Ordering: date_created DESC.
     """
-    repo = PostgresMilestoneRepository(get_engine())
+    repo = get_container().milestones
     milestones = await repo.list_all()
     return [MilestoneDTO.from_domain(m) for m in milestones]
 
@@ -68,14 +65,14 @@ async def list_milestones_by_goal(goal_id: UUID) -> list[MilestoneDTO]:
 
     Ordering: due date (nulls first), then date_created DESC.
     """
-    repo = PostgresMilestoneRepository(get_engine())
+    repo = get_container().milestones
     milestones = await repo.list_by_goal(goal_id)
     return [MilestoneDTO.from_domain(m) for m in milestones]
 
 
 async def get_milestone(id: UUID) -> MilestoneDTO | None:
     """Retrieve a single milestone by ID (read-only)."""
-    repo = PostgresMilestoneRepository(get_engine())
+    repo = get_container().milestones
     milestone = await repo.get_by_id(id)
     return None if milestone is None else MilestoneDTO.from_domain(milestone)
 
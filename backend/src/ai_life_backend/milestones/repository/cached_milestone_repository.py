@@ -0,0 +1,114 @@
+"""Read-through cached MilestoneRepository."""
+
+from collections.abc import Sequence
+from functools import partial
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ai_life_backend.core.public import ReadThroughCache
+from ai_life_backend.milestones.domain.milestone import (
+    CreateMilestoneInput,
+    Milestone,
+    MilestoneBatchItem,
+    UpdateMilestoneInput,
+)
+
+from .postgres_milestone_repository import PostgresMilestoneRepository
+
+ALL_KEY = "milestones:all"
+
+
+def milestone_key(milestone_id: UUID) -> str:
+    """Cache key of a single milestone."""
+    return f"milestone:{milestone_id}"
+
+
+def goal_list_key(goal_id: UUID) -> str:
+    """Cache key of the milestone list of one goal."""
+    return f"milestones:goal:{goal_id}"
+
+
+class CachedMilestoneRepository(PostgresMilestoneRepository):
+    """PostgresMilestoneRepository whose point and list reads go through a cache.
+
+    Writes invalidate the milestone itself, the full list and the list of its
+    goal; other goals' lists stay cached.
+    """
+
+    def __init__(self, engine: AsyncEngine, cache: ReadThroughCache) -> None:
+        """Initialize repository with database engine and shared cache."""
+        super().__init__(engine)
+        self._cache = cache
+
+    async def get_by_id(self, milestone_id: UUID) -> Milestone | None:
+        """Retrieve milestone by ID (cached)."""
+        return await self._cache.get_or_load(
+            milestone_key(milestone_id), partial(super().get_by_id, milestone_id)
+        )
+
+    async def list_all(self) -> list[Milestone]:
+        """List all milestones (cached), sorted by date_created DESC."""
+        milestones = await self._cache.get_or_load(ALL_KEY, self._load_all)
+        return list(milestones)
+
+    async def list_by_goal(self, goal_id: UUID) -> list[Milestone]:
+        """List milestones for a specific goal (cached)."""
+        milestones = await self._cache.get_or_load(
+            goal_list_key(goal_id), partial(self._load_by_goal, goal_id)
+        )
+        return list(milestones)
+
+    async def _load_all(self) -> tuple[Milestone, ...]:
+        """Load the full list as an immutable tuple for sharing through the cache."""
+        return tuple(await super().list_all())
+
+    async def _load_by_goal(self, goal_id: UUID) -> tuple[Milestone, ...]:
+        """Load one goal's list as an immutable tuple."""
+        return tuple(await super().list_by_goal(goal_id))
+
+    async def create(self, input_data: CreateMilestoneInput) -> Milestone:
+        """Create new milestone and invalidate the lists it joins."""
+        milestone = await super().create(input_data)
+        await self._cache.invalidate(ALL_KEY, goal_list_key(milestone.goal_id))
+        return milestone
+
+    async def update(
+        self, milestone_id: UUID, input_data: UpdateMilestoneInput
+    ) -> Milestone | None:
+        """Update milestone and invalidate its key and the lists it is in."""
+        milestone = await super().update(milestone_id, input_data)
+        if milestone is not None:
+            await self._cache.invalidate(
+                milestone_key(milestone_id), ALL_KEY, goal_list_key(milestone.goal_id)
+            )
+        return milestone
+
+    async def delete(self, milestone_id: UUID) -> bool:
+        """Delete milestone and invalidate its key and the lists it was in."""
+        milestone = await super().get_by_id(milestone_id)
+        deleted = await super().delete(milestone_id)
+        if deleted and milestone is not None:
+            await self._cache.invalidate(
+                milestone_key(milestone_id), ALL_KEY, goal_list_key(milestone.goal_id)
+            )
+        return deleted
+
+    async def apply_batch(self, items: Sequence[MilestoneBatchItem]) -> dict[int, Milestone]:
+        """Apply a batch and invalidate every written milestone and the lists it is in."""
+        written = await super().apply_batch(items)
+        await self._cache.invalidate(
+            ALL_KEY,
+            *{milestone_key(milestone.id) for milestone in written.values()},
+            *{goal_list_key(milestone.goal_id) for milestone in written.values()},
+        )
+        return written
+
+    async def keys_for_goal(self, goal_id: UUID) -> list[str]:
+        """Return the cache keys removed when a goal's milestones cascade-delete."""
+        milestones = await super().list_by_goal(goal_id)
+        return [
+            ALL_KEY,
+            goal_list_key(goal_id),
+            *(milestone_key(milestone.id) for milestone in milestones),
+        ]
@@ -1,5 +1,6 @@
 """PostgreSQL implementation of MilestoneRepository."""
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
@@ -7,21 +8,37 @@ from uuid import UUID
 from sqlalchemy import (
     Boolean,
     Column,
+    ColumnElement,
     DateTime,
     ForeignKey,
+    Integer,
     MetaData,
+    Select,
     String,
     Table,
+    any_,
+    column,
     delete,
+    func,
+    literal_column,
     select,
+    table,
     update,
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
+from ai_life_backend.core.public import BatchRejectedError, RowMapper, StatusRollup
+from ai_life_backend.database import uuid_array
 from ai_life_backend.milestones.domain.milestone import (
     CreateMilestoneInput,
     Milestone,
+    MilestoneBatchCreate,
+    MilestoneBatchDelete,
+    MilestoneBatchItem,
+    MilestoneBatchUpdate,
+    MilestoneFilter,
+    MilestoneSort,
     UpdateMilestoneInput,
 )
 
@@ -43,6 +60,73 @@ milestones_table = Table(
     Column("date_updated", DateTime(timezone=True), nullable=False),
 )
 
+# Only the key of the goals table is needed to check batch references and recount progress
+_goals = table("goals", column("id", PG_UUID(as_uuid=True)))
+
+# Milestone counters per goal, written in the same transaction as every milestone
+# write, so progress reads are one primary-key lookup; a missing row means none yet.
+goal_progress_table = Table(
+    "goal_progress",
+    metadata,
+    Column("goal_id", PG_UUID(as_uuid=True), primary_key=True),
+    Column("milestone_count", Integer, nullable=False),
+    Column("milestones_done", Integer, nullable=False),
+    Column("milestones_blocked", Integer, nullable=False),
+)
+
+goal_progress = StatusRollup(goal_progress_table, milestones_table, _goals)
+
+_to_milestone = RowMapper(Milestone, milestones_table)
+
+_ORDER: dict[MilestoneSort, tuple[ColumnElement[Any], ...]] = {
+    "created": (milestones_table.c.date_created.desc(),),
+    "due": (milestones_table.c.due.nullsfirst(), milestones_table.c.date_created.desc()),
+}
+
+
+# Predicate of idx_milestones_open_blocking_due, spelled out literally: the planner
+# only uses a partial index when the query's WHERE implies the index predicate, which
+# it cannot prove against a bound parameter
+_OPEN_BLOCKING = (
+    milestones_table.c.blocking,
+    milestones_table.c.status != literal_column("'done'"),
+)
+
+
+def open_blocking_due_query(horizon: datetime, limit: int) -> Select[Any]:
+    """Open blocking milestones due at or before `horizon`, earliest first, at most `limit`.
+
+    An ordered range scan over the partial index that stops after `limit` entries, so
+    its cost does not depend on how many milestones exist.
+    """
+    return (
+        select(milestones_table)
+        .where(*_OPEN_BLOCKING, milestones_table.c.due <= horizon)
+        .order_by(milestones_table.c.due)
+        .limit(limit)
+    )
+
+
+def _filter_clauses(filters: MilestoneFilter) -> list[ColumnElement[bool]]:
+    """WHERE clauses for the set fields of `filters`.
+
+    Every clause is on an indexed column; goal + due and status + due are served by
+    composite indexes whose trailing columns also match the `due` order.
+    """
+    c = milestones_table.c
+    clauses: list[ColumnElement[bool]] = []
+    if filters.goal_id is not None:
+        clauses.append(c.goal_id == filters.goal_id)
+    if filters.statuses:
+        clauses.append(c.status.in_(filters.statuses))
+    if filters.due_from is not None:
+        clauses.append(c.due >= filters.due_from)
+    if filters.due_to is not None:
+        clauses.append(c.due <= filters.due_to)
+    if filters.blocking is not None:
+        clauses.append(c.blocking == filters.blocking)
+    return clauses
+
 
 class PostgresMilestoneRepository:
     """PostgreSQL implementation of MilestoneRepository Protocol."""
@@ -51,8 +135,9 @@ class PostgresMilestoneRepository:
         """Initialize repository with database engine."""
         self._engine = engine
 
-    async def create(self, input_data: CreateMilestoneInput) -> Milestone:
-        """Create new milestone."""
+    @staticmethod
+    def _validate_create_input(input_data: CreateMilestoneInput) -> None:
+        """Validate create input data."""
         if len(input_data.title) > MAX_TITLE_LENGTH:
             msg = f"Title cannot exceed {MAX_TITLE_LENGTH} characters"
             raise ValueError(msg)
@@ -61,6 +146,10 @@ class PostgresMilestoneRepository:
             msg = f"Demo criterion cannot exceed {MAX_TITLE_LENGTH} characters"
             raise ValueError(msg)
 
+    async def create(self, input_data: CreateMilestoneInput) -> Milestone:
+        """Create new milestone."""
+        self._validate_create_input(input_data)
+
         async with self._engine.begin() as conn:
             result = await conn.execute(
                 milestones_table.insert()
@@ -74,18 +163,9 @@ class PostgresMilestoneRepository:
                 )
                 .returning(milestones_table)
             )
-            row = result.one()
-            return Milestone(
-                id=row.id,
-                goal_id=row.goal_id,
-                title=row.title,
-                due=row.due,
-                status=row.status,
-                demo_criterion=row.demo_criterion,
-                blocking=row.blocking,
-                date_created=row.date_created,
-                date_updated=row.date_updated,
-            )
+            milestone = _to_milestone(result.one())
+            await self._shift_progress(conn, milestone.goal_id, None, milestone.status)
+            return milestone
 
     async def get_by_id(self, milestone_id: UUID) -> Milestone | None:
         """Retrieve milestone by ID."""
@@ -96,17 +176,7 @@ class PostgresMilestoneRepository:
             row = result.one_or_none()
             if not row:
                 return None
-            return Milestone(
-                id=row.id,
-                goal_id=row.goal_id,
-                title=row.title,
-                due=row.due,
-                status=row.status,
-                demo_criterion=row.demo_criterion,
-                blocking=row.blocking,
-                date_created=row.date_created,
-                date_updated=row.date_updated,
-            )
+            return _to_milestone(row)
 
     async def list_all(self) -> list[Milestone]:
         """List all milestones, sorted by date_created DESC."""
@@ -114,20 +184,19 @@ class PostgresMilestoneRepository:
             result = await conn.execute(
                 select(milestones_table).order_by(milestones_table.c.date_created.desc())
             )
-            return [
-                Milestone(
-                    id=row.id,
-                    goal_id=row.goal_id,
-                    title=row.title,
-                    due=row.due,
-                    status=row.status,
-                    demo_criterion=row.demo_criterion,
-                    blocking=row.blocking,
-                    date_created=row.date_created,
-                    date_updated=row.date_updated,
-                )
-                for row in result.all()
-            ]
+            return _to_milestone.many(result.all())
+
+    async def list_version(
+        self, filters: MilestoneFilter | None = None
+    ) -> tuple[int, datetime | None]:
+        """Return `(count, max(date_updated))` of the (filtered) milestones without loading rows."""
+        clauses = _filter_clauses(filters) if filters is not None else []
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                select(func.count(), func.max(milestones_table.c.date_updated)).where(*clauses)
+            )
+            count, last_updated = result.one()
+            return count, last_updated
 
     async def list_by_goal(self, goal_id: UUID) -> list[Milestone]:
         """List milestones for a specific goal, sorted by due date and date_created."""
@@ -135,25 +204,37 @@ class PostgresMilestoneRepository:
             result = await conn.execute(
                 select(milestones_table)
                 .where(milestones_table.c.goal_id == goal_id)
-                .order_by(
-                    milestones_table.c.due.nullsfirst(),
-                    milestones_table.c.date_created.desc(),
-                )
+                .order_by(*_ORDER["due"])
             )
-            return [
-                Milestone(
-                    id=row.id,
-                    goal_id=row.goal_id,
-                    title=row.title,
-                    due=row.due,
-                    status=row.status,
-                    demo_criterion=row.demo_criterion,
-                    blocking=row.blocking,
-                    date_created=row.date_created,
-                    date_updated=row.date_updated,
-                )
-                for row in result.all()
-            ]
+            return _to_milestone.many(result.all())
+
+    async def list_open_blocking_due(self, horizon: datetime, limit: int) -> list[Milestone]:
+        """List the next `limit` open blocking milestones due at or before `horizon`.
+
+        Overdue milestones come first (ordered by due date); undated ones never match.
+        """
+        async with self._engine.connect() as conn:
+            result = await conn.execute(open_blocking_due_query(horizon, limit))
+            return _to_milestone.many(result.all())
+
+    async def list_filtered(self, filters: MilestoneFilter) -> list[Milestone]:
+        """List milestones matching `filters`, in its order.
+
+        The unfiltered list and the plain per-goal list are delegated to `list_all`
+        and `list_by_goal` (cached in `CachedMilestoneRepository`); any other
+        combination is a single index-backed query.
+        """
+        if filters == MilestoneFilter():
+            return await self.list_all()
+        if filters.goal_id is not None and filters == MilestoneFilter(filters.goal_id, sort="due"):
+            return await self.list_by_goal(filters.goal_id)
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                select(milestones_table)
+                .where(*_filter_clauses(filters))
+                .order_by(*_ORDER[filters.sort])
+            )
+            return _to_milestone.many(result.all())
 
     @staticmethod
     def _validate_update_input(input_data: UpdateMilestoneInput) -> None:
@@ -213,6 +294,13 @@ class PostgresMilestoneRepository:
         update_values = self._build_update_dict(input_data)
 
         async with self._engine.begin() as conn:
+            before = None
+            if input_data.status is not None:
+                before = await conn.scalar(
+                    select(milestones_table.c.status)
+                    .where(milestones_table.c.id == milestone_id)
+                    .with_for_update()
+                )
             result = await conn.execute(
                 update(milestones_table)
                 .where(milestones_table.c.id == milestone_id)
@@ -222,22 +310,163 @@ class PostgresMilestoneRepository:
             row = result.one_or_none()
             if not row:
                 return None
-            return Milestone(
-                id=row.id,
-                goal_id=row.goal_id,
-                title=row.title,
-                due=row.due,
-                status=row.status,
-                demo_criterion=row.demo_criterion,
-                blocking=row.blocking,
-                date_created=row.date_created,
-                date_updated=row.date_updated,
-            )
+            if before is not None:
+                await self._shift_progress(conn, row.goal_id, before, row.status)
+            return _to_milestone(row)
 
     async def delete(self, milestone_id: UUID) -> bool:
         """Permanently delete a milestone."""
         async with self._engine.begin() as conn:
             result = await conn.execute(
-                delete(milestones_table).where(milestones_table.c.id == milestone_id)
+                delete(milestones_table)
+                .where(milestones_table.c.id == milestone_id)
+                .returning(milestones_table.c.goal_id, milestones_table.c.status)
             )
-            return result.rowcount > 0
+            row = result.one_or_none()
+            if row is None:
+                return False
+            await self._shift_progress(conn, row.goal_id, row.status, None)
+            return True
+
+    @staticmethod
+    async def _shift_progress(
+        conn: AsyncConnection, goal_id: UUID, before: str | None, after: str | None
+    ) -> None:
+        """Apply one milestone's status change to its goal's progress row."""
+        stmt = goal_progress.shift(goal_id, before, after)
+        if stmt is not None:
+            await conn.execute(stmt)
+
+    @classmethod
+    def _validate_item(cls, item: MilestoneBatchItem) -> None:
+        """Validate the input of one batch item."""
+        if isinstance(item, MilestoneBatchCreate):
+            cls._validate_create_input(item.data)
+        elif isinstance(item, MilestoneBatchUpdate):
+            cls._validate_update_input(item.data)
+
+    @classmethod
+    def _validate_batch(cls, items: Sequence[MilestoneBatchItem]) -> dict[int, str]:
+        """Check every item on its own; return one problem per invalid item."""
+        errors: dict[int, str] = {}
+        targeted: set[UUID] = set()
+        for index, item in enumerate(items):
+            if not isinstance(item, MilestoneBatchCreate):
+                if item.id in targeted:
+                    errors[index] = f"Milestone {item.id} appears more than once in the batch"
+                    continue
+                targeted.add(item.id)
+            try:
+                cls._validate_item(item)
+            except ValueError as e:
+                errors[index] = str(e)
+        return errors
+
+    @staticmethod
+    async def _check_batch_references(
+        conn: AsyncConnection, items: Sequence[MilestoneBatchItem]
+    ) -> dict[int, str]:
+        """Check referenced goals and targeted milestones with one lookup each.
+
+        Goals are share-locked and targets locked for update, so neither can change
+        before the batch commits.
+        """
+        goal_ids = {i.data.goal_id for i in items if isinstance(i, MilestoneBatchCreate)}
+        target_ids = {i.id for i in items if not isinstance(i, MilestoneBatchCreate)}
+        found_goals = await conn.execute(
+            select(_goals.c.id)
+            .where(_goals.c.id == any_(uuid_array(goal_ids)))
+            .with_for_update(read=True)
+        )
+        found_targets = await conn.execute(
+            select(milestones_table.c.id)
+            .where(milestones_table.c.id == any_(uuid_array(target_ids)))
+            .with_for_update()
+        )
+        goals, targets = set(found_goals.scalars()), set(found_targets.scalars())
+        errors: dict[int, str] = {}
+        for index, item in enumerate(items):
+            if isinstance(item, MilestoneBatchCreate):
+                if item.data.goal_id not in goals:
+                    errors[index] = f"Goal {item.data.goal_id} not found"
+            elif item.id not in targets:
+                errors[index] = "Milestone not found"
+        return errors
+
+    async def apply_batch(self, items: Sequence[MilestoneBatchItem]) -> dict[int, Milestone]:
+        """Create, update and delete milestones in one all-or-nothing transaction.
+
+        Creates go out as one multi-row `INSERT ... RETURNING` and deletes as one
+        `DELETE ... WHERE id = ANY(:ids) RETURNING`; the progress rows of every
+        touched goal are then recounted set-based.
+
+        Returns:
+            The written milestone per item index (deleted milestones as they were)
+
+        Raises:
+            BatchRejectedError: With one problem per invalid item; nothing is written
+        """
+        errors = self._validate_batch(items)
+        async with self._engine.begin() as conn:
+            references = await self._check_batch_references(conn, items)
+            errors = references | errors
+            if errors:
+                raise BatchRejectedError(errors)
+            written = await self._insert_batch(conn, items)
+            for index, item in enumerate(items):
+                if isinstance(item, MilestoneBatchUpdate):
+                    result = await conn.execute(
+                        update(milestones_table)
+                        .where(milestones_table.c.id == item.id)
+                        .values(**self._build_update_dict(item.data))
+                        .returning(milestones_table)
+                    )
+                    written[index] = _to_milestone(result.one())
+            written |= await self._delete_batch(conn, items)
+            await conn.execute(goal_progress.recount({m.goal_id for m in written.values()}))
+        return dict(sorted(written.items()))
+
+    @staticmethod
+    async def _insert_batch(
+        conn: AsyncConnection, items: Sequence[MilestoneBatchItem]
+    ) -> dict[int, Milestone]:
+        """Insert all created milestones with one multi-row `INSERT ... RETURNING`."""
+        creates = {
+            i: item.data for i, item in enumerate(items) if isinstance(item, MilestoneBatchCreate)
+        }
+        if not creates:
+            return {}
+        result = await conn.execute(
+            milestones_table.insert().returning(milestones_table, sort_by_parameter_order=True),
+            [
+                {
+                    "goal_id": data.goal_id,
+                    "title": data.title,
+                    "due": data.due,
+                    "status": data.status,
+                    "demo_criterion": data.demo_criterion,
+                    "blocking": data.blocking,
+                }
+                for data in creates.values()
+            ],
+        )
+        return dict(zip(creates, _to_milestone.many(result.all()), strict=True))
+
+    @staticmethod
+    async def _delete_batch(
+        conn: AsyncConnection, items: Sequence[MilestoneBatchItem]
+    ) -> dict[int, Milestone]:
+        """Delete all targeted milestones with one statement, returning the old rows."""
+        deletes = {
+            item.id: index
+            for index, item in enumerate(items)
+            if isinstance(item, MilestoneBatchDelete)
+        }
+        if not deletes:
+            return {}
+        result = await conn.execute(
+            delete(milestones_table)
+            .where(milestones_table.c.id == any_(uuid_array(deletes)))
+            .returning(milestones_table)
+        )
+        return {deletes[row.id]: _to_milestone(row) for row in result.all()}
@@ -0,0 +1 @@
+"""Cross-module read models (goal overview)."""
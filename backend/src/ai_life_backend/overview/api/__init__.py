@@ -0,0 +1 @@
+"""API layer for overview."""
@@ -0,0 +1,75 @@
+"""FastAPI router for overview endpoints."""
+
+from typing import Annotated, Literal
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ai_life_backend.container import get_container
+from ai_life_backend.core.public import trusted_json_response
+from ai_life_backend.goals.domain import GoalCursor
+from ai_life_backend.overview.api.schemas import (
+    GoalOverviewListPayload,
+    GoalOverviewListResponse,
+    GoalProgressResponse,
+    goal_overview_list_adapter,
+)
+from ai_life_backend.overview.services.goal_overview import list_goal_overviews
+from ai_life_backend.overview.services.goal_progress import get_goal_progress
+
+router = APIRouter(tags=["overview"])
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def get_engine() -> AsyncEngine:
+    """Dependency to get the process engine."""
+    return get_container().engine
+
+
+EngineDep = Annotated[AsyncEngine, Depends(get_engine)]
+StatusFilter = Annotated[Literal["active", "done"] | None, Query()]
+PageLimit = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)]
+PageCursor = Annotated[str | None, Query()]
+
+_IS_DONE_BY_STATUS: dict[str | None, bool | None] = {None: None, "active": False, "done": True}
+
+
+@router.get("/goals/overview", response_model=GoalOverviewListResponse)
+async def get_goal_overview(
+    engine: EngineDep,
+    status: StatusFilter = None,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: PageCursor = None,
+) -> Response:
+    """List goals with milestone counts, next due milestone, project and task totals.
+
+    Goals come in `GET /api/goals` order, one keyset page at a time; `next_cursor`
+    points to the following page. Each page is read with one SQL statement.
+    """
+    try:
+        after = GoalCursor.decode(cursor) if cursor is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    overviews, next_cursor = await list_goal_overviews(
+        engine, limit, after, _IS_DONE_BY_STATUS[status]
+    )
+    payload = GoalOverviewListPayload(
+        overviews, next_cursor.encode() if next_cursor is not None else None
+    )
+    return trusted_json_response(goal_overview_list_adapter, payload)
+
+
+@router.get("/goals/{goal_id}/progress", response_model=GoalProgressResponse)
+async def get_goal_progress_summary(goal_id: UUID, engine: EngineDep) -> GoalProgressResponse:
+    """Get a goal's milestone and task counters from the progress rollups.
+
+    Reads the goal's `goal_progress` row and the `project_progress` rows of its
+    projects; no milestone or task is scanned.
+    """
+    progress = await get_goal_progress(engine, goal_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="Goal not found")
+    return GoalProgressResponse.model_validate(progress)
@@ -0,0 +1,83 @@
+"""Pydantic schemas for the overview API."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from ai_life_backend.overview.domain import GoalOverview
+
+
+class MilestoneCountsResponse(BaseModel):
+    """Number of a goal's milestones in each status."""
+
+    todo: int
+    doing: int
+    done: int
+    blocked: int
+
+
+class NextMilestoneResponse(BaseModel):
+    """Earliest-due milestone of a goal that is not done."""
+
+    id: UUID
+    title: str
+    due: datetime
+    status: str
+    blocking: bool
+
+
+class GoalOverviewResponse(BaseModel):
+    """A goal with everything its card shows.
+
+    `task_completion` is `tasks_done / task_count`, or null when the goal's projects
+    have no tasks.
+    """
+
+    id: UUID
+    title: str
+    is_done: bool
+    date_created: datetime
+    date_updated: datetime
+    milestones: MilestoneCountsResponse
+    next_milestone: NextMilestoneResponse | None
+    project_count: int
+    task_count: int
+    tasks_done: int
+    task_completion: float | None
+
+
+class GoalOverviewListResponse(BaseModel):
+    """One page of goal overviews; `next_cursor` is set when more goals follow."""
+
+    goals: list[GoalOverviewResponse]
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class GoalOverviewListPayload:
+    """Wire shape of GoalOverviewListResponse, serialized straight from read models."""
+
+    goals: list[GoalOverview]
+    next_cursor: str | None = None
+
+
+goal_overview_list_adapter = TypeAdapter(GoalOverviewListPayload)
+
+
+class GoalProgressResponse(BaseModel):
+    """Milestone and task counters of a goal; completions are null without children."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    goal_id: UUID
+    milestone_count: int
+    milestones_done: int
+    milestones_blocked: int
+    milestone_completion: float | None
+    project_count: int
+    task_count: int
+    tasks_done: int
+    tasks_blocked: int
+    task_completion: float | None
@@ -0,0 +1,6 @@
+"""Domain read models for the overview module."""
+
+from .goal_overview import GoalOverview, MilestoneCounts, NextMilestone
+from .goal_progress import GoalProgressSummary
+
+__all__ = ["GoalOverview", "GoalProgressSummary", "MilestoneCounts", "NextMilestone"]
@@ -0,0 +1,59 @@
+"""Goal overview read model: a goal with the aggregates a goal card shows."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class MilestoneCounts:
+    """Number of a goal's milestones in each status."""
+
+    todo: int = 0
+    doing: int = 0
+    done: int = 0
+    blocked: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class NextMilestone:
+    """The earliest-due milestone of a goal that is not done yet."""
+
+    id: UUID
+    title: str
+    due: datetime
+    status: str
+    blocking: bool
+
+
+@dataclass(frozen=True, slots=True)
+class GoalOverview:
+    """A goal with its milestone, project and task aggregates.
+
+    Attributes:
+        id: Goal identifier
+        title: Goal title
+        is_done: Goal completion status
+        date_created: Goal creation timestamp (UTC)
+        date_updated: Goal last modification timestamp (UTC)
+        milestones: Milestone counts by status
+        next_milestone: Earliest-due open milestone with a due date, if any
+        project_count: Number of projects linked to the goal
+        task_count: Number of tasks across those projects
+        tasks_done: Number of those tasks that are done
+        task_completion: `tasks_done / task_count`, or None when there are no tasks
+    """
+
+    id: UUID
+    title: str
+    is_done: bool
+    date_created: datetime
+    date_updated: datetime
+    milestones: MilestoneCounts
+    next_milestone: NextMilestone | None
+    project_count: int
+    task_count: int
+    tasks_done: int
+    task_completion: float | None
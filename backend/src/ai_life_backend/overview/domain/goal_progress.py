@@ -0,0 +1,41 @@
+"""Goal progress read model, assembled from the goal and project rollup rows."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class GoalProgressSummary:
+    """Milestone and task counters of one goal.
+
+    Attributes:
+        goal_id: Goal identifier
+        milestone_count: Number of milestones of the goal
+        milestones_done: Milestones that are done
+        milestones_blocked: Milestones that are blocked
+        project_count: Number of projects linked to the goal
+        task_count: Number of tasks across those projects
+        tasks_done: Tasks that are done
+        tasks_blocked: Tasks that are blocked
+    """
+
+    goal_id: UUID
+    milestone_count: int
+    milestones_done: int
+    milestones_blocked: int
+    project_count: int
+    task_count: int
+    tasks_done: int
+    tasks_blocked: int
+
+    @property
+    def milestone_completion(self) -> float | None:
+        """Share of done milestones, or None without milestones."""
+        return self.milestones_done / self.milestone_count if self.milestone_count else None
+
+    @property
+    def task_completion(self) -> float | None:
+        """Share of done tasks, or None without tasks."""
+        return self.tasks_done / self.task_count if self.task_count else None
@@ -0,0 +1,28 @@
+"""Public API for backend.overview — cross-module read models and their HTTP router."""
+
+from fastapi import APIRouter
+
+from ai_life_backend.core.public import make_public_router
+from ai_life_backend.overview.api.routes import router as _internal_router
+from ai_life_backend.overview.domain import (
+    GoalOverview,
+    GoalProgressSummary,
+    MilestoneCounts,
+    NextMilestone,
+)
+from ai_life_backend.overview.services.goal_overview import list_goal_overviews
+from ai_life_backend.overview.services.goal_progress import ROLLUPS, get_goal_progress
+
+# ---------- HTTP public surface (router) ----------
+overview_router: APIRouter = make_public_router(_internal_router)
+
+__all__ = [
+    "ROLLUPS",
+    "GoalOverview",
+    "GoalProgressSummary",
+    "MilestoneCounts",
+    "NextMilestone",
+    "get_goal_progress",
+    "list_goal_overviews",
+    "overview_router",
+]
@@ -0,0 +1 @@
+"""Overview services package."""
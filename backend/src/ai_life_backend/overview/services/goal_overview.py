@@ -0,0 +1,188 @@
+"""Goal overview: one keyset page of goals with their aggregates in one statement.
+
+The page of goals is selected first, with an index range seek per status partition
+on `idx_goals_is_done_date_updated_id` (as `GET /api/goals?limit=` does). Three
+LATERAL subqueries then aggregate only the goals on that page:
+
+- milestone counts by status (`idx_milestones_goal_id_due`),
+- the earliest-due open milestone (same index, read in its own order, LIMIT 1),
+- project count and task totals, summed from the `project_progress` rollup rows of
+  the goal's projects (`idx_projects_goal_id`), without reading any task.
+
+A goal card therefore costs one round trip instead of a goal list request followed
+by milestone, project and task requests per goal.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Select, func, select, true, tuple_, union_all
+
+from ai_life_backend.goals.domain import GoalCursor
+from ai_life_backend.goals.repository.postgres_goal_repository import goals_table
+from ai_life_backend.milestones.repository.postgres_milestone_repository import (
+    milestones_table,
+)
+from ai_life_backend.overview.domain import GoalOverview, MilestoneCounts, NextMilestone
+from ai_life_backend.projects.repository.postgres_project_repository import projects_table
+from ai_life_backend.projects.repository.postgres_task_repository import (
+    project_progress_table,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement, FromClause, Row, Subquery
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+MILESTONE_STATUSES = ("todo", "doing", "done", "blocked")
+
+
+def _partition(is_done: bool, after: GoalCursor | None, limit: int) -> Select[Any]:
+    """Up to `limit` goals of one status partition, strictly after the cursor."""
+    stmt = select(goals_table).where(goals_table.c.is_done == is_done)
+    if after is not None and after.is_done == is_done:
+        stmt = stmt.where(
+            tuple_(goals_table.c.date_updated, goals_table.c.id)
+            < tuple_(after.date_updated, after.id)
+        )
+    return stmt.order_by(goals_table.c.date_updated.desc(), goals_table.c.id.desc()).limit(limit)
+
+
+def _partitions(after: GoalCursor | None, is_done: bool | None) -> list[bool]:
+    """Status partitions still to read, in page order (open goals first)."""
+    partitions = [False, True] if is_done is None else [is_done]
+    if after is not None:
+        partitions = [done for done in partitions if done >= after.is_done]
+    return partitions
+
+
+def _milestone_counts(page: Subquery) -> FromClause:
+    status = milestones_table.c.status
+    return (
+        select(*[func.count().filter(status == name).label(name) for name in MILESTONE_STATUSES])
+        .where(milestones_table.c.goal_id == page.c.id)
+        .lateral("milestone_counts")
+    )
+
+
+def _next_milestone(page: Subquery) -> FromClause:
+    # Ordered exactly like idx_milestones_goal_id_due, so this is a short index scan
+    return (
+        select(
+            milestones_table.c.id.label("next_id"),
+            milestones_table.c.title.label("next_title"),
+            milestones_table.c.due.label("next_due"),
+            milestones_table.c.status.label("next_status"),
+            milestones_table.c.blocking.label("next_blocking"),
+        )
+        .where(
+            milestones_table.c.goal_id == page.c.id,
+            milestones_table.c.status != "done",
+            milestones_table.c.due.is_not(None),
+        )
+        .order_by(
+            milestones_table.c.due.asc().nulls_first(), milestones_table.c.date_created.desc()
+        )
+        .limit(1)
+        .lateral("next_milestone")
+    )
+
+
+def work_totals(goal_id: ColumnElement[Any]) -> FromClause:
+    """LATERAL project count and task counters of the goal `goal_id` refers to.
+
+    Task counters are summed from the `project_progress` rollup rows, so the cost
+    grows with the goal's projects, not with their tasks.
+    """
+    progress = project_progress_table.c
+    return (
+        select(
+            func.count(projects_table.c.id).label("project_count"),
+            func.coalesce(func.sum(progress.task_count), 0).label("task_count"),
+            func.coalesce(func.sum(progress.tasks_done), 0).label("tasks_done"),
+            func.coalesce(func.sum(progress.tasks_blocked), 0).label("tasks_blocked"),
+        )
+        .select_from(
+            projects_table.outerjoin(
+                project_progress_table, progress.project_id == projects_table.c.id
+            )
+        )
+        .where(projects_table.c.goal_id == goal_id)
+        .lateral("work")
+    )
+
+
+def goal_overview_query(
+    limit: int, partitions: list[bool], after: GoalCursor | None
+) -> Select[Any]:
+    """Build the overview statement for up to `limit` goals of the given partitions.
+
+    Args:
+        limit: Maximum number of goals
+        partitions: Non-empty list of `is_done` values to read, in page order
+        after: Cursor of the last goal on the previous page (None for the first page)
+    """
+    selects = [_partition(done, after, limit) for done in partitions]
+    page = (selects[0] if len(selects) == 1 else union_all(*selects)).subquery("goal")
+    counts, upcoming, work = _milestone_counts(page), _next_milestone(page), work_totals(page.c.id)
+    return (
+        select(page, counts, upcoming, work)
+        .select_from(page.join(counts, true()).outerjoin(upcoming, true()).join(work, true()))
+        .order_by(page.c.is_done, page.c.date_updated.desc(), page.c.id.desc())
+        .limit(limit)
+    )
+
+
+def _to_overview(row: Row[Any]) -> GoalOverview:
+    data = row._mapping
+    upcoming = None
+    if data["next_id"] is not None:
+        upcoming = NextMilestone(
+            id=data["next_id"],
+            title=data["next_title"],
+            due=data["next_due"],
+            status=data["next_status"],
+            blocking=data["next_blocking"],
+        )
+    task_count, tasks_done = data["task_count"], data["tasks_done"]
+    return GoalOverview(
+        id=data["id"],
+        title=data["title"],
+        is_done=data["is_done"],
+        date_created=data["date_created"],
+        date_updated=data["date_updated"],
+        milestones=MilestoneCounts(*(data[name] for name in MILESTONE_STATUSES)),
+        next_milestone=upcoming,
+        project_count=data["project_count"],
+        task_count=task_count,
+        tasks_done=tasks_done,
+        task_completion=tasks_done / task_count if task_count else None,
+    )
+
+
+async def list_goal_overviews(
+    engine: AsyncEngine, limit: int, after: GoalCursor | None = None, is_done: bool | None = None
+) -> tuple[list[GoalOverview], GoalCursor | None]:
+    """List one keyset page of goal overviews in `GET /api/goals` order.
+
+    Args:
+        engine: Database engine
+        limit: Maximum number of goals to return
+        after: Cursor of the last goal on the previous page (None for the first page)
+        is_done: Optional completion status filter
+
+    Returns:
+        Overviews of the page and the cursor of the next page (None on the last page)
+    """
+    partitions = _partitions(after, is_done)
+    if not partitions:
+        return [], None
+    async with engine.connect() as conn:
+        result = await conn.execute(goal_overview_query(limit + 1, partitions, after))
+        overviews = [_to_overview(row) for row in result.all()]
+
+    page = overviews[:limit]
+    if len(overviews) <= limit:
+        return page, None
+    last = page[-1]
+    return page, GoalCursor(is_done=last.is_done, date_updated=last.date_updated, id=last.id)
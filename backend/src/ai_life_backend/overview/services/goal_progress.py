@@ -0,0 +1,64 @@
+"""Goal progress from the rollup rows: no scan over milestones or tasks.
+
+Milestone counters are the goal's `goal_progress` row; task counters are the sum of
+the `project_progress` rows of its projects. Both rollups are written in the same
+transaction as the milestone and task writes they count; `ROLLUPS` lists them for
+`scripts/rebuild_rollups.py`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Select, func, select, true
+
+from ai_life_backend.goals.repository.postgres_goal_repository import goals_table
+from ai_life_backend.milestones.repository.postgres_milestone_repository import (
+    goal_progress,
+    goal_progress_table,
+)
+from ai_life_backend.overview.domain import GoalProgressSummary
+from ai_life_backend.overview.services.goal_overview import work_totals
+from ai_life_backend.projects.repository.postgres_task_repository import project_progress
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from ai_life_backend.core.public import StatusRollup
+
+# Every progress rollup table, by table name
+ROLLUPS: dict[str, StatusRollup] = {
+    "goal_progress": goal_progress,
+    "project_progress": project_progress,
+}
+
+
+def goal_progress_query(goal_id: UUID) -> Select[Any]:
+    """Select the counters of one goal; no row when the goal does not exist."""
+    progress = goal_progress_table.c
+    work = work_totals(goals_table.c.id)
+    return (
+        select(
+            goals_table.c.id.label("goal_id"),
+            func.coalesce(progress.milestone_count, 0).label("milestone_count"),
+            func.coalesce(progress.milestones_done, 0).label("milestones_done"),
+            func.coalesce(progress.milestones_blocked, 0).label("milestones_blocked"),
+            work,
+        )
+        .select_from(
+            goals_table.outerjoin(goal_progress_table, progress.goal_id == goals_table.c.id).join(
+                work, true()
+            )
+        )
+        .where(goals_table.c.id == goal_id)
+    )
+
+
+async def get_goal_progress(engine: AsyncEngine, goal_id: UUID) -> GoalProgressSummary | None:
+    """Read a goal's milestone and task counters, or None if the goal does not exist."""
+    async with engine.connect() as conn:
+        result = await conn.execute(goal_progress_query(goal_id))
+        row = result.one_or_none()
+    return None if row is None else GoalProgressSummary(**row._mapping)
@@ -1,44 +1,64 @@
 """FastAPI routers for Projects and Tasks API."""
 
+from collections.abc import AsyncIterator
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
 
+from ai_life_backend.container import get_container
+from ai_life_backend.core.public import (
+    BatchConflictError,
+    BatchRejectedError,
+    trusted_json_response,
+)
 from ai_life_backend.projects.api.schemas import (
+    BatchItemStatus,
     ProjectCreate,
+    ProjectProgressResponse,
     ProjectResponse,
+    ProjectScheduleResponse,
+    NextTasksResponse,
     ProjectUpdate,
+    TaskBatchRequest,
+    TaskBatchResponse,
+    TaskBatchResult,
     TaskCreate,
     TaskResponse,
+    TaskSuggestionResponse,
     TaskUpdate,
+    closure_entry_adapter,
+    task_list_adapter,
 )
-from ai_life_backend.projects.repository.in_memory_project_repository import (
-    InMemoryProjectRepository,
+from ai_life_backend.projects.domain.closure import ClosureDirection, TaskClosureEntry
+from ai_life_backend.projects.domain.task import TaskEnergy
+from ai_life_backend.projects.repository.postgres_project_repository import (
+    PostgresProjectRepository,
 )
-from ai_life_backend.projects.repository.in_memory_task_repository import (
-    InMemoryTaskRepository,
+from ai_life_backend.projects.repository.postgres_task_repository import (
+    PostgresTaskRepository,
 )
 from ai_life_backend.projects.services.dag_validator import (
-    DagValidator,
     CycleDetectedError,
+    DagValidator,
 )
+from ai_life_backend.projects.services.next_task import NextTaskQuery, NextTaskScheduler
+from ai_life_backend.projects.services.schedule import ProjectScheduler
+from ai_life_backend.projects.services.task_batch import batch_scope, plan_task_batch
 
-# Temporary in-memory storage for MVP
-# TODO: Replace with proper DI and PostgreSQL repos once migrations are ready
-_project_repo = InMemoryProjectRepository()
-_task_repo = InMemoryTaskRepository()
 _dag_validator = DagValidator()
 
 
-def get_project_repository() -> InMemoryProjectRepository:
+def get_project_repository() -> PostgresProjectRepository:
     """Dependency for project repository."""
-    return _project_repo
+    return get_container().projects
 
 
-def get_task_repository() -> InMemoryTaskRepository:
+def get_task_repository() -> PostgresTaskRepository:
     """Dependency for task repository."""
-    return _task_repo
+    return get_container().tasks
 
 
 def get_dag_validator() -> DagValidator:
@@ -46,35 +66,40 @@ def get_dag_validator() -> DagValidator:
     return _dag_validator
 
 
-ProjectRepoDep = Annotated[InMemoryProjectRepository, Depends(get_project_repository)]
-TaskRepoDep = Annotated[InMemoryTaskRepository, Depends(get_task_repository)]
+def get_scheduler() -> ProjectScheduler:
+    """Dependency for the project scheduler."""
+    return get_container().scheduler
+
+
+def get_next_task_scheduler() -> NextTaskScheduler:
+    """Dependency for the next-task scheduler."""
+    return get_container().next_tasks
+
+
+ProjectRepoDep = Annotated[PostgresProjectRepository, Depends(get_project_repository)]
+TaskRepoDep = Annotated[PostgresTaskRepository, Depends(get_task_repository)]
 DagValidatorDep = Annotated[DagValidator, Depends(get_dag_validator)]
+SchedulerDep = Annotated[ProjectScheduler, Depends(get_scheduler)]
+NextTaskSchedulerDep = Annotated[NextTaskScheduler, Depends(get_next_task_scheduler)]
+ClosureDepth = Annotated[int, Query(ge=1, le=100)]
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+_CLOSURE_RESPONSES: dict[int | str, dict[str, object]] = {
+    200: {"description": "NDJSON, one closure entry per line", "content": {NDJSON_MEDIA_TYPE: {}}}
+}
 
 # Projects router
 projects_router = APIRouter(prefix="/projects", tags=["projects"])
 
 
 @projects_router.post("", response_model=ProjectResponse, status_code=201)
-async def create_project(
-    request: ProjectCreate,
-    repo: ProjectRepoDep,
-    validator: DagValidatorDep,
-) -> ProjectResponse:
-    """Create a new project."""
-    try:
-        # Validate dependencies form DAG if provided
-        if request.dependencies:
-            # Build dependency graph including the new project
-            all_projects = await repo.list_all()
-            graph = {p.id: list(p.dependencies) for p in all_projects}
-            # Add new project's dependencies to graph for validation
-            # (using a temporary ID for validation)
-            from uuid import uuid4
-
-            temp_id = uuid4()
-            graph[temp_id] = request.dependencies
-            validator.validate(graph)
+async def create_project(request: ProjectCreate, repo: ProjectRepoDep) -> ProjectResponse:
+    """Create a new project.
 
+    A new project has no dependents yet, so its dependencies cannot close a cycle;
+    only their existence is checked (by the repository).
+    """
+    try:
         project = await repo.create(
             goal_id=request.goal_id,
             title=request.title,
@@ -88,8 +113,6 @@ async def create_project(
         return ProjectResponse.model_validate(project)
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e)) from e
-    except CycleDetectedError as e:
-        raise HTTPException(status_code=422, detail=str(e)) from e
 
 
 @projects_router.get("", response_model=list[ProjectResponse])
@@ -108,26 +131,44 @@ async def get_project(project_id: UUID, repo: ProjectRepoDep) -> ProjectResponse
     return ProjectResponse.model_validate(project)
 
 
+@projects_router.get("/{project_id}/progress", response_model=ProjectProgressResponse)
+async def get_project_progress(
+    project_id: UUID, tasks: TaskRepoDep, projects: ProjectRepoDep
+) -> ProjectProgressResponse:
+    """Get a project's task counters from its rollup row (no scan over its tasks)."""
+    progress = await tasks.get_progress(project_id)
+    if progress.task_count == 0 and await projects.get_by_id(project_id) is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return ProjectProgressResponse.model_validate(progress)
+
+
+@projects_router.get("/{project_id}/schedule", response_model=ProjectScheduleResponse)
+async def get_project_schedule(
+    project_id: UUID, scheduler: SchedulerDep, projects: ProjectRepoDep
+) -> ProjectScheduleResponse:
+    """Get a project's critical path and per-task earliest/latest start and slack.
+
+    Computed in linear time over the task DAG and cached per project until a task's
+    status, dependencies or size change.
+    """
+    schedule = await scheduler.get(project_id)
+    if not schedule.tasks and await projects.get_by_id(project_id) is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return ProjectScheduleResponse.model_validate(schedule)
+
+
 @projects_router.put("/{project_id}", response_model=ProjectResponse)
 async def update_project(
     project_id: UUID,
     request: ProjectUpdate,
     repo: ProjectRepoDep,
-    validator: DagValidatorDep,
 ) -> ProjectResponse:
-    """Update a project."""
-    try:
-        # Validate dependencies if being updated
-        if request.dependencies is not None:
-            all_projects = await repo.list_all()
-            graph = {
-                p.id: (
-                    list(request.dependencies) if p.id == project_id else list(p.dependencies)
-                )
-                for p in all_projects
-            }
-            validator.validate(graph)
+    """Update a project.
 
+    New dependencies are checked for existence and cycles inside the update
+    transaction; the cycle check only reads the region they reach.
+    """
+    try:
         project = await repo.update(
             project_id=project_id,
             title=request.title,
@@ -149,7 +190,17 @@ async def update_project(
 
 @projects_router.delete("/{project_id}", status_code=204)
 async def delete_project(project_id: UUID, repo: ProjectRepoDep) -> None:
-    """Delete a project."""
+    """Delete a project.
+
+    Deletion is blocked (409) while other projects still depend on it.
+    """
+    dependents = await repo.list_dependents(project_id)
+    if dependents:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Project is a dependency of {len(dependents)} other project(s); "
+            "remove those links first",
+        )
     deleted = await repo.delete(project_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -160,34 +211,14 @@ tasks_router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
 @tasks_router.post("", response_model=TaskResponse, status_code=201)
-async def create_task(
-    request: TaskCreate,
-    repo: TaskRepoDep,
-    validator: DagValidatorDep,
-) -> TaskResponse:
-    """Create a new task."""
-    try:
-        # Validate dependencies form DAG if provided
-        if request.dependencies:
-            # Get all tasks for the same project
-            project_tasks = await repo.list_by_project(request.project_id)
-            graph = {t.id: list(t.dependencies) for t in project_tasks}
-            # Add new task's dependencies to graph for validation
-            from uuid import uuid4
-
-            temp_id = uuid4()
-            graph[temp_id] = request.dependencies
-
-            # Validate that dependencies are within the same project
-            for dep_id in request.dependencies:
-                dep_task = await repo.get_by_id(dep_id)
-                if not dep_task:
-                    raise ValueError(f"Dependency task {dep_id} not found")
-                if dep_task.project_id != request.project_id:
-                    raise ValueError("Task dependencies must be within the same project")
-
-            validator.validate(graph)
+async def create_task(request: TaskCreate, repo: TaskRepoDep) -> TaskResponse:
+    """Create a new task.
 
+    A new task has no dependents yet, so its dependencies cannot close a cycle;
+    the repository validates their existence and same-project scope with one
+    set-based lookup inside the insert transaction (422 on failure).
+    """
+    try:
         task = await repo.create(
             project_id=request.project_id,
             title=request.title,
@@ -203,15 +234,114 @@ async def create_task(
         return TaskResponse.model_validate(task)
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e)) from e
-    except CycleDetectedError as e:
-        raise HTTPException(status_code=422, detail=str(e)) from e
+
+
+_BATCH_STATUS: dict[str, BatchItemStatus] = {
+    "create": "created",
+    "update": "updated",
+    "delete": "deleted",
+}
+
+
+def _rejected_batch(request: TaskBatchRequest, errors: dict[int, str]) -> TaskBatchResponse:
+    """Report every item of a rejected batch: its problem, or that it was skipped."""
+    return TaskBatchResponse(
+        applied=False,
+        results=[
+            TaskBatchResult(
+                index=index,
+                op=item.op,
+                status="rejected" if index in errors else "skipped",
+                error=errors.get(index),
+            )
+            for index, item in enumerate(request.items)
+        ],
+    )
+
+
+@tasks_router.post(
+    ":batch",
+    response_model=TaskBatchResponse,
+    responses={
+        409: {
+            "model": TaskBatchResponse,
+            "description": "A targeted task or project changed meanwhile",
+        },
+        422: {"model": TaskBatchResponse, "description": "Batch rejected; nothing written"},
+    },
+)
+async def apply_task_batch(
+    request: TaskBatchRequest,
+    repo: TaskRepoDep,
+    projects: ProjectRepoDep,
+    validator: DagValidatorDep,
+    response: Response,
+) -> TaskBatchResponse:
+    """Create, update and delete tasks in one all-or-nothing transaction.
+
+    Items are validated against the state the whole batch leaves behind (so they may
+    depend on tasks created by other items) and the combined dependency graph is
+    checked for cycles once. If any item is invalid nothing is written and every
+    item is reported as rejected or skipped.
+    """
+    items = [item.to_domain() for item in request.items]
+    project_ids, task_ids = batch_scope(items)
+    snapshot = await repo.list_related(list(project_ids), list(task_ids))
+    known = {project.id for project in await projects.get_many(list(project_ids))}
+    try:
+        plan = plan_task_batch(items, {t.id: t for t in snapshot}, known, validator)
+        written = await repo.apply_batch(plan)
+    except BatchRejectedError as e:
+        response.status_code = 409 if isinstance(e, BatchConflictError) else 422
+        return _rejected_batch(request, e.errors)
+    except IntegrityError as e:
+        raise HTTPException(
+            status_code=409, detail="Batch conflicts with a concurrent change; retry"
+        ) from e
+    return TaskBatchResponse(
+        applied=True,
+        results=[
+            TaskBatchResult(
+                index=index,
+                op=item.op,
+                status=_BATCH_STATUS[item.op],
+                task=TaskResponse.model_validate(written[index]),
+            )
+            for index, item in enumerate(request.items)
+        ],
+    )
 
 
 @tasks_router.get("", response_model=list[TaskResponse])
-async def list_tasks(repo: TaskRepoDep) -> list[TaskResponse]:
-    """List all tasks."""
-    tasks = await repo.list_all()
-    return [TaskResponse.model_validate(t) for t in tasks]
+async def list_tasks(repo: TaskRepoDep) -> Response:
+    """List all tasks, serialized from the domain objects without re-validation."""
+    return trusted_json_response(task_list_adapter, await repo.list_all())
+
+
+@tasks_router.get("/unblocked", response_model=list[TaskResponse])
+async def list_unblocked_tasks(repo: TaskRepoDep, project_id: UUID | None = None) -> Response:
+    """List ready-to-work tasks: not done, and every dependency is done."""
+    return trusted_json_response(task_list_adapter, await repo.list_unblocked(project_id))
+
+
+@tasks_router.get("/next", response_model=NextTasksResponse)
+async def suggest_next_tasks(
+    energy: TaskEnergy,
+    budget: Annotated[int, Query(ge=1, le=1000)],
+    next_tasks: NextTaskSchedulerDep,
+    limit: Annotated[int, Query(ge=1, le=50)] = 5,
+) -> NextTasksResponse:
+    """Suggest what to work on next with the available energy and effort budget.
+
+    Ready tasks that need no more than `energy` are ranked by project priority,
+    schedule slack, energy match and continuity, and taken greedily while they fit
+    the `budget` (effort units: XS=1, S=2, M=3, L=5, XL=8).
+    """
+    suggestions = await next_tasks.suggest(NextTaskQuery(energy, budget, limit))
+    return NextTasksResponse(
+        suggestions=[TaskSuggestionResponse.model_validate(s) for s in suggestions],
+        budget_left=budget - sum(s.effort for s in suggestions),
+    )
 
 
 @tasks_router.get("/{task_id}", response_model=TaskResponse)
@@ -223,40 +353,61 @@ async def get_task(task_id: UUID, repo: TaskRepoDep) -> TaskResponse:
     return TaskResponse.model_validate(task)
 
 
+async def _closure_lines(batches: AsyncIterator[list[TaskClosureEntry]]) -> AsyncIterator[bytes]:
+    """Encode each batch of closure entries as one chunk of NDJSON lines."""
+    async for batch in batches:
+        yield b"".join(closure_entry_adapter.dump_json(entry) + b"\n" for entry in batch)
+
+
+async def _stream_closure(
+    repo: PostgresTaskRepository, task_id: UUID, direction: ClosureDirection, depth: int
+) -> StreamingResponse:
+    """Stream the closure of an existing task as NDJSON, dependencies first."""
+    if not await repo.get_by_id(task_id):
+        raise HTTPException(status_code=404, detail="Task not found")
+    batches = repo.stream_closure(task_id, direction, depth)
+    return StreamingResponse(_closure_lines(batches), media_type=NDJSON_MEDIA_TYPE)
+
+
+@tasks_router.get(
+    "/{task_id}/upstream", response_class=StreamingResponse, responses=_CLOSURE_RESPONSES
+)
+async def list_upstream_tasks(
+    task_id: UUID, repo: TaskRepoDep, depth: ClosureDepth = 10
+) -> StreamingResponse:
+    """Stream the tasks this task transitively depends on, up to `depth` edges away.
+
+    Each line is `{"task": ..., "depth": n}` with the fewest edges to the task; lines
+    come in topological order, so every task follows all of its listed dependencies.
+    """
+    return await _stream_closure(repo, task_id, "upstream", depth)
+
+
+@tasks_router.get(
+    "/{task_id}/downstream", response_class=StreamingResponse, responses=_CLOSURE_RESPONSES
+)
+async def list_downstream_tasks(
+    task_id: UUID, repo: TaskRepoDep, depth: ClosureDepth = 10
+) -> StreamingResponse:
+    """Stream the tasks that transitively depend on this task, up to `depth` edges away.
+
+    Same line format and topological order as the upstream closure.
+    """
+    return await _stream_closure(repo, task_id, "downstream", depth)
+
+
 @tasks_router.put("/{task_id}", response_model=TaskResponse)
 async def update_task(
     task_id: UUID,
     request: TaskUpdate,
     repo: TaskRepoDep,
-    validator: DagValidatorDep,
 ) -> TaskResponse:
-    """Update a task."""
-    try:
-        # Get existing task to check project_id
-        existing_task = await repo.get_by_id(task_id)
-        if not existing_task:
-            raise HTTPException(status_code=404, detail="Task not found")
-
-        # Validate dependencies if being updated
-        if request.dependencies is not None:
-            # Validate dependencies are within same project
-            for dep_id in request.dependencies:
-                dep_task = await repo.get_by_id(dep_id)
-                if not dep_task:
-                    raise ValueError(f"Dependency task {dep_id} not found")
-                if dep_task.project_id != existing_task.project_id:
-                    raise ValueError("Task dependencies must be within the same project")
-
-            # Validate DAG
-            project_tasks = await repo.list_by_project(existing_task.project_id)
-            graph = {
-                t.id: (
-                    list(request.dependencies) if t.id == task_id else list(t.dependencies)
-                )
-                for t in project_tasks
-            }
-            validator.validate(graph)
+    """Update a task.
 
+    New dependencies are validated (existence, same project, no cycle) by the
+    repository inside the update transaction; failures are 422.
+    """
+    try:
         task = await repo.update(
             task_id=task_id,
             title=request.title,
@@ -280,7 +431,17 @@ async def update_task(
 
 @tasks_router.delete("/{task_id}", status_code=204)
 async def delete_task(task_id: UUID, repo: TaskRepoDep) -> None:
-    """Delete a task."""
+    """Delete a task.
+
+    Deletion is blocked (409) while other tasks still depend on it.
+    """
+    dependents = await repo.list_dependents(task_id)
+    if dependents:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Task is a dependency of {len(dependents)} other task(s); "
+            "remove those links first",
+        )
     deleted = await repo.delete(task_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -1,17 +1,28 @@
 """Pydantic schemas for Projects and Tasks API."""
 
 from datetime import datetime
+from typing import Annotated, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
+from ai_life_backend.core.public import MAX_BATCH_ITEMS
+
+from ai_life_backend.projects.domain.closure import TaskClosureEntry
 from ai_life_backend.projects.domain.project import ProjectPriority, ProjectRisk
 from ai_life_backend.projects.domain.task import (
+    CreateTaskInput,
+    Task,
+    TaskBatchCreate,
+    TaskBatchDelete,
+    TaskBatchItem,
+    TaskBatchUpdate,
     TaskSize,
     TaskEnergy,
     TaskContinuity,
     TaskClarity,
     TaskRisk,
+    UpdateTaskInput,
 )
 
 
@@ -139,3 +150,162 @@ class TaskResponse(BaseModel):
     date_updated: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ProjectProgressResponse(BaseModel):
+    """Task counters of a project; `completion` is null while it has no tasks."""
+
+    project_id: UUID
+    task_count: int
+    tasks_done: int
+    tasks_blocked: int
+    completion: float | None
+
+    model_config = {"from_attributes": True}
+
+
+class TaskScheduleResponse(BaseModel):
+    """Critical-path metrics of one task, in effort units (XS=1, S=2, M=3, L=5, XL=8)."""
+
+    task_id: UUID
+    effort: int
+    earliest_start: int
+    earliest_finish: int
+    latest_start: int
+    latest_finish: int
+    slack: int
+    critical: bool
+
+    model_config = {"from_attributes": True}
+
+
+class ProjectScheduleResponse(BaseModel):
+    """Schedule of a project; `tasks` are in topological order (dependencies first)."""
+
+    project_id: UUID
+    duration: int
+    critical_path: list[UUID]
+    tasks: list[TaskScheduleResponse]
+
+    model_config = {"from_attributes": True}
+
+
+class TaskSuggestionResponse(BaseModel):
+    """A proposed next task with the facts it was ranked by."""
+
+    task: TaskResponse
+    project_priority: ProjectPriority
+    effort: int
+    slack: int
+
+    model_config = {"from_attributes": True}
+
+
+class NextTasksResponse(BaseModel):
+    """Next tasks in suggested order and the effort budget they leave."""
+
+    suggestions: list[TaskSuggestionResponse]
+    budget_left: int
+
+
+# Wire shape of list[TaskResponse], serialized straight from domain tasks
+task_list_adapter = TypeAdapter(list[Task])
+
+# One NDJSON line of a dependency closure stream: {"task": TaskResponse, "depth": int}
+closure_entry_adapter = TypeAdapter(TaskClosureEntry)
+
+
+# Task batch schemas
+BatchOp = Literal["create", "update", "delete"]
+BatchItemStatus = Literal["created", "updated", "deleted", "rejected", "skipped"]
+
+
+class TaskBatchCreateItem(TaskCreate):
+    """Batch item creating a task.
+
+    An optional client-chosen `id` lets other items of the batch depend on it.
+    """
+
+    op: Literal["create"]
+    id: UUID | None = None
+
+    def to_domain(self) -> TaskBatchItem:
+        """Convert to the domain batch item."""
+        return TaskBatchCreate(
+            id=self.id,
+            data=CreateTaskInput(
+                project_id=self.project_id,
+                title=self.title,
+                status=self.status,
+                dependencies=self.dependencies,
+                size=self.size,
+                energy=self.energy,
+                continuity=self.continuity,
+                clarity=self.clarity,
+                risk=self.risk,
+                context=self.context,
+            ),
+        )
+
+
+class TaskBatchUpdateItem(TaskUpdate):
+    """Batch item updating a task."""
+
+    op: Literal["update"]
+    id: UUID
+
+    def to_domain(self) -> TaskBatchItem:
+        """Convert to the domain batch item."""
+        return TaskBatchUpdate(
+            id=self.id,
+            data=UpdateTaskInput(
+                title=self.title,
+                status=self.status,
+                dependencies=self.dependencies,
+                size=self.size,
+                energy=self.energy,
+                continuity=self.continuity,
+                clarity=self.clarity,
+                risk=self.risk,
+                context=self.context,
+            ),
+        )
+
+
+class TaskBatchDeleteItem(BaseModel):
+    """Batch item deleting a task."""
+
+    op: Literal["delete"]
+    id: UUID
+
+    def to_domain(self) -> TaskBatchItem:
+        """Convert to the domain batch item."""
+        return TaskBatchDelete(id=self.id)
+
+
+class TaskBatchRequest(BaseModel):
+    """Schema for an all-or-nothing batch of task writes, applied in order."""
+
+    items: list[
+        Annotated[
+            TaskBatchCreateItem | TaskBatchUpdateItem | TaskBatchDeleteItem,
+            Field(discriminator="op"),
+        ]
+    ] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class TaskBatchResult(BaseModel):
+    """Outcome of one batch item; `task` is the written (or deleted) task."""
+
+    index: int
+    op: BatchOp
+    status: BatchItemStatus
+    task: TaskResponse | None = None
+    error: str | None = None
+
+
+class TaskBatchResponse(BaseModel):
+    """Schema for a batch response; `applied` is false when nothing was written."""
+
+    applied: bool
+    results: list[TaskBatchResult]
@@ -1,6 +1,9 @@
 """Domain entities for projects module."""
 
+from ai_life_backend.projects.domain.closure import ClosureDirection, TaskClosureEntry
+from ai_life_backend.projects.domain.progress import ProjectProgress
 from ai_life_backend.projects.domain.project import Project, ProjectPriority, ProjectRisk
+from ai_life_backend.projects.domain.schedule import ProjectSchedule, TaskSchedule, TaskSuggestion
 from ai_life_backend.projects.domain.task import (
     Task,
     TaskSize,
@@ -11,10 +14,16 @@ from ai_life_backend.projects.domain.task import (
 )
 
 __all__ = [
+    "ClosureDirection",
     "Project",
     "ProjectPriority",
+    "ProjectProgress",
     "ProjectRisk",
+    "ProjectSchedule",
     "Task",
+    "TaskClosureEntry",
+    "TaskSchedule",
+    "TaskSuggestion",
     "TaskSize",
     "TaskEnergy",
     "TaskContinuity",
@@ -0,0 +1,23 @@
+"""Transitive dependency closure read model."""
+
+from dataclasses import dataclass
+from typing import Literal
+
+from ai_life_backend.projects.domain.task import Task
+
+# upstream: everything the task (transitively) depends on;
+# downstream: everything that (transitively) depends on the task
+ClosureDirection = Literal["upstream", "downstream"]
+
+
+@dataclass(frozen=True, slots=True)
+class TaskClosureEntry:
+    """One task of a dependency closure.
+
+    Attributes:
+        task: The reached task
+        depth: Fewest dependency edges between the starting task and this one (>= 1)
+    """
+
+    task: Task
+    depth: int
@@ -0,0 +1,26 @@
+"""Project progress read model (task counters kept in `project_progress`)."""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectProgress:
+    """Task counters of one project.
+
+    Attributes:
+        project_id: Project identifier
+        task_count: Number of tasks in the project
+        tasks_done: Number of those tasks that are done
+        tasks_blocked: Number of those tasks that are blocked
+    """
+
+    project_id: UUID
+    task_count: int = 0
+    tasks_done: int = 0
+    tasks_blocked: int = 0
+
+    @property
+    def completion(self) -> float | None:
+        """Share of done tasks, or None when the project has no tasks."""
+        return self.tasks_done / self.task_count if self.task_count else None
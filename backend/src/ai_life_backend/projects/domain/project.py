@@ -25,7 +25,7 @@ class ProjectRisk(str, Enum):
     RED = "red"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Project:
     """Immutable domain entity representing a project.
 
@@ -0,0 +1,69 @@
+"""Schedule read models: critical-path metrics and next-task suggestions."""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from ai_life_backend.projects.domain.project import ProjectPriority
+from ai_life_backend.projects.domain.task import Task
+
+
+@dataclass(frozen=True, slots=True)
+class TaskSchedule:
+    """Schedule metrics of one task, in effort units from the project start.
+
+    Attributes:
+        task_id: Task identifier
+        effort: Remaining effort (0 once the task is done)
+        earliest_start: Largest `earliest_finish` among its dependencies (0 without any)
+        earliest_finish: `earliest_start + effort`
+        latest_start: Latest start that does not delay the project
+        latest_finish: `latest_start + effort`
+        slack: `latest_start - earliest_start`; 0 on the critical path
+    """
+
+    task_id: UUID
+    effort: int
+    earliest_start: int
+    earliest_finish: int
+    latest_start: int
+    latest_finish: int
+    slack: int
+
+    @property
+    def critical(self) -> bool:
+        """True if any delay of this task delays the whole project."""
+        return self.slack == 0
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectSchedule:
+    """Critical-path schedule of one project.
+
+    Attributes:
+        project_id: Project identifier
+        duration: Remaining effort along the longest dependency chain
+        critical_path: Task IDs of one longest chain, dependencies first
+        tasks: Metrics per task, in topological order (dependencies first)
+    """
+
+    project_id: UUID
+    duration: int
+    critical_path: tuple[UUID, ...]
+    tasks: tuple[TaskSchedule, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class TaskSuggestion:
+    """A ready task proposed by the next-task scheduler.
+
+    Attributes:
+        task: The proposed task (not done, every dependency done)
+        project_priority: Priority of the task's project
+        effort: Effort units the task takes from the budget
+        slack: Schedule slack of the task; 0 on its project's critical path
+    """
+
+    task: Task
+    project_priority: ProjectPriority
+    effort: int
+    slack: int
@@ -1,8 +1,9 @@
 """Task domain entity."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from typing import Any
 from uuid import UUID
 
 MAX_TITLE_LENGTH = 255
@@ -50,7 +51,7 @@ class TaskRisk(str, Enum):
     RED = "red"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Task:
     """Immutable domain entity representing a task.
 
@@ -95,3 +96,66 @@ class Task:
         if not self.title.strip():
             msg = "Title cannot be empty"
             raise ValueError(msg)
+
+
+@dataclass(frozen=True, slots=True)
+class CreateTaskInput:
+    """Input for creating a task."""
+
+    project_id: UUID
+    title: str
+    size: TaskSize
+    energy: TaskEnergy
+    continuity: TaskContinuity
+    clarity: TaskClarity
+    risk: TaskRisk
+    status: str = "todo"
+    dependencies: list[UUID] = field(default_factory=list)
+    context: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class UpdateTaskInput:
+    """Input for updating a task; None leaves a field unchanged."""
+
+    title: str | None = None
+    status: str | None = None
+    dependencies: list[UUID] | None = None
+    size: TaskSize | None = None
+    energy: TaskEnergy | None = None
+    continuity: TaskContinuity | None = None
+    clarity: TaskClarity | None = None
+    risk: TaskRisk | None = None
+    context: str | None = None
+
+    def changes(self) -> dict[str, Any]:
+        """Return the provided fields only."""
+        return {
+            name: value for name in self.__slots__ if (value := getattr(self, name)) is not None
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class TaskBatchCreate:
+    """Batch item creating a task; a client-chosen `id` lets other items depend on it."""
+
+    data: CreateTaskInput
+    id: UUID | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TaskBatchUpdate:
+    """Batch item updating an existing task."""
+
+    id: UUID
+    data: UpdateTaskInput
+
+
+@dataclass(frozen=True, slots=True)
+class TaskBatchDelete:
+    """Batch item deleting an existing task."""
+
+    id: UUID
+
+
+TaskBatchItem = TaskBatchCreate | TaskBatchUpdate | TaskBatchDelete
@@ -7,19 +7,34 @@ Consumers should only import from this module using the import_hint:
 For HTTP access, use the REST API endpoints defined in the OpenAPI contract.
 """
 
-from ai_life_backend.projects.api.routes import projects_router, tasks_router
+from fastapi import APIRouter
+
+from ai_life_backend.core.public import make_public_router
+from ai_life_backend.projects.api.routes import (
+    projects_router as _internal_projects_router,
+    tasks_router as _internal_tasks_router,
+)
 from ai_life_backend.projects.domain import (
     Project,
     ProjectPriority,
+    ProjectProgress,
     ProjectRisk,
+    ProjectSchedule,
     Task,
+    TaskClosureEntry,
+    TaskSchedule,
     TaskSize,
+    TaskSuggestion,
     TaskEnergy,
     TaskContinuity,
     TaskClarity,
     TaskRisk,
 )
 
+# ---------- HTTP public surface (routers) ----------
+projects_router: APIRouter = make_public_router(_internal_projects_router)
+tasks_router: APIRouter = make_public_router(_internal_tasks_router)
+
 __all__ = [
     # API routers
     "projects_router",
@@ -27,8 +42,13 @@ __all__ = [
     # Domain entities
     "Project",
     "ProjectPriority",
+    "ProjectProgress",
     "ProjectRisk",
+    "ProjectSchedule",
     "Task",
+    "TaskClosureEntry",
+    "TaskSchedule",
+    "TaskSuggestion",
     "TaskSize",
     "TaskEnergy",
     "TaskContinuity",
@@ -1,10 +1,23 @@
 """Repository layer for projects module."""
 
+from ai_life_backend.projects.repository.cached_task_repository import CachedTaskRepository
 from ai_life_backend.projects.repository.in_memory_project_repository import (
     InMemoryProjectRepository,
 )
 from ai_life_backend.projects.repository.in_memory_task_repository import (
     InMemoryTaskRepository,
 )
+from ai_life_backend.projects.repository.postgres_project_repository import (
+    PostgresProjectRepository,
+)
+from ai_life_backend.projects.repository.postgres_task_repository import (
+    PostgresTaskRepository,
+)
 
-__all__ = ["InMemoryProjectRepository", "InMemoryTaskRepository"]
+__all__ = [
+    "CachedTaskRepository",
+    "InMemoryProjectRepository",
+    "InMemoryTaskRepository",
+    "PostgresProjectRepository",
+    "PostgresTaskRepository",
+]
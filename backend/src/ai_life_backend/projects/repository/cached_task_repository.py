@@ -0,0 +1,97 @@
+"""TaskRepository that drops cached project schedules on schedule-relevant writes."""
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ai_life_backend.core.public import ReadThroughCache
+from ai_life_backend.projects.domain.task import (
+    Task,
+    TaskClarity,
+    TaskContinuity,
+    TaskEnergy,
+    TaskRisk,
+    TaskSize,
+)
+from ai_life_backend.projects.services.schedule import schedule_key
+from ai_life_backend.projects.services.task_batch import TaskBatchPlan
+
+from .postgres_task_repository import PostgresTaskRepository
+
+
+class CachedTaskRepository(PostgresTaskRepository):
+    """PostgresTaskRepository that keeps `ProjectScheduler` results current.
+
+    Task reads are not cached. Creates, deletes and updates of a task's status,
+    dependencies or size invalidate the schedule of its project; title, context and
+    other attribute changes leave it cached.
+    """
+
+    def __init__(self, engine: AsyncEngine, cache: ReadThroughCache) -> None:
+        """Initialize repository with database engine and shared cache."""
+        super().__init__(engine)
+        self._cache = cache
+
+    async def create(
+        self,
+        project_id: UUID,
+        title: str,
+        status: str,
+        dependencies: list[UUID],
+        size: TaskSize,
+        energy: TaskEnergy,
+        continuity: TaskContinuity,
+        clarity: TaskClarity,
+        risk: TaskRisk,
+        context: str,
+    ) -> Task:
+        """Create a new task and invalidate its project's schedule."""
+        task = await super().create(
+            project_id,
+            title,
+            status,
+            dependencies,
+            size,
+            energy,
+            continuity,
+            clarity,
+            risk,
+            context,
+        )
+        await self._cache.invalidate(schedule_key(project_id))
+        return task
+
+    async def update(
+        self,
+        task_id: UUID,
+        title: str | None = None,
+        status: str | None = None,
+        dependencies: list[UUID] | None = None,
+        size: TaskSize | None = None,
+        energy: TaskEnergy | None = None,
+        continuity: TaskContinuity | None = None,
+        clarity: TaskClarity | None = None,
+        risk: TaskRisk | None = None,
+        context: str | None = None,
+    ) -> Task | None:
+        """Update a task; invalidate its project's schedule if the update can change it."""
+        task = await super().update(
+            task_id, title, status, dependencies, size, energy, continuity, clarity, risk, context
+        )
+        if task is not None and (status, dependencies, size) != (None, None, None):
+            await self._cache.invalidate(schedule_key(task.project_id))
+        return task
+
+    async def apply_batch(self, plan: TaskBatchPlan) -> dict[int, Task]:
+        """Apply a batch and invalidate the schedule of every project it touched."""
+        written = await super().apply_batch(plan)
+        await self._cache.invalidate(*map(schedule_key, plan.touched_project_ids()))
+        return written
+
+    async def delete(self, task_id: UUID) -> bool:
+        """Delete a task and invalidate its project's schedule."""
+        project_id = await self._delete(task_id)
+        if project_id is None:
+            return False
+        await self._cache.invalidate(schedule_key(project_id))
+        return True
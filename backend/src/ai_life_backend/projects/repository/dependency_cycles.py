@@ -0,0 +1,91 @@
+"""Cycle checks for dependency edits, run in the database as one recursive query.
+
+Assuming the stored graph is acyclic, replacing the dependencies of a node closes a
+cycle iff the node is reachable from one of its new dependencies. `cycle_query`
+walks the edge table from those dependencies with `WITH RECURSIVE`, so only the
+region they reach is read; the walk never expands the edited node itself, and
+the UNION keeps each (node, parent) pair once, so it is bounded by the edges of
+that region. An acyclic edit returns no rows.
+
+Writers take `lock_graph` before any row lock: row locks on the edited node and its
+new dependencies do not stop two edits that close a cycle through other nodes
+(a -> b and c -> d over existing paths b ~> c and d ~> a), since each walk misses
+the other's uncommitted edge. The advisory lock orders such edits, so under READ
+COMMITTED the later walk sees the earlier edge.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import cast, exists, func, null, select
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from ai_life_backend.database import uuid_array
+from ai_life_backend.projects.services.dag_validator import cycle_error
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlalchemy import Row, Select, Table
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+def cycle_query(edges: Table, source: UUID, targets: list[UUID]) -> Select[Any]:
+    """Select the walk from `targets` as (id, parent) rows if it reaches `source`.
+
+    Args:
+        edges: Edge table: the owner column, then `depends_on_id`
+        source: Node whose dependencies are being replaced
+        targets: New dependencies of `source`
+    """
+    owner = edges.c[0]
+    walk = select(
+        func.unnest(uuid_array(targets)).label("id"),
+        cast(null(), PG_UUID(as_uuid=True)).label("parent"),
+    ).cte("walk", recursive=True)
+    walk = walk.union(
+        select(edges.c.depends_on_id, walk.c.id)
+        .join(walk, owner == walk.c.id)
+        .where(walk.c.id != source)
+    )
+    hit = walk.alias("hit")
+    return select(walk.c.id, walk.c.parent).where(
+        exists(select(hit.c.id).where(hit.c.id == source))
+    )
+
+
+def cycle_path(source: UUID, rows: Iterable[Row[Any]]) -> list[UUID] | None:
+    """Rebuild `source -> dependency -> ... -> source` from `cycle_query` rows, or None."""
+    parents: dict[UUID, UUID | None] = {}
+    for row in rows:
+        if row.parent is None or row.id not in parents:
+            parents[row.id] = row.parent
+    if source not in parents:
+        return None
+    path = [source]
+    while (parent := parents[path[-1]]) is not None:
+        path.append(parent)
+    return [source, *reversed(path)]
+
+
+async def check_cycle(
+    conn: AsyncConnection, edges: Table, source: UUID, targets: list[UUID]
+) -> None:
+    """Reject new dependencies of `source` that would close a cycle.
+
+    Raises:
+        CycleDetectedError: If `source` is reachable from one of `targets`
+    """
+    if not targets:
+        return
+    result = await conn.execute(cycle_query(edges, source, targets))
+    path = cycle_path(source, result.all())
+    if path is not None:
+        raise cycle_error(path)
+
+
+async def lock_graph(conn: AsyncConnection, edges: Table) -> None:
+    """Serialize dependency edits on `edges` until the transaction ends."""
+    await conn.execute(select(func.pg_advisory_xact_lock(func.hashtext(edges.name))))
@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
 from ai_life_backend.projects.domain.project import Project, ProjectPriority, ProjectRisk
+from ai_life_backend.projects.services.dag_validator import DagValidator
 
 
 class InMemoryProjectRepository:
@@ -16,6 +17,8 @@ class InMemoryProjectRepository:
     def __init__(self) -> None:
         """Initialize empty repository."""
         self._projects: dict[UUID, Project] = {}
+        # Reverse adjacency index: dependency ID -> IDs of projects that depend on it
+        self._dependents: dict[UUID, set[UUID]] = {}
 
     async def create(
         self,
@@ -44,12 +47,17 @@ class InMemoryProjectRepository:
             date_updated=now,
         )
         self._projects[project.id] = project
+        self._link(project.id, project.dependencies)
         return project
 
     async def get_by_id(self, project_id: UUID) -> Project | None:
         """Retrieve project by ID."""
         return self._projects.get(project_id)
 
+    async def get_many(self, project_ids: list[UUID]) -> list[Project]:
+        """Retrieve all existing projects among the given IDs in a single pass."""
+        return [self._projects[i] for i in dict.fromkeys(project_ids) if i in self._projects]
+
     async def list_all(self) -> list[Project]:
         """List all projects, sorted by date_created DESC."""
         return sorted(
@@ -77,6 +85,9 @@ class InMemoryProjectRepository:
         project = self._projects.get(project_id)
         if not project:
             return None
+        if dependencies is not None:
+            graph = {p.id: p.dependencies for p in self._projects.values()}
+            DagValidator().validate_edges(graph, project_id, dependencies)
 
         # Create updated project (immutable)
         updated = Project(
@@ -92,12 +103,36 @@ class InMemoryProjectRepository:
             date_created=project.date_created,
             date_updated=datetime.now(UTC),
         )
+        if dependencies is not None:
+            self._unlink(project_id, project.dependencies)
+            self._link(project_id, dependencies)
         self._projects[project_id] = updated
         return updated
 
     async def delete(self, project_id: UUID) -> bool:
         """Delete a project."""
-        if project_id in self._projects:
-            del self._projects[project_id]
-            return True
-        return False
+        project = self._projects.pop(project_id, None)
+        if project is None:
+            return False
+        self._unlink(project_id, project.dependencies)
+        self._dependents.pop(project_id, None)
+        return True
+
+    async def list_dependents(self, project_id: UUID) -> list[Project]:
+        """List projects that depend on the given project, sorted by date_created DESC."""
+        dependents = [self._projects[i] for i in self._dependents.get(project_id, ())]
+        return sorted(dependents, key=lambda d: d.date_created, reverse=True)
+
+    def _link(self, project_id: UUID, dependencies: list[UUID]) -> None:
+        """Record reverse edges for the given dependencies."""
+        for dep_id in dependencies:
+            self._dependents.setdefault(dep_id, set()).add(project_id)
+
+    def _unlink(self, project_id: UUID, dependencies: list[UUID]) -> None:
+        """Drop reverse edges for the given dependencies."""
+        for dep_id in dependencies:
+            dependents = self._dependents.get(dep_id)
+            if dependents is not None:
+                dependents.discard(project_id)
+                if not dependents:
+                    del self._dependents[dep_id]
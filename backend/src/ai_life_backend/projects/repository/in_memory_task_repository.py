@@ -1,8 +1,11 @@
 """In-memory implementation of Task repository for MVP."""
 
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
+from ai_life_backend.projects.domain.closure import ClosureDirection, TaskClosureEntry
+from ai_life_backend.projects.domain.progress import ProjectProgress
 from ai_life_backend.projects.domain.task import (
     Task,
     TaskSize,
@@ -11,6 +14,11 @@ from ai_life_backend.projects.domain.task import (
     TaskClarity,
     TaskRisk,
 )
+from ai_life_backend.projects.services.closure import closure_depths, order_closure
+from ai_life_backend.projects.services.dag_validator import DagValidator
+from ai_life_backend.projects.services.task_batch import TaskBatchPlan
+
+DONE_STATUS = "done"
 
 
 class InMemoryTaskRepository:
@@ -23,6 +31,10 @@ class InMemoryTaskRepository:
     def __init__(self) -> None:
         """Initialize empty repository."""
         self._tasks: dict[UUID, Task] = {}
+        # Reverse adjacency index: dependency ID -> IDs of tasks that depend on it
+        self._dependents: dict[UUID, set[UUID]] = {}
+        # Maintained count of dependencies not yet done, per task
+        self._open_blockers: dict[UUID, int] = {}
 
     async def create(
         self,
@@ -38,6 +50,7 @@ class InMemoryTaskRepository:
         context: str,
     ) -> Task:
         """Create a new task."""
+        self._check_dependencies(dependencies, project_id)
         now = datetime.now(UTC)
         task = Task(
             id=uuid4(),
@@ -55,12 +68,18 @@ class InMemoryTaskRepository:
             date_updated=now,
         )
         self._tasks[task.id] = task
+        self._link(task.id, task.dependencies)
+        self._open_blockers[task.id] = self._count_open(dependencies)
         return task
 
     async def get_by_id(self, task_id: UUID) -> Task | None:
         """Retrieve task by ID."""
         return self._tasks.get(task_id)
 
+    async def get_many(self, task_ids: list[UUID]) -> list[Task]:
+        """Retrieve all existing tasks among the given IDs in a single pass."""
+        return [self._tasks[i] for i in dict.fromkeys(task_ids) if i in self._tasks]
+
     async def list_all(self) -> list[Task]:
         """List all tasks, sorted by date_created DESC."""
         return sorted(
@@ -73,6 +92,49 @@ class InMemoryTaskRepository:
         """List tasks for a specific project."""
         return [t for t in self._tasks.values() if t.project_id == project_id]
 
+    async def list_closure(
+        self, task_id: UUID, direction: ClosureDirection, max_depth: int
+    ) -> list[TaskClosureEntry]:
+        """List the tasks within `max_depth` edges up- or downstream (BFS), dependencies first."""
+        if direction == "upstream":
+            depths = closure_depths(task_id, self._dependencies, max_depth)
+        else:
+            depths = closure_depths(task_id, lambda t: self._dependents.get(t, ()), max_depth)
+        return order_closure([self._tasks[t] for t in depths], depths)
+
+    async def stream_closure(
+        self, task_id: UUID, direction: ClosureDirection, max_depth: int
+    ) -> AsyncIterator[list[TaskClosureEntry]]:
+        """Yield the closure from `list_closure` as a single batch."""
+        entries = await self.list_closure(task_id, direction, max_depth)
+        if entries:
+            yield entries
+
+    def _dependencies(self, task_id: UUID) -> list[UUID]:
+        task = self._tasks.get(task_id)
+        return [] if task is None else [d for d in task.dependencies if d in self._tasks]
+
+    async def list_unblocked(self, project_id: UUID | None = None) -> list[Task]:
+        """List open tasks whose dependencies are all done, sorted by date_created DESC."""
+        ready = [
+            t
+            for t in self._tasks.values()
+            if self._open_blockers[t.id] == 0
+            and t.status != DONE_STATUS
+            and (project_id is None or t.project_id == project_id)
+        ]
+        return sorted(ready, key=lambda t: t.date_created, reverse=True)
+
+    async def get_progress(self, project_id: UUID) -> ProjectProgress:
+        """Count a project's tasks by status (counted on read; no rollup in memory)."""
+        statuses = [t.status for t in self._tasks.values() if t.project_id == project_id]
+        return ProjectProgress(
+            project_id=project_id,
+            task_count=len(statuses),
+            tasks_done=statuses.count(DONE_STATUS),
+            tasks_blocked=statuses.count("blocked"),
+        )
+
     async def update(
         self,
         task_id: UUID,
@@ -90,6 +152,10 @@ class InMemoryTaskRepository:
         task = self._tasks.get(task_id)
         if not task:
             return None
+        if dependencies is not None:
+            self._check_dependencies(dependencies, task.project_id)
+            graph = {t.id: t.dependencies for t in self._tasks.values()}
+            DagValidator().validate_edges(graph, task_id, dependencies)
 
         # Create updated task (immutable)
         updated = Task(
@@ -107,12 +173,83 @@ class InMemoryTaskRepository:
             date_created=task.date_created,
             date_updated=datetime.now(UTC),
         )
+        if dependencies is not None:
+            self._unlink(task_id, task.dependencies)
+            self._link(task_id, dependencies)
+            self._open_blockers[task_id] = self._count_open(dependencies)
+        if (task.status == DONE_STATUS) != (updated.status == DONE_STATUS):
+            delta = -1 if updated.status == DONE_STATUS else 1
+            for dependent_id in self._dependents.get(task_id, ()):
+                self._open_blockers[dependent_id] += delta
         self._tasks[task_id] = updated
         return updated
 
     async def delete(self, task_id: UUID) -> bool:
         """Delete a task."""
-        if task_id in self._tasks:
-            del self._tasks[task_id]
-            return True
-        return False
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return False
+        self._unlink(task_id, task.dependencies)
+        self._dependents.pop(task_id, None)
+        self._open_blockers.pop(task_id, None)
+        return True
+
+    async def list_related(self, project_ids: list[UUID], task_ids: list[UUID]) -> list[Task]:
+        """List every task of the given projects and of the given tasks' projects."""
+        projects = set(project_ids) | {
+            self._tasks[i].project_id for i in task_ids if i in self._tasks
+        }
+        return [t for t in self._tasks.values() if t.project_id in projects]
+
+    async def apply_batch(self, plan: TaskBatchPlan) -> dict[int, Task]:
+        """Write a validated batch and refresh the affected blocker counts."""
+        for task in (*plan.created.values(), *plan.updated.values()):
+            previous = self._tasks.get(task.id)
+            if previous is not None:
+                self._unlink(task.id, previous.dependencies)
+            self._tasks[task.id] = task
+            self._link(task.id, task.dependencies)
+        for task in plan.deleted.values():
+            await self.delete(task.id)
+        touched = plan.touched_ids()
+        for task_id in {*touched, *(d for t in touched for d in self._dependents.get(t, ()))}:
+            self._open_blockers[task_id] = self._count_open(self._tasks[task_id].dependencies)
+        return dict(sorted({**plan.created, **plan.updated, **plan.deleted}.items()))
+
+    async def list_dependents(self, task_id: UUID) -> list[Task]:
+        """List tasks that depend on the given task, sorted by date_created DESC."""
+        dependents = [self._tasks[i] for i in self._dependents.get(task_id, ())]
+        return sorted(dependents, key=lambda d: d.date_created, reverse=True)
+
+    def _check_dependencies(self, dependencies: list[UUID], project_id: UUID) -> None:
+        """Validate existence and same-project scope, as the Postgres repository does."""
+        for dep_id in dependencies:
+            dep_task = self._tasks.get(dep_id)
+            if not dep_task:
+                msg = f"Dependency task {dep_id} not found"
+                raise ValueError(msg)
+            if dep_task.project_id != project_id:
+                msg = "Task dependencies must be within the same project"
+                raise ValueError(msg)
+
+    def _count_open(self, dependencies: list[UUID]) -> int:
+        """Count existing dependencies that are not done yet."""
+        return sum(
+            1
+            for dep_id in dependencies
+            if (dep := self._tasks.get(dep_id)) is not None and dep.status != DONE_STATUS
+        )
+
+    def _link(self, task_id: UUID, dependencies: list[UUID]) -> None:
+        """Record reverse edges for the given dependencies."""
+        for dep_id in dependencies:
+            self._dependents.setdefault(dep_id, set()).add(task_id)
+
+    def _unlink(self, task_id: UUID, dependencies: list[UUID]) -> None:
+        """Drop reverse edges for the given dependencies."""
+        for dep_id in dependencies:
+            dependents = self._dependents.get(dep_id)
+            if dependents is not None:
+                dependents.discard(task_id)
+                if not dependents:
+                    del self._dependents[dep_id]
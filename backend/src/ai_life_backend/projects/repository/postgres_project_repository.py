@@ -0,0 +1,282 @@
+"""PostgreSQL implementation of Project repository."""
+
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    MetaData,
+    String,
+    Table,
+    Text,
+    any_,
+    column,
+    delete,
+    select,
+    table,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from ai_life_backend.core.public import RowMapper
+from ai_life_backend.database import uuid_array
+from ai_life_backend.projects.domain.project import Project, ProjectPriority, ProjectRisk
+from ai_life_backend.projects.repository.dependency_cycles import check_cycle, lock_graph
+
+metadata = MetaData()
+
+# Only the key of the goals table is needed, to check a project's parent goal
+_goals = table("goals", column("id", PG_UUID(as_uuid=True)))
+
+MAX_TITLE_LENGTH = 255
+
+projects_table = Table(
+    "projects",
+    metadata,
+    Column("id", PG_UUID(as_uuid=True), primary_key=True),
+    Column("goal_id", PG_UUID(as_uuid=True), nullable=True),
+    Column("title", String(MAX_TITLE_LENGTH), nullable=False),
+    Column("status", String(50), nullable=False),
+    Column("priority", String(10), nullable=False),
+    Column("scope", Text, nullable=False),
+    Column("risk", String(10), nullable=False),
+    Column("tags", ARRAY(String), nullable=False),
+    Column("dependencies", ARRAY(PG_UUID(as_uuid=True)), nullable=False),
+    Column("date_created", DateTime(timezone=True), nullable=False),
+    Column("date_updated", DateTime(timezone=True), nullable=False),
+)
+
+
+# Normalized adjacency index mirroring `projects.dependencies`; the primary key serves
+# forward lookups and `idx_project_dependencies_depends_on_id` serves "who depends on X".
+project_dependencies_table = Table(
+    "project_dependencies",
+    metadata,
+    Column(
+        "project_id",
+        PG_UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("depends_on_id", PG_UUID(as_uuid=True), ForeignKey("projects.id"), primary_key=True),
+)
+
+_to_project = RowMapper(
+    Project,
+    projects_table,
+    {"priority": ProjectPriority, "risk": ProjectRisk},
+)
+
+
+class PostgresProjectRepository:
+    """PostgreSQL implementation of ProjectReader Protocol with write operations."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """Initialize repository with database engine."""
+        self._engine = engine
+
+    @staticmethod
+    async def _check_dependencies(conn: AsyncConnection, dependencies: list[UUID]) -> None:
+        """Ensure all dependency projects exist, using a single set-based lookup.
+
+        Dependency rows are share-locked so they cannot be deleted or re-linked
+        before the edit commits.
+        """
+        if not dependencies:
+            return
+        result = await conn.execute(
+            select(projects_table.c.id)
+            .where(projects_table.c.id == any_(uuid_array(dependencies)))
+            .with_for_update(read=True)
+        )
+        missing = set(dependencies) - set(result.scalars().all())
+        if missing:
+            msg = f"Dependency project {min(missing)} not found"
+            raise ValueError(msg)
+
+    @staticmethod
+    async def _lock_row(conn: AsyncConnection, project_id: UUID) -> bool:
+        """Lock a project row for update; False if it does not exist."""
+        result = await conn.execute(
+            select(projects_table.c.id).where(projects_table.c.id == project_id).with_for_update()
+        )
+        return result.one_or_none() is not None
+
+    @staticmethod
+    async def _check_goal(conn: AsyncConnection, goal_id: UUID | None) -> None:
+        """Share-lock the parent goal so an unknown one is a ValueError, not an FK error."""
+        if goal_id is None:
+            return
+        result = await conn.execute(
+            select(_goals.c.id).where(_goals.c.id == goal_id).with_for_update(read=True)
+        )
+        if result.one_or_none() is None:
+            msg = f"Goal {goal_id} not found"
+            raise ValueError(msg)
+
+    @staticmethod
+    async def _sync_edges(
+        conn: AsyncConnection, project_id: UUID, dependencies: list[UUID], *, replace: bool
+    ) -> None:
+        """Mirror the dependency array into `project_dependencies` in the same transaction."""
+        if replace:
+            await conn.execute(
+                delete(project_dependencies_table).where(
+                    project_dependencies_table.c.project_id == project_id
+                )
+            )
+        if dependencies:
+            await conn.execute(
+                project_dependencies_table.insert(),
+                [
+                    {"project_id": project_id, "depends_on_id": d}
+                    for d in dict.fromkeys(dependencies)
+                ],
+            )
+
+    async def create(
+        self,
+        goal_id: UUID | None,
+        title: str,
+        status: str,
+        priority: ProjectPriority,
+        scope: str,
+        risk: ProjectRisk,
+        tags: list[str],
+        dependencies: list[UUID],
+    ) -> Project:
+        """Create a new project."""
+        if len(title) > MAX_TITLE_LENGTH:
+            msg = f"Title cannot exceed {MAX_TITLE_LENGTH} characters"
+            raise ValueError(msg)
+
+        async with self._engine.begin() as conn:
+            await self._check_goal(conn, goal_id)
+            await self._check_dependencies(conn, dependencies)
+            result = await conn.execute(
+                projects_table
+                .insert()
+                .values(
+                    goal_id=goal_id,
+                    title=title,
+                    status=status,
+                    priority=priority.value,
+                    scope=scope,
+                    risk=risk.value,
+                    tags=tags,
+                    dependencies=dependencies,
+                )
+                .returning(projects_table)
+            )
+            project = _to_project(result.one())
+            await self._sync_edges(conn, project.id, project.dependencies, replace=False)
+            return project
+
+    async def get_by_id(self, project_id: UUID) -> Project | None:
+        """Retrieve project by ID."""
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                select(projects_table).where(projects_table.c.id == project_id)
+            )
+            row = result.one_or_none()
+            return None if row is None else _to_project(row)
+
+    async def get_many(self, project_ids: list[UUID]) -> list[Project]:
+        """Retrieve all existing projects among the given IDs with one `= ANY(:ids)` query."""
+        if not project_ids:
+            return []
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                select(projects_table).where(projects_table.c.id == any_(uuid_array(project_ids)))
+            )
+            return _to_project.many(result.all())
+
+    async def list_all(self) -> list[Project]:
+        """List all projects, sorted by date_created DESC."""
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                select(projects_table).order_by(projects_table.c.date_created.desc())
+            )
+            return _to_project.many(result.all())
+
+    async def list_by_goal(self, goal_id: UUID) -> list[Project]:
+        """List projects for a specific goal, sorted by date_created DESC."""
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                select(projects_table)
+                .where(projects_table.c.goal_id == goal_id)
+                .order_by(projects_table.c.date_created.desc())
+            )
+            return _to_project.many(result.all())
+
+    async def list_dependents(self, project_id: UUID) -> list[Project]:
+        """List projects depending on the given project (reverse index seek), newest first."""
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                select(projects_table)
+                .join(
+                    project_dependencies_table,
+                    project_dependencies_table.c.project_id == projects_table.c.id,
+                )
+                .where(project_dependencies_table.c.depends_on_id == project_id)
+                .order_by(projects_table.c.date_created.desc())
+            )
+            return _to_project.many(result.all())
+
+    async def update(
+        self,
+        project_id: UUID,
+        title: str | None = None,
+        status: str | None = None,
+        priority: ProjectPriority | None = None,
+        scope: str | None = None,
+        risk: ProjectRisk | None = None,
+        tags: list[str] | None = None,
+        dependencies: list[UUID] | None = None,
+    ) -> Project | None:
+        """Update project fields and refresh date_updated."""
+        candidates: dict[str, Any] = {
+            "title": title,
+            "status": status,
+            "priority": priority.value if priority is not None else None,
+            "scope": scope,
+            "risk": risk.value if risk is not None else None,
+            "tags": tags,
+            "dependencies": dependencies,
+        }
+        update_values = {k: v for k, v in candidates.items() if v is not None}
+        update_values["date_updated"] = datetime.now(UTC)
+
+        async with self._engine.begin() as conn:
+            # Graph lock, then the edited row, then its dependencies (as tasks do)
+            if dependencies is not None:
+                await lock_graph(conn, project_dependencies_table)
+            if not await self._lock_row(conn, project_id):
+                return None
+            if dependencies is not None:
+                await self._check_dependencies(conn, dependencies)
+                await check_cycle(conn, project_dependencies_table, project_id, dependencies)
+            result = await conn.execute(
+                update(projects_table)
+                .where(projects_table.c.id == project_id)
+                .values(**update_values)
+                .returning(projects_table)
+            )
+            row = result.one_or_none()
+            if row is None:
+                return None
+            if dependencies is not None:
+                await self._sync_edges(conn, project_id, dependencies, replace=True)
+            return _to_project(row)
+
+    async def delete(self, project_id: UUID) -> bool:
+        """Permanently delete a project (its tasks are removed by ON DELETE CASCADE)."""
+        async with self._engine.begin() as conn:
+            result = await conn.execute(
+                delete(projects_table).where(projects_table.c.id == project_id)
+            )
+            return result.rowcount > 0
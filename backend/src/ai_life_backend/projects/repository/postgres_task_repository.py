@@ -0,0 +1,650 @@
+"""PostgreSQL implementation of Task repository."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    MetaData,
+    Select,
+    String,
+    Table,
+    Text,
+    Update,
+    any_,
+    column,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    table,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from ai_life_backend.core.public import BatchConflictError, RowMapper, StatusRollup
+from ai_life_backend.database import uuid_array
+from ai_life_backend.projects.domain.closure import ClosureDirection, TaskClosureEntry
+from ai_life_backend.projects.domain.progress import ProjectProgress
+from ai_life_backend.projects.domain.task import (
+    Task,
+    TaskClarity,
+    TaskContinuity,
+    TaskEnergy,
+    TaskRisk,
+    TaskSize,
+)
+from ai_life_backend.projects.repository.dependency_cycles import check_cycle, lock_graph
+from ai_life_backend.projects.services.task_batch import TaskBatchPlan
+
+metadata = MetaData()
+
+MAX_TITLE_LENGTH = 255
+DONE_STATUS = "done"
+CLOSURE_BATCH_SIZE = 500
+
+tasks_table = Table(
+    "tasks",
+    metadata,
+    Column("id", PG_UUID(as_uuid=True), primary_key=True),
+    Column("project_id", PG_UUID(as_uuid=True), nullable=False),
+    Column("title", String(MAX_TITLE_LENGTH), nullable=False),
+    Column("status", String(50), nullable=False),
+    Column("dependencies", ARRAY(PG_UUID(as_uuid=True)), nullable=False),
+    Column("size", String(10), nullable=False),
+    Column("energy", String(20), nullable=False),
+    Column("continuity", String(20), nullable=False),
+    Column("clarity", String(20), nullable=False),
+    Column("risk", String(10), nullable=False),
+    Column("context", Text, nullable=False),
+    Column("date_created", DateTime(timezone=True), nullable=False),
+    Column("date_updated", DateTime(timezone=True), nullable=False),
+    # Number of dependencies not yet `done`; 0 means the task is unblocked
+    Column("open_blocker_count", Integer, nullable=False),
+)
+
+
+# Normalized adjacency index mirroring `tasks.dependencies`; the primary key serves
+# forward lookups and `idx_task_dependencies_depends_on_id` serves "who depends on X".
+task_dependencies_table = Table(
+    "task_dependencies",
+    metadata,
+    Column(
+        "task_id",
+        PG_UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("depends_on_id", PG_UUID(as_uuid=True), ForeignKey("tasks.id"), primary_key=True),
+)
+
+# Task counters per project, written in the same transaction as every task write, so
+# progress reads are one primary-key lookup; a missing row means no tasks yet.
+project_progress_table = Table(
+    "project_progress",
+    metadata,
+    Column("project_id", PG_UUID(as_uuid=True), primary_key=True),
+    Column("task_count", Integer, nullable=False),
+    Column("tasks_done", Integer, nullable=False),
+    Column("tasks_blocked", Integer, nullable=False),
+)
+
+# Only the key of the projects table is needed (recounts, parent checks)
+_projects = table("projects", column("id", PG_UUID(as_uuid=True)))
+
+project_progress = StatusRollup(project_progress_table, tasks_table, _projects)
+
+_to_progress = RowMapper(ProjectProgress, project_progress_table)
+
+_to_task = RowMapper(
+    Task,
+    tasks_table,
+    {
+        "size": TaskSize,
+        "energy": TaskEnergy,
+        "continuity": TaskContinuity,
+        "clarity": TaskClarity,
+        "risk": TaskRisk,
+    },
+)
+
+
+def _row_values(task: Task) -> dict[str, Any]:
+    """Column values a batch writes for a task (identity and timestamps excluded)."""
+    return {
+        "title": task.title,
+        "status": task.status,
+        "dependencies": task.dependencies,
+        "size": task.size.value,
+        "energy": task.energy.value,
+        "continuity": task.continuity.value,
+        "clarity": task.clarity.value,
+        "risk": task.risk.value,
+        "context": task.context,
+    }
+
+
+def _recount_open_blockers(task_ids: list[UUID]) -> Update:
+    """Recompute `open_blocker_count` of the given tasks and of their dependents."""
+    dependency = tasks_table.alias("dependency")
+    open_blockers = (
+        select(func.count())
+        .select_from(task_dependencies_table)
+        .join(dependency, dependency.c.id == task_dependencies_table.c.depends_on_id)
+        .where(
+            task_dependencies_table.c.task_id == tasks_table.c.id,
+            dependency.c.status != DONE_STATUS,
+        )
+        .scalar_subquery()
+    )
+    ids = uuid_array(task_ids)
+    dependents = select(task_dependencies_table.c.task_id).where(
+        task_dependencies_table.c.depends_on_id == any_(ids)
+    )
+    return (
+        update(tasks_table)
+        .where(or_(tasks_table.c.id == any_(ids), tasks_table.c.id.in_(dependents)))
+        .values(open_blocker_count=open_blockers)
+    )
+
+
+def closure_query(task_id: UUID, direction: ClosureDirection, max_depth: int) -> Select[Any]:
+    """Select the tasks within `max_depth` dependency edges of a task, in topological order.
+
+    A `WITH RECURSIVE` walk over `task_dependencies`: upstream follows the primary
+    key (task_id -> depends_on_id), downstream the reverse index on depends_on_id.
+    The recursive part is a UNION over (id, depth), so each task is expanded at most
+    once per depth level even where paths converge. A second walk inside the closure
+    ranks each task by its longest chain of dependencies there; sorting by rank, then
+    depth, then ID puts every task after its dependencies (the graph is acyclic).
+    """
+    edges = task_dependencies_table.c
+    source, target = (
+        (edges.task_id, edges.depends_on_id)
+        if direction == "upstream"
+        else (edges.depends_on_id, edges.task_id)
+    )
+    closure = (
+        select(target.label("id"), literal(1).label("depth"))
+        .where(source == task_id)
+        .cte("closure", recursive=True)
+    )
+    closure = closure.union(
+        select(target, closure.c.depth + 1)
+        .join(closure, source == closure.c.id)
+        .where(closure.c.depth < max_depth)
+    )
+    depths = (
+        select(closure.c.id, func.min(closure.c.depth).label("depth"))
+        .group_by(closure.c.id)
+        .cte("depths")
+    )
+    levels = select(depths.c.id, literal(0).label("rank")).cte("levels", recursive=True)
+    levels = levels.union(
+        select(edges.task_id, levels.c.rank + 1)
+        .join(levels, edges.depends_on_id == levels.c.id)
+        .join(depths, depths.c.id == edges.task_id)
+    )
+    ranks = (
+        select(levels.c.id, func.max(levels.c.rank).label("rank"))
+        .group_by(levels.c.id)
+        .subquery("ranks")
+    )
+    return (
+        select(tasks_table, depths.c.depth)
+        .join(depths, depths.c.id == tasks_table.c.id)
+        .join(ranks, ranks.c.id == tasks_table.c.id)
+        .order_by(ranks.c.rank, depths.c.depth, tasks_table.c.id)
+    )
+
+
+class PostgresTaskRepository:
+    """PostgreSQL implementation of TaskReader Protocol with write operations."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """Initialize repository with database engine."""
+        self._engine = engine
+
+    @staticmethod
+    async def _check_dependencies(
+        conn: AsyncConnection, dependencies: list[UUID], project_id: UUID
+    ) -> int:
+        """Validate dependencies with one set-based lookup and count those not yet done.
+
+        Dependency rows are share-locked so a concurrent status change cannot slip
+        between this count and the edge write.
+        """
+        if not dependencies:
+            return 0
+        result = await conn.execute(
+            select(tasks_table.c.id, tasks_table.c.project_id, tasks_table.c.status)
+            .where(tasks_table.c.id == any_(uuid_array(dependencies)))
+            .with_for_update(read=True)
+        )
+        rows = result.all()
+        missing = set(dependencies) - {row.id for row in rows}
+        if missing:
+            msg = f"Dependency task {min(missing)} not found"
+            raise ValueError(msg)
+        if any(row.project_id != project_id for row in rows):
+            msg = "Task dependencies must be within the same project"
+            raise ValueError(msg)
+        return sum(row.status != DONE_STATUS for row in rows)
+
+    @staticmethod
+    async def _check_project(conn: AsyncConnection, project_id: UUID) -> None:
+        """Share-lock the parent project so an unknown one is a ValueError, not an FK error."""
+        result = await conn.execute(
+            select(_projects.c.id).where(_projects.c.id == project_id).with_for_update(read=True)
+        )
+        if result.one_or_none() is None:
+            msg = f"Project {project_id} not found"
+            raise ValueError(msg)
+
+    @staticmethod
+    async def _lock_row(conn: AsyncConnection, task_id: UUID) -> Row[Any] | None:
+        """Lock a task row and return its project_id and current status."""
+        result = await conn.execute(
+            select(tasks_table.c.project_id, tasks_table.c.status)
+            .where(tasks_table.c.id == task_id)
+            .with_for_update()
+        )
+        return result.one_or_none()
+
+    @staticmethod
+    async def _shift_dependents(conn: AsyncConnection, task_id: UUID, delta: int) -> None:
+        """Adjust `open_blocker_count` of every task depending on `task_id`."""
+        await conn.execute(
+            update(tasks_table)
+            .where(
+                tasks_table.c.id.in_(
+                    select(task_dependencies_table.c.task_id).where(
+                        task_dependencies_table.c.depends_on_id == task_id
+                    )
+                )
+            )
+            .values(open_blocker_count=tasks_table.c.open_blocker_count + delta)
+        )
+
+    @staticmethod
+    async def _shift_progress(
+        conn: AsyncConnection, project_id: UUID, before: str | None, after: str | None
+    ) -> None:
+        """Apply one task's status change to its project's progress row."""
+        stmt = project_progress.shift(project_id, before, after)
+        if stmt is not None:
+            await conn.execute(stmt)
+
+    @staticmethod
+    async def _sync_edges(
+        conn: AsyncConnection, task_id: UUID, dependencies: list[UUID], *, replace: bool
+    ) -> None:
+        """Mirror the dependency array into `task_dependencies` in the same transaction."""
+        if replace:
+            await conn.execute(
+                delete(task_dependencies_table).where(task_dependencies_table.c.task_id == task_id)
+            )
+        if dependencies:
+            await conn.execute(
+                task_dependencies_table.insert(),
+                [{"task_id": task_id, "depends_on_id": d} for d in dict.fromkeys(dependencies)],
+            )
+
+    async def create(
+        self,
+        project_id: UUID,
+        title: str,
+        status: str,
+        dependencies: list[UUID],
+        size: TaskSize,
+        energy: TaskEnergy,
+        continuity: TaskContinuity,
+        clarity: TaskClarity,
+        risk: TaskRisk,
+        context: str,
+    ) -> Task:
+        """Create a new task."""
+        if len(title) > MAX_TITLE_LENGTH:
+            msg = f"Title cannot exceed {MAX_TITLE_LENGTH} characters"
+            raise ValueError(msg)
+
+        async with self._engine.begin() as conn:
+            await self._check_project(conn, project_id)
+            open_blockers = await self._check_dependencies(conn, dependencies, project_id)
+            result = await conn.execute(
+                tasks_table
+                .insert()
+                .values(
+                    project_id=project_id,
+                    title=title,
+                    status=status,
+                    dependencies=dependencies,
+                    size=size.value,
+                    energy=energy.value,
+                    continuity=continuity.value,
+                    clarity=clarity.value,
+                    risk=risk.value,
+                    context=context,
+                    open_blocker_count=open_blockers,
+                )
+                .returning(tasks_table)
+            )
+            task = _to_task(result.one())
+            await self._sync_edges(conn, task.id, task.dependencies, replace=False)
+            await self._shift_progress(conn, project_id, None, task.status)
+            return task
+
+    async def get_progress(self, project_id: UUID) -> ProjectProgress:
+        """Read a project's task counters (one primary-key lookup; zeros without tasks)."""
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                select(project_progress_table).where(
+                    project_progress_table.c.project_id == project_id
+                )
+            )
+            row = result.one_or_none()
+            return ProjectProgress(project_id) if row is None else _to_progress(row)
+
+    async def get_by_id(self, task_id: UUID) -> Task | None:
+        """Retrieve task by ID."""
+        async with self._engine.connect() as conn:
+            result = await conn.execute(select(tasks_table).where(tasks_table.c.id == task_id))
+            row = result.one_or_none()
+            return None if row is None else _to_task(row)
+
+    async def get_many(self, task_ids: list[UUID]) -> list[Task]:
+        """Retrieve all existing tasks among the given IDs with one `= ANY(:ids)` query."""
+        if not task_ids:
+            return []
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                select(tasks_table).where(tasks_table.c.id == any_(uuid_array(task_ids)))
+            )
+            return _to_task.many(result.all())
+
+    async def list_all(self) -> list[Task]:
+        """List all tasks, sorted by date_created DESC."""
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                select(tasks_table).order_by(tasks_table.c.date_created.desc())
+            )
+            return _to_task.many(result.all())
+
+    async def list_by_project(self, project_id: UUID) -> list[Task]:
+        """List tasks for a specific project, sorted by date_created DESC."""
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                select(tasks_table)
+                .where(tasks_table.c.project_id == project_id)
+                .order_by(tasks_table.c.date_created.desc())
+            )
+            return _to_task.many(result.all())
+
+    async def list_dependents(self, task_id: UUID) -> list[Task]:
+        """List tasks depending on the given task (reverse index seek), newest first."""
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                select(tasks_table)
+                .join(
+                    task_dependencies_table, task_dependencies_table.c.task_id == tasks_table.c.id
+                )
+                .where(task_dependencies_table.c.depends_on_id == task_id)
+                .order_by(tasks_table.c.date_created.desc())
+            )
+            return _to_task.many(result.all())
+
+    async def list_closure(
+        self, task_id: UUID, direction: ClosureDirection, max_depth: int
+    ) -> list[TaskClosureEntry]:
+        """List the tasks within `max_depth` edges up- or downstream, dependencies first."""
+        return [
+            entry
+            async for batch in self.stream_closure(task_id, direction, max_depth)
+            for entry in batch
+        ]
+
+    async def stream_closure(
+        self,
+        task_id: UUID,
+        direction: ClosureDirection,
+        max_depth: int,
+        batch_size: int = CLOSURE_BATCH_SIZE,
+    ) -> AsyncIterator[list[TaskClosureEntry]]:
+        """Yield the closure in topological order, one list per `batch_size` rows.
+
+        Rows come ordered from `closure_query` through a server-side cursor, so the
+        closure is never held in memory as a whole.
+        """
+        async with self._engine.connect() as conn:
+            result = await conn.stream(
+                closure_query(task_id, direction, max_depth).execution_options(yield_per=batch_size)
+            )
+            async for rows in result.partitions():
+                yield [
+                    TaskClosureEntry(task, row.depth)
+                    for task, row in zip(_to_task.many(rows), rows, strict=True)
+                ]
+
+    async def list_unblocked(self, project_id: UUID | None = None) -> list[Task]:
+        """List open tasks whose dependencies are all done, sorted by date_created DESC.
+
+        Served by the partial index `idx_tasks_unblocked` (open_blocker_count = 0, not done).
+        """
+        query = select(tasks_table).where(
+            tasks_table.c.open_blocker_count == 0, tasks_table.c.status != DONE_STATUS
+        )
+        if project_id is not None:
+            query = query.where(tasks_table.c.project_id == project_id)
+        async with self._engine.connect() as conn:
+            result = await conn.execute(query.order_by(tasks_table.c.date_created.desc()))
+            return _to_task.many(result.all())
+
+    async def update(
+        self,
+        task_id: UUID,
+        title: str | None = None,
+        status: str | None = None,
+        dependencies: list[UUID] | None = None,
+        size: TaskSize | None = None,
+        energy: TaskEnergy | None = None,
+        continuity: TaskContinuity | None = None,
+        clarity: TaskClarity | None = None,
+        risk: TaskRisk | None = None,
+        context: str | None = None,
+    ) -> Task | None:
+        """Update task fields and refresh date_updated."""
+        candidates: dict[str, Any] = {
+            "title": title,
+            "status": status,
+            "dependencies": dependencies,
+            "size": size,
+            "energy": energy,
+            "continuity": continuity,
+            "clarity": clarity,
+            "risk": risk,
+            "context": context,
+        }
+        update_values = {
+            k: v.value if isinstance(v, Enum) else v for k, v in candidates.items() if v is not None
+        }
+        update_values["date_updated"] = datetime.now(UTC)
+
+        async with self._engine.begin() as conn:
+            if dependencies is not None:
+                await lock_graph(conn, task_dependencies_table)
+            current = await self._lock_row(conn, task_id)
+            if current is None:
+                return None
+            if dependencies is not None:
+                update_values["open_blocker_count"] = await self._check_dependencies(
+                    conn, dependencies, current.project_id
+                )
+                await check_cycle(conn, task_dependencies_table, task_id, dependencies)
+            result = await conn.execute(
+                update(tasks_table)
+                .where(tasks_table.c.id == task_id)
+                .values(**update_values)
+                .returning(tasks_table)
+            )
+            row = result.one()
+            if dependencies is not None:
+                await self._sync_edges(conn, task_id, dependencies, replace=True)
+            if (current.status == DONE_STATUS) != (row.status == DONE_STATUS):
+                await self._shift_dependents(conn, task_id, -1 if row.status == DONE_STATUS else 1)
+            await self._shift_progress(conn, current.project_id, current.status, row.status)
+            return _to_task(row)
+
+    async def list_related(self, project_ids: list[UUID], task_ids: list[UUID]) -> list[Task]:
+        """List every task of the given projects and of the given tasks' projects."""
+        owners = select(tasks_table.c.project_id).where(
+            tasks_table.c.id == any_(uuid_array(task_ids))
+        )
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                select(tasks_table).where(
+                    or_(
+                        tasks_table.c.project_id == any_(uuid_array(project_ids)),
+                        tasks_table.c.project_id.in_(owners),
+                    )
+                )
+            )
+            return _to_task.many(result.all())
+
+    @staticmethod
+    async def _check_versions(
+        conn: AsyncConnection, versions: dict[UUID, tuple[int, datetime]]
+    ) -> None:
+        """Lock the targeted rows; reject the batch if any changed since validation."""
+        if not versions:
+            return
+        result = await conn.execute(
+            select(tasks_table.c.id, tasks_table.c.date_updated)
+            .where(tasks_table.c.id == any_(uuid_array(versions)))
+            .with_for_update()
+        )
+        current = dict(result.tuples().all())
+        stale = {
+            index: "Task was modified concurrently; retry the batch"
+            for task_id, (index, seen) in versions.items()
+            if current.get(task_id) != seen
+        }
+        if stale:
+            raise BatchConflictError(stale)
+
+    @staticmethod
+    async def _check_batch_projects(conn: AsyncConnection, created: dict[int, Task]) -> None:
+        """Share-lock the projects of created tasks; reject the batch if one was deleted."""
+        if not created:
+            return
+        project_ids = {task.project_id for task in created.values()}
+        result = await conn.execute(
+            select(_projects.c.id)
+            .where(_projects.c.id == any_(uuid_array(project_ids)))
+            .with_for_update(read=True)
+        )
+        found = set(result.scalars().all())
+        missing = {
+            index: "Project was deleted concurrently; retry the batch"
+            for index, task in created.items()
+            if task.project_id not in found
+        }
+        if missing:
+            raise BatchConflictError(missing)
+
+    async def apply_batch(self, plan: TaskBatchPlan) -> dict[int, Task]:
+        """Write a validated batch in one transaction.
+
+        Creates go out as one multi-row `INSERT ... RETURNING`, dependency edges as
+        one multi-row insert and deletes as one `= ANY(:ids)` statement; blocker
+        counts of every touched task and its dependents are then recomputed set-based.
+
+        Returns:
+            The written task per item index (deleted tasks as they were)
+
+        Raises:
+            BatchConflictError: If an updated or deleted task changed meanwhile, or the
+                project of a created task was deleted
+        """
+        written = dict(plan.deleted)
+        async with self._engine.begin() as conn:
+            await self._check_versions(conn, plan.versions)
+            await self._check_batch_projects(conn, plan.created)
+            written |= await self._insert_created(conn, plan.created)
+            for index, task in plan.updated.items():
+                result = await conn.execute(
+                    update(tasks_table)
+                    .where(tasks_table.c.id == task.id)
+                    .values(_row_values(task), date_updated=task.date_updated)
+                    .returning(tasks_table)
+                )
+                written[index] = _to_task(result.one())
+            await self._write_batch_edges(conn, plan)
+            if plan.deleted:
+                deleted_ids = [task.id for task in plan.deleted.values()]
+                await conn.execute(
+                    delete(tasks_table).where(tasks_table.c.id == any_(uuid_array(deleted_ids)))
+                )
+            if plan.created or plan.updated:
+                await conn.execute(_recount_open_blockers(plan.touched_ids()))
+            await conn.execute(project_progress.recount(plan.touched_project_ids()))
+        return dict(sorted(written.items()))
+
+    @staticmethod
+    async def _insert_created(conn: AsyncConnection, created: dict[int, Task]) -> dict[int, Task]:
+        """Insert new tasks with one multi-row `INSERT ... RETURNING` (insertmanyvalues)."""
+        if not created:
+            return {}
+        result = await conn.execute(
+            tasks_table.insert().returning(tasks_table, sort_by_parameter_order=True),
+            [
+                {"id": task.id, "project_id": task.project_id, **_row_values(task)}
+                for task in created.values()
+            ],
+        )
+        return dict(zip(created, _to_task.many(result.all()), strict=True))
+
+    @staticmethod
+    async def _write_batch_edges(conn: AsyncConnection, plan: TaskBatchPlan) -> None:
+        """Replace the adjacency rows of updated tasks and add those of created ones."""
+        if plan.updated:
+            updated_ids = [task.id for task in plan.updated.values()]
+            await conn.execute(
+                delete(task_dependencies_table).where(
+                    task_dependencies_table.c.task_id == any_(uuid_array(updated_ids))
+                )
+            )
+        edges = [
+            {"task_id": task.id, "depends_on_id": dep_id}
+            for task in (*plan.created.values(), *plan.updated.values())
+            for dep_id in dict.fromkeys(task.dependencies)
+        ]
+        if edges:
+            await conn.execute(task_dependencies_table.insert(), edges)
+
+    async def delete(self, task_id: UUID) -> bool:
+        """Permanently delete a task."""
+        return await self._delete(task_id) is not None
+
+    async def _delete(self, task_id: UUID) -> UUID | None:
+        """Delete a task; return the ID of the project it belonged to (None if missing)."""
+        async with self._engine.begin() as conn:
+            result = await conn.execute(
+                delete(tasks_table)
+                .where(tasks_table.c.id == task_id)
+                .returning(tasks_table.c.project_id, tasks_table.c.status)
+            )
+            row = result.one_or_none()
+            if row is None:
+                return None
+            project_id: UUID = row.project_id
+            await self._shift_progress(conn, project_id, row.status, None)
+            return project_id
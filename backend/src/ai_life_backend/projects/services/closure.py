@@ -0,0 +1,60 @@
+"""Transitive dependency closure: depth-limited reachability in topological order.
+
+Repositories find the tasks within `max_depth` edges of a task and order them so
+that every task follows its dependencies: by rank (the longest chain of
+dependencies a task has inside the closure), then depth, then ID. Postgres computes
+depths and ranks in one `WITH RECURSIVE` query and streams the rows already in that
+order; in memory `closure_depths` and `order_closure` do the same. Both directions
+use it: upstream prerequisites come before what needs them, downstream dependents
+after what they wait on.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+from typing import TYPE_CHECKING
+
+from ai_life_backend.projects.domain.closure import TaskClosureEntry
+from ai_life_backend.projects.services.schedule import topological_order
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from ai_life_backend.projects.domain.task import Task
+
+
+def closure_depths(
+    start: UUID, neighbors: Callable[[UUID], Iterable[UUID]], max_depth: int
+) -> dict[UUID, int]:
+    """Breadth-first search: nodes within `max_depth` edges of `start` and their distance.
+
+    `start` itself is not included (unless it lies on a cycle).
+    """
+    depths: dict[UUID, int] = {}
+    frontier = deque([(start, 0)])
+    while frontier:
+        node, depth = frontier.popleft()
+        if depth == max_depth:
+            continue
+        for neighbor in neighbors(node):
+            if neighbor not in depths:
+                depths[neighbor] = depth + 1
+                frontier.append((neighbor, depth + 1))
+    return depths
+
+
+def order_closure(tasks: Iterable[Task], depths: Mapping[UUID, int]) -> list[TaskClosureEntry]:
+    """Order closure tasks by rank, then depth, then ID (the order `closure_query` sorts by).
+
+    Args:
+        tasks: The tasks of the closure
+        depths: Distance from the starting task, by task ID
+    """
+    by_id = {t.id: t for t in tasks}
+    graph = {node: [d for d in task.dependencies if d in by_id] for node, task in by_id.items()}
+    ranks: dict[UUID, int] = {}
+    for node in topological_order(graph):
+        ranks[node] = max((ranks[d] + 1 for d in graph[node]), default=0)
+    order = sorted(by_id, key=lambda node: (ranks[node], depths[node], node))
+    return [TaskClosureEntry(by_id[node], depths[node]) for node in order]
@@ -1,5 +1,6 @@
 """DAG (Directed Acyclic Graph) validation service."""
 
+from collections.abc import Iterable, Mapping
 from uuid import UUID
 
 
@@ -9,11 +10,21 @@ class CycleDetectedError(Exception):
     pass
 
 
+def cycle_error(path: Iterable[UUID]) -> CycleDetectedError:
+    """Build the error reporting the cycle along `path` (first node repeated at the end)."""
+    path_str = " -> ".join(str(n) for n in path)
+    return CycleDetectedError(f"Cycle detected in dependency graph: {path_str}")
+
+
 class DagValidator:
-    """Validates that dependency graphs are acyclic (DAG)."""
+    """Validates that dependency graphs are acyclic (DAG).
 
-    def has_cycle(self, graph: dict[UUID, list[UUID]]) -> bool:
-        """Check if graph contains a cycle using DFS.
+    Traversals use an explicit stack instead of recursion, so arbitrarily deep
+    dependency chains are handled in linear time and memory.
+    """
+
+    def has_cycle(self, graph: Mapping[UUID, Iterable[UUID]]) -> bool:
+        """Check if graph contains a cycle.
 
         Args:
             graph: Adjacency list where keys are node IDs and values are
@@ -22,38 +33,9 @@ class DagValidator:
         Returns:
             True if cycle exists, False otherwise
         """
-        if not graph:
-            return False
-
-        visited: set[UUID] = set()
-        rec_stack: set[UUID] = set()
-
-        def dfs(node: UUID) -> bool:
-            """Depth-first search to detect cycles."""
-            visited.add(node)
-            rec_stack.add(node)
-
-            # Check all neighbors
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    if dfs(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    # Back edge found - cycle detected
-                    return True
-
-            rec_stack.remove(node)
-            return False
-
-        # Check all nodes
-        for node in graph:
-            if node not in visited:
-                if dfs(node):
-                    return True
-
-        return False
-
-    def validate(self, graph: dict[UUID, list[UUID]]) -> None:
+        return self.find_cycle_path(graph) is not None
+
+    def validate(self, graph: Mapping[UUID, Iterable[UUID]]) -> None:
         """Validate that graph is acyclic.
 
         Args:
@@ -62,59 +44,100 @@ class DagValidator:
         Raises:
             CycleDetectedError: If cycle is detected
         """
-        if self.has_cycle(graph):
-            cycle_path = self.find_cycle_path(graph)
-            path_str = " -> ".join(str(n) for n in cycle_path) if cycle_path else "unknown"
-            msg = f"Cycle detected in dependency graph: {path_str}"
-            raise CycleDetectedError(msg)
+        cycle_path = self.find_cycle_path(graph)
+        if cycle_path is not None:
+            raise cycle_error(cycle_path)
 
-    def find_cycle_path(self, graph: dict[UUID, list[UUID]]) -> list[UUID] | None:
-        """Find and return a cycle path if one exists.
+    def validate_edges(
+        self, graph: Mapping[UUID, Iterable[UUID]], source: UUID, targets: Iterable[UUID]
+    ) -> None:
+        """Validate replacing the outgoing edges of one node in an acyclic graph.
+
+        Assuming the rest of the graph is acyclic, the new edges close a cycle iff
+        `source` is reachable from one of the new targets, so only that region is
+        searched instead of the whole graph.
 
         Args:
-            graph: Adjacency list
+            graph: Adjacency list of the current graph (edges of `source` are ignored)
+            source: Node whose outgoing edges are being replaced
+            targets: New outgoing edges of `source`
 
-        Returns:
-            List of node IDs forming a cycle, or None if no cycle
+        Raises:
+            CycleDetectedError: If a new edge closes a cycle
         """
-        visited: set[UUID] = set()
-        rec_stack: set[UUID] = set()
-        parent: dict[UUID, UUID | None] = {}
+        path = _find_path(graph, targets, source)
+        if path is not None:
+            raise cycle_error([source, *path])
+
+    def find_cycle_path(self, graph: Mapping[UUID, Iterable[UUID]]) -> list[UUID] | None:
+        """Find and return a cycle path if one exists, in a single DFS pass.
 
-        def dfs(node: UUID) -> UUID | None:
-            """DFS that returns the node where cycle starts."""
-            visited.add(node)
-            rec_stack.add(node)
+        Nodes are coloured white (unvisited), grey (on the current DFS path) or
+        black (fully explored). Reaching a grey node closes a cycle, which is read
+        directly off the explicit path stack.
 
-            for neighbor in graph.get(node, []):
+        Args:
+            graph: Adjacency list
+
+        Returns:
+            List of node IDs forming a cycle (first node repeated at the end),
+            or None if no cycle
+        """
+        done: set[UUID] = set()
+        for root in graph:
+            if root not in done:
+                cycle = _cycle_from(graph, root, done)
+                if cycle is not None:
+                    return cycle
+        return None
+
+
+def _cycle_from(
+    graph: Mapping[UUID, Iterable[UUID]], root: UUID, done: set[UUID]
+) -> list[UUID] | None:
+    """Explore everything reachable from `root`; return the first cycle found, or None.
+
+    `done` holds black nodes and is extended in place. `depth` maps each grey node to
+    its index on `path`, and `frames` holds the pending neighbor iterator of each.
+    """
+    path = [root]
+    depth = {root: 0}
+    frames = [iter(graph.get(root, ()))]
+    while frames:
+        neighbor = next(frames[-1], None)
+        if neighbor is None:
+            node = path.pop()
+            del depth[node]
+            done.add(node)
+            frames.pop()
+        elif neighbor in depth:
+            return [*path[depth[neighbor] :], neighbor]
+        elif neighbor not in done:
+            depth[neighbor] = len(path)
+            path.append(neighbor)
+            frames.append(iter(graph.get(neighbor, ())))
+    return None
+
+
+def _find_path(
+    graph: Mapping[UUID, Iterable[UUID]], starts: Iterable[UUID], goal: UUID
+) -> list[UUID] | None:
+    """Return a path from one of `starts` to `goal` (both ends included), or None."""
+    parent: dict[UUID, UUID | None] = {}
+    stack: list[UUID] = []
+    for start in starts:
+        if start not in parent:
+            parent[start] = None
+            stack.append(start)
+    while stack:
+        node = stack.pop()
+        if node == goal:
+            path = [node]
+            while (prev := parent[path[-1]]) is not None:
+                path.append(prev)
+            return path[::-1]
+        for neighbor in graph.get(node, ()):
+            if neighbor not in parent:
                 parent[neighbor] = node
-                if neighbor not in visited:
-                    cycle_start = dfs(neighbor)
-                    if cycle_start:
-                        return cycle_start
-                elif neighbor in rec_stack:
-                    return neighbor
-
-            rec_stack.remove(node)
-            return None
-
-        # Find cycle start
-        cycle_start = None
-        for node in graph:
-            if node not in visited:
-                cycle_start = dfs(node)
-                if cycle_start:
-                    break
-
-        if not cycle_start:
-            return None
-
-        # Reconstruct cycle path
-        path = [cycle_start]
-        current = parent.get(cycle_start)
-        while current and current != cycle_start:
-            path.append(current)
-            current = parent.get(current)
-        path.append(cycle_start)
-
-        return list(reversed(path))
+                stack.append(neighbor)
+    return None
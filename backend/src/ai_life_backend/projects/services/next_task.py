@@ -0,0 +1,119 @@
+"""Next-task scheduler: what to work on now, given energy and a time budget.
+
+Candidates are the ready tasks (not done, every dependency done), which the task
+repository already keeps indexed through the maintained `open_blocker_count`, so no
+query scans the whole task table. Tasks needing more energy than is available or
+more effort than the budget are dropped; the rest are heapified by
+
+1. project priority (P0 first),
+2. schedule slack (critical-path tasks first, from the cached project schedules),
+3. energy match (tasks using the available energy level first),
+4. continuity (chain, then linked, then puzzle) and age (oldest first),
+
+and popped until `limit` tasks are picked or the budget is spent: O(r + k log r)
+for r ready tasks and k picks.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+import heapq
+from typing import TYPE_CHECKING
+
+from ai_life_backend.projects.domain.project import ProjectPriority
+from ai_life_backend.projects.domain.schedule import TaskSuggestion
+from ai_life_backend.projects.domain.task import Task, TaskContinuity, TaskEnergy
+from ai_life_backend.projects.services.schedule import SIZE_EFFORT
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from ai_life_backend.contracts.projects_protocols import ProjectReader, TaskReader
+    from ai_life_backend.projects.services.schedule import ProjectScheduler
+
+BLOCKED_STATUS = "blocked"
+
+ENERGY_LEVEL = {TaskEnergy.LIGHT: 0, TaskEnergy.FOCUS: 1, TaskEnergy.DEEP: 2}
+CONTINUITY_RANK = {TaskContinuity.CHAIN: 0, TaskContinuity.LINKED: 1, TaskContinuity.PUZZLE: 2}
+_PRIORITIES = list(ProjectPriority)
+PRIORITY_RANK = {priority: rank for rank, priority in enumerate(_PRIORITIES)}
+
+
+@dataclass(frozen=True, slots=True)
+class NextTaskQuery:
+    """What the next tasks have to fit.
+
+    Attributes:
+        energy: Energy available now; tasks needing more are skipped
+        budget: Effort units available (XS=1, S=2, M=3, L=5, XL=8)
+        limit: Maximum number of tasks to pick
+    """
+
+    energy: TaskEnergy
+    budget: int
+    limit: int
+
+
+def pick_next_tasks(
+    ready: Iterable[Task],
+    priorities: Mapping[UUID, ProjectPriority],
+    slack: Mapping[UUID, int],
+    query: NextTaskQuery,
+) -> list[TaskSuggestion]:
+    """Pick up to `query.limit` ready tasks fitting its energy and budget, best first.
+
+    Args:
+        ready: Ready tasks (not done, every dependency done)
+        priorities: Project priority by project ID (missing projects rank last)
+        slack: Schedule slack by task ID (missing tasks count as 0)
+        query: Available energy, effort budget and number of tasks
+    """
+    level, budget = ENERGY_LEVEL[query.energy], query.budget
+    heap = [
+        (
+            PRIORITY_RANK[priorities.get(task.project_id, ProjectPriority.P3)],
+            slack.get(task.id, 0),
+            level - ENERGY_LEVEL[task.energy],
+            CONTINUITY_RANK[task.continuity],
+            task.date_created,
+            index,
+            task,
+        )
+        for index, task in enumerate(ready)
+        if task.status != BLOCKED_STATUS
+        and ENERGY_LEVEL[task.energy] <= level
+        and SIZE_EFFORT[task.size] <= budget
+    ]
+    heapq.heapify(heap)
+    picks: list[TaskSuggestion] = []
+    while heap and len(picks) < query.limit and budget > 0:
+        rank, task_slack, *_, task = heapq.heappop(heap)
+        effort = SIZE_EFFORT[task.size]
+        if effort <= budget:
+            picks.append(TaskSuggestion(task, _PRIORITIES[rank], effort, task_slack))
+            budget -= effort
+    return picks
+
+
+class NextTaskScheduler:
+    """Suggests the next tasks from the ready list, project priorities and schedules."""
+
+    def __init__(
+        self, tasks: TaskReader, projects: ProjectReader, scheduler: ProjectScheduler
+    ) -> None:
+        """Initialize with the task and project sources and the project scheduler."""
+        self._tasks = tasks
+        self._projects = projects
+        self._scheduler = scheduler
+
+    async def suggest(self, query: NextTaskQuery) -> list[TaskSuggestion]:
+        """Load the ready tasks, their project priorities and slack, then pick."""
+        ready = await self._tasks.list_unblocked()
+        project_ids = list(dict.fromkeys(task.project_id for task in ready))
+        priorities = {p.id: p.priority for p in await self._projects.get_many(project_ids)}
+        slack: dict[UUID, int] = {}
+        for project_id in project_ids:
+            schedule = await self._scheduler.get(project_id)
+            slack.update((metrics.task_id, metrics.slack) for metrics in schedule.tasks)
+        return pick_next_tasks(ready, priorities, slack, query)
@@ -0,0 +1,177 @@
+"""Critical-path scheduling over a project's task DAG.
+
+Tasks are ordered with Kahn's algorithm; one forward pass over that order gives each
+task its earliest start and finish, one backward pass its latest start and finish.
+A schedule therefore costs O(tasks + dependencies). Effort comes from the task size
+(`SIZE_EFFORT`); done tasks have no remaining effort.
+
+`ProjectScheduler` keeps schedules in the shared read cache, one key per project
+(`schedule_key`); task writes that change a dependency, status or size drop it.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from functools import partial
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from ai_life_backend.projects.domain.schedule import ProjectSchedule, TaskSchedule
+from ai_life_backend.projects.domain.task import Task, TaskSize
+from ai_life_backend.projects.services.dag_validator import CycleDetectedError
+
+if TYPE_CHECKING:
+    from ai_life_backend.contracts.projects_protocols import TaskReader
+    from ai_life_backend.core.public import ReadThroughCache
+
+DONE_STATUS = "done"
+
+# Effort units per size; roughly Fibonacci so larger estimates carry their uncertainty
+SIZE_EFFORT: Mapping[TaskSize, int] = MappingProxyType({
+    TaskSize.XS: 1,
+    TaskSize.S: 2,
+    TaskSize.M: 3,
+    TaskSize.L: 5,
+    TaskSize.XL: 8,
+})
+
+
+def schedule_key(project_id: UUID) -> str:
+    """Cache key of one project's schedule."""
+    return f"schedule:project:{project_id}"
+
+
+def _reverse(
+    graph: Mapping[UUID, Iterable[UUID]],
+) -> tuple[dict[UUID, list[UUID]], dict[UUID, int]]:
+    """Dependents of every node and each node's number of dependencies within `graph`."""
+    dependents: dict[UUID, list[UUID]] = {node: [] for node in graph}
+    pending: dict[UUID, int] = {}
+    for node, dependencies in graph.items():
+        known = [dep for dep in dict.fromkeys(dependencies) if dep in dependents]
+        pending[node] = len(known)
+        for dep in known:
+            dependents[dep].append(node)
+    return dependents, pending
+
+
+def topological_order(graph: Mapping[UUID, Iterable[UUID]]) -> list[UUID]:
+    """Order the nodes so that each one follows all of its dependencies (Kahn).
+
+    Args:
+        graph: Adjacency list mapping each node to the nodes it depends on;
+               dependencies outside the graph are ignored
+
+    Returns:
+        Every node of `graph`; ties keep the graph's iteration order
+
+    Raises:
+        CycleDetectedError: If the graph contains a cycle
+    """
+    dependents, pending = _reverse(graph)
+    ready = deque(node for node, count in pending.items() if count == 0)
+    order: list[UUID] = []
+    while ready:
+        node = ready.popleft()
+        order.append(node)
+        for dependent in dependents[node]:
+            pending[dependent] -= 1
+            if pending[dependent] == 0:
+                ready.append(dependent)
+    if len(order) < len(pending):
+        msg = "Cycle detected in dependency graph"
+        raise CycleDetectedError(msg)
+    return order
+
+
+def _latest_finishes(
+    order: Sequence[UUID], graph: Mapping[UUID, list[UUID]], effort: Mapping[UUID, int], end: int
+) -> dict[UUID, int]:
+    """Backward pass: each task must finish before the latest start of its dependents."""
+    latest = dict.fromkeys(order, end)
+    for node in reversed(order):
+        start = latest[node] - effort[node]
+        for dep in graph[node]:
+            latest[dep] = min(latest[dep], start)
+    return latest
+
+
+def _critical_path(
+    order: Sequence[UUID], graph: Mapping[UUID, list[UUID]], by_id: Mapping[UUID, TaskSchedule]
+) -> tuple[UUID, ...]:
+    """Walk back from a task finishing last through dependencies that finish just in time."""
+    end = max((by_id[node].earliest_finish for node in order), default=0)
+    if end == 0:
+        return ()
+    current = next(by_id[n] for n in order if by_id[n].earliest_finish == end)
+    path = [current.task_id]
+    while current.earliest_start > 0:
+        current = next(
+            by_id[dep]
+            for dep in graph[current.task_id]
+            if by_id[dep].critical and by_id[dep].earliest_finish == current.earliest_start
+        )
+        path.append(current.task_id)
+    return tuple(reversed(path))
+
+
+def compute_schedule(project_id: UUID, tasks: Sequence[Task]) -> ProjectSchedule:
+    """Compute critical-path metrics for the tasks of one project.
+
+    Args:
+        project_id: Project the tasks belong to
+        tasks: Every task of the project (dependencies on other tasks are ignored)
+
+    Raises:
+        CycleDetectedError: If the task dependencies contain a cycle
+    """
+    effort = {t.id: 0 if t.status == DONE_STATUS else SIZE_EFFORT[t.size] for t in tasks}
+    graph = {t.id: [dep for dep in t.dependencies if dep in effort] for t in tasks}
+    order = topological_order(graph)
+
+    start: dict[UUID, int] = {}
+    for node in order:
+        start[node] = max((start[dep] + effort[dep] for dep in graph[node]), default=0)
+    end = max((start[node] + effort[node] for node in order), default=0)
+    latest = _latest_finishes(order, graph, effort, end)
+
+    by_id = {
+        node: TaskSchedule(
+            task_id=node,
+            effort=effort[node],
+            earliest_start=start[node],
+            earliest_finish=start[node] + effort[node],
+            latest_start=latest[node] - effort[node],
+            latest_finish=latest[node],
+            slack=latest[node] - effort[node] - start[node],
+        )
+        for node in order
+    }
+    return ProjectSchedule(
+        project_id=project_id,
+        duration=end,
+        critical_path=_critical_path(order, graph, by_id),
+        tasks=tuple(by_id.values()),
+    )
+
+
+class ProjectScheduler:
+    """Project schedules computed from the task repository, cached per project."""
+
+    def __init__(self, tasks: TaskReader, cache: ReadThroughCache | None = None) -> None:
+        """Initialize with the task source and an optional shared read cache."""
+        self._tasks = tasks
+        self._cache = cache
+
+    async def get(self, project_id: UUID) -> ProjectSchedule:
+        """Return the schedule of a project (empty when it has no tasks)."""
+        if self._cache is None:
+            return await self._load(project_id)
+        return await self._cache.get_or_load(
+            schedule_key(project_id), partial(self._load, project_id)
+        )
+
+    async def _load(self, project_id: UUID) -> ProjectSchedule:
+        return compute_schedule(project_id, await self._tasks.list_by_project(project_id))
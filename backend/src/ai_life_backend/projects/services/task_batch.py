@@ -0,0 +1,192 @@
+"""Validation of all-or-nothing task batches against the affected projects.
+
+Items are applied in order to an in-memory copy of every task in the projects the
+batch touches; references and deletions are then checked against the state the
+whole batch leaves behind, so an item may depend on a task created later in the
+same batch. The resulting graph is checked for cycles once, not once per item.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Collection, Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from ai_life_backend.core.public import BatchRejectedError
+from ai_life_backend.projects.domain.task import (
+    Task,
+    TaskBatchCreate,
+    TaskBatchDelete,
+    TaskBatchItem,
+    TaskBatchUpdate,
+)
+from ai_life_backend.projects.services.dag_validator import DagValidator
+
+
+@dataclass(slots=True)
+class TaskBatchPlan:
+    """Rows the batch writes, keyed by item index.
+
+    `versions` holds the `date_updated` each updated or deleted task had when the
+    batch was validated, so the write can detect concurrent changes.
+    """
+
+    created: dict[int, Task] = field(default_factory=dict)
+    updated: dict[int, Task] = field(default_factory=dict)
+    deleted: dict[int, Task] = field(default_factory=dict)
+    versions: dict[UUID, tuple[int, datetime]] = field(default_factory=dict)
+
+    def touched_ids(self) -> list[UUID]:
+        """IDs of created and updated tasks, whose blocker counts must be refreshed."""
+        return [task.id for task in (*self.created.values(), *self.updated.values())]
+
+    def touched_project_ids(self) -> set[UUID]:
+        """IDs of the projects any written task belongs to, whose progress must be recounted."""
+        written = (*self.created.values(), *self.updated.values(), *self.deleted.values())
+        return {task.project_id for task in written}
+
+
+def batch_scope(items: Sequence[TaskBatchItem]) -> tuple[set[UUID], set[UUID]]:
+    """Return the project IDs of created tasks and the IDs of targeted tasks.
+
+    Every task of these projects (and of the targets' projects) forms the snapshot
+    the batch is validated against; the projects themselves must exist.
+    """
+    projects = {item.data.project_id for item in items if isinstance(item, TaskBatchCreate)}
+    targets = {item.id for item in items if not isinstance(item, TaskBatchCreate)}
+    return projects, targets
+
+
+@dataclass(slots=True)
+class _BatchState:
+    """Tasks as the batch leaves them, plus which item wrote which task."""
+
+    tasks: dict[UUID, Task]
+    projects: Collection[UUID]
+    now: datetime
+    plan: TaskBatchPlan = field(default_factory=TaskBatchPlan)
+    owner: dict[UUID, int] = field(default_factory=dict)
+    errors: dict[int, str] = field(default_factory=dict)
+
+    def apply(self, index: int, item: TaskBatchItem) -> None:
+        """Apply one item, recording a problem instead of raising."""
+        target = item.id if item.id is not None else uuid4()
+        if target in self.owner:
+            self.errors[index] = f"Task {target} appears more than once in the batch"
+            return
+        self.owner[target] = index
+        try:
+            self._dispatch(index, target, item)
+        except ValueError as e:
+            self.errors[index] = str(e)
+
+    def _dispatch(self, index: int, target: UUID, item: TaskBatchItem) -> None:
+        if isinstance(item, TaskBatchCreate):
+            self._create(index, target, item)
+        elif isinstance(item, TaskBatchUpdate):
+            self._update(index, item)
+        else:
+            self._delete(index, item)
+
+    def _create(self, index: int, task_id: UUID, item: TaskBatchCreate) -> None:
+        if task_id in self.tasks:
+            msg = f"Task {task_id} already exists"
+            raise ValueError(msg)
+        data = item.data
+        if data.project_id not in self.projects:
+            msg = f"Project {data.project_id} not found"
+            raise ValueError(msg)
+        task = Task(
+            id=task_id,
+            project_id=data.project_id,
+            title=data.title,
+            status=data.status,
+            dependencies=list(data.dependencies),
+            size=data.size,
+            energy=data.energy,
+            continuity=data.continuity,
+            clarity=data.clarity,
+            risk=data.risk,
+            context=data.context,
+            date_created=self.now,
+            date_updated=self.now,
+        )
+        self.tasks[task_id] = self.plan.created[index] = task
+
+    def _update(self, index: int, item: TaskBatchUpdate) -> None:
+        existing = self._existing(index, item.id)
+        task = replace(existing, **item.data.changes(), date_updated=self.now)
+        self.tasks[item.id] = self.plan.updated[index] = task
+
+    def _delete(self, index: int, item: TaskBatchDelete) -> None:
+        self.plan.deleted[index] = self._existing(index, item.id)
+        del self.tasks[item.id]
+
+    def _existing(self, index: int, task_id: UUID) -> Task:
+        existing = self.tasks.get(task_id)
+        if existing is None:
+            msg = "Task not found"
+            raise ValueError(msg)
+        self.plan.versions[task_id] = (index, existing.date_updated)
+        return existing
+
+    def check_references(self) -> None:
+        """Check dependencies of written tasks and dependents of deleted ones."""
+        for index, task in (*self.plan.created.items(), *self.plan.updated.items()):
+            for dep_id in task.dependencies:
+                dependency = self.tasks.get(dep_id)
+                if dependency is None or dependency.project_id != task.project_id:
+                    self.errors[index] = (
+                        f"Dependency task {dep_id} not found in project {task.project_id}"
+                    )
+                    break
+        dependents = Counter(dep_id for task in self.tasks.values() for dep_id in task.dependencies)
+        for index, task in self.plan.deleted.items():
+            if dependents[task.id]:
+                self.errors[index] = (
+                    f"Task is a dependency of {dependents[task.id]} other task(s); "
+                    "remove those links first"
+                )
+
+    def check_cycles(self, validator: DagValidator) -> None:
+        """Search the final graph for a cycle once; blame the items on it."""
+        graph = {task.id: task.dependencies for task in self.tasks.values()}
+        cycle = validator.find_cycle_path(graph)
+        if cycle is None:
+            return
+        message = "Cycle detected in dependency graph: " + " -> ".join(map(str, cycle))
+        for node in cycle:
+            if node in self.owner:
+                self.errors.setdefault(self.owner[node], message)
+
+
+def plan_task_batch(
+    items: Sequence[TaskBatchItem],
+    snapshot: Mapping[UUID, Task],
+    projects: Collection[UUID],
+    validator: DagValidator,
+) -> TaskBatchPlan:
+    """Validate a batch against a snapshot of every task in the affected projects.
+
+    Args:
+        items: Batch items in request order
+        snapshot: All tasks of the projects returned by `batch_scope`, by ID
+        projects: IDs of the existing projects among those returned by `batch_scope`
+        validator: DAG validator run once over the resulting graph
+
+    Returns:
+        The rows to write
+
+    Raises:
+        BatchRejectedError: With one problem per invalid item
+    """
+    state = _BatchState(dict(snapshot), projects, datetime.now(UTC))
+    for index, item in enumerate(items):
+        state.apply(index, item)
+    state.check_references()
+    state.check_cycles(validator)
+    if state.errors:
+        raise BatchRejectedError(state.errors)
+    return state.plan
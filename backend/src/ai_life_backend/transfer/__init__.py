@@ -0,0 +1 @@
+"""Bulk data transfer module (export/import)."""
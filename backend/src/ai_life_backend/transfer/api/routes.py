@@ -0,0 +1,132 @@
+"""FastAPI router for bulk transfer (export/import) endpoints."""
+
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ai_life_backend.container import Container, get_container
+from ai_life_backend.transfer.api.schemas import ImportResponse
+from ai_life_backend.transfer.services.bulk_import import import_batch
+from ai_life_backend.transfer.services.import_format import (
+    ImportBatch,
+    ImportValidationError,
+    parse_csv,
+    parse_ndjson,
+)
+from ai_life_backend.transfer.services.ndjson_export import (
+    DEFAULT_BATCH_SIZE,
+    NDJSON_MEDIA_TYPE,
+    stream_export,
+)
+
+router = APIRouter(tags=["transfer"])
+
+MAX_BATCH_SIZE = 10_000
+CSV_MEDIA_TYPE = "text/csv"
+
+
+def get_engine() -> AsyncEngine:
+    """Dependency to get the process engine."""
+    return get_container().engine
+
+
+EngineDep = Annotated[AsyncEngine, Depends(get_engine)]
+ContainerDep = Annotated[Container, Depends(get_container)]
+BatchSize = Annotated[int, Query(ge=1, le=MAX_BATCH_SIZE)]
+CsvKind = Annotated[Literal["goal", "milestone", "project", "task"] | None, Query()]
+
+_IMPORT_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}},
+            CSV_MEDIA_TYPE: {"schema": {"type": "string"}},
+        },
+    }
+}
+_IMPORT_RESPONSES: dict[int | str, dict[str, object]] = {
+    415: {"description": "Body is neither application/x-ndjson nor text/csv"}
+}
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"description": "NDJSON export", "content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def export_ndjson(
+    engine: EngineDep, batch_size: BatchSize = DEFAULT_BATCH_SIZE
+) -> StreamingResponse:
+    """Stream every goal, milestone, project, task and dependency edge as NDJSON.
+
+    Rows are fetched through a server-side cursor from one consistent snapshot and
+    written as they arrive, so memory use does not grow with the data set.
+    """
+    return StreamingResponse(
+        stream_export(engine, batch_size),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": 'attachment; filename="ai-life-os-export.ndjson"'},
+    )
+
+
+def _parse_body(body: bytes, content_type: str, kind: str | None) -> ImportBatch:
+    """Parse an NDJSON body, or a UTF-8 CSV body of one `kind`.
+
+    Raises:
+        HTTPException: 415 for any other media type (or none), 422 for CSV without `kind`
+        UnicodeDecodeError: If a CSV body is not UTF-8
+    """
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type == NDJSON_MEDIA_TYPE:
+        return parse_ndjson(body.splitlines())
+    if media_type != CSV_MEDIA_TYPE:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Import body must be {NDJSON_MEDIA_TYPE} or {CSV_MEDIA_TYPE}",
+        )
+    if kind is None:
+        raise HTTPException(status_code=422, detail="CSV import requires the kind parameter")
+    return parse_csv(kind, body.decode("utf-8-sig"))
+
+
+@router.post(
+    "/import",
+    response_model=ImportResponse,
+    status_code=201,
+    responses=_IMPORT_RESPONSES,
+    openapi_extra=_IMPORT_BODY,
+)
+async def import_data(
+    request: Request, container: ContainerDep, kind: CsvKind = None
+) -> ImportResponse:
+    """Bulk-import new entities from NDJSON (export format) or a single-kind CSV.
+
+    The batch is COPYed into staging tables, validated set-based (duplicates,
+    existing ids, references, dependency cycles) and committed atomically: either
+    every row is written or none is.
+    """
+    content_type = request.headers.get("content-type", "")
+    try:
+        batch = _parse_body(await request.body(), content_type, kind)
+        batch.raise_errors()
+        summary = await import_batch(container.engine, batch)
+    except UnicodeDecodeError as e:
+        raise HTTPException(status_code=422, detail="CSV body must be UTF-8 encoded") from e
+    except ImportValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    except IntegrityError as e:
+        raise HTTPException(
+            status_code=409, detail="Import conflicts with concurrent changes; retry"
+        ) from e
+    await container.invalidate_bulk_insert(
+        batch.column_values("milestone", "goal_id"), batch.column_values("task", "project_id")
+    )
+    return ImportResponse(
+        goals=summary.goals,
+        milestones=summary.milestones,
+        projects=summary.projects,
+        tasks=summary.tasks,
+    )
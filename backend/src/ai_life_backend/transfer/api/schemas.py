@@ -0,0 +1,12 @@
+"""Pydantic schemas for the transfer API."""
+
+from pydantic import BaseModel
+
+
+class ImportResponse(BaseModel):
+    """Number of rows written per entity type by a bulk import."""
+
+    goals: int
+    milestones: int
+    projects: int
+    tasks: int
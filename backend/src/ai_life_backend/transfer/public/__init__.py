@@ -0,0 +1,38 @@
+"""Public API for backend.transfer — bulk NDJSON export and COPY-based import."""
+
+from fastapi import APIRouter
+
+from ai_life_backend.core.public import make_public_router
+from ai_life_backend.transfer.api.routes import router as _internal_router
+from ai_life_backend.transfer.services.bulk_import import ImportSummary, import_batch
+from ai_life_backend.transfer.services.import_format import (
+    ImportBatch,
+    ImportValidationError,
+    parse_csv,
+    parse_ndjson,
+)
+from ai_life_backend.transfer.services.ndjson_export import (
+    DEFAULT_BATCH_SIZE,
+    EXPORT_FORMAT,
+    EXPORT_VERSION,
+    NDJSON_MEDIA_TYPE,
+    stream_export,
+)
+
+# ---------- HTTP public surface (router) ----------
+transfer_router: APIRouter = make_public_router(_internal_router)
+
+__all__ = [
+    "DEFAULT_BATCH_SIZE",
+    "EXPORT_FORMAT",
+    "EXPORT_VERSION",
+    "NDJSON_MEDIA_TYPE",
+    "ImportBatch",
+    "ImportSummary",
+    "ImportValidationError",
+    "import_batch",
+    "parse_csv",
+    "parse_ndjson",
+    "stream_export",
+    "transfer_router",
+]
@@ -0,0 +1 @@
+"""Transfer services package."""
@@ -0,0 +1,224 @@
+"""Atomic bulk import through COPY into staging tables.
+
+All rows are COPYed (asyncpg `copy_records_to_table`) into temporary staging tables
+shaped like their targets, validated with a handful of set-based queries plus one
+DAG pass over the imported dependency edges, and then moved into the real tables
+with `INSERT ... SELECT` — all in one transaction, so a rejected batch leaves no
+trace. Imported entities are new rows; existing rows are never updated.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Insert, MetaData, Table, Update, func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from ai_life_backend.milestones.repository.postgres_milestone_repository import goal_progress
+from ai_life_backend.projects.repository.postgres_project_repository import (
+    project_dependencies_table,
+)
+from ai_life_backend.projects.repository.postgres_task_repository import (
+    DONE_STATUS,
+    project_progress,
+    task_dependencies_table,
+    tasks_table,
+)
+from ai_life_backend.projects.services.dag_validator import DagValidator
+from ai_life_backend.transfer.services.import_format import (
+    IMPORT_SPECS,
+    MAX_REPORTED_ERRORS,
+    ImportBatch,
+    ImportValidationError,
+)
+
+_staging_metadata = MetaData()
+
+# Staging tables share the target's columns and defaults; ON COMMIT DROP removes
+# them with the transaction whether it commits or rolls back.
+_STAGING = {
+    spec.kind: spec.table.to_metadata(_staging_metadata, name=f"import_{spec.table.name}")
+    for spec in IMPORT_SPECS.values()
+}
+_CREATE_STAGING = (
+    "CREATE TEMP TABLE import_goals (LIKE goals INCLUDING DEFAULTS) ON COMMIT DROP",
+    "CREATE TEMP TABLE import_milestones (LIKE milestones INCLUDING DEFAULTS) ON COMMIT DROP",
+    "CREATE TEMP TABLE import_projects (LIKE projects INCLUDING DEFAULTS) ON COMMIT DROP",
+    "CREATE TEMP TABLE import_tasks (LIKE tasks INCLUDING DEFAULTS) ON COMMIT DROP",
+)
+_ANALYZE_STAGING = "ANALYZE import_goals, import_milestones, import_projects, import_tasks"
+
+# Every row-to-row rule in one round trip; each branch yields problem messages.
+_SET_CHECKS = """
+(SELECT 'goal ' || id || ' appears more than once' FROM import_goals
+ GROUP BY id HAVING count(*) > 1)
+UNION ALL
+(SELECT 'milestone ' || id || ' appears more than once' FROM import_milestones
+ GROUP BY id HAVING count(*) > 1)
+UNION ALL
+(SELECT 'project ' || id || ' appears more than once' FROM import_projects
+ GROUP BY id HAVING count(*) > 1)
+UNION ALL
+(SELECT 'task ' || id || ' appears more than once' FROM import_tasks
+ GROUP BY id HAVING count(*) > 1)
+UNION ALL
+(SELECT 'goal ' || s.id || ' already exists' FROM import_goals s JOIN goals USING (id))
+UNION ALL
+(SELECT 'milestone ' || s.id || ' already exists' FROM import_milestones s
+ JOIN milestones USING (id))
+UNION ALL
+(SELECT 'project ' || s.id || ' already exists' FROM import_projects s JOIN projects USING (id))
+UNION ALL
+(SELECT 'task ' || s.id || ' already exists' FROM import_tasks s JOIN tasks USING (id))
+UNION ALL
+(SELECT 'milestone ' || s.id || ': goal ' || s.goal_id || ' not found'
+ FROM import_milestones s
+ WHERE NOT EXISTS (SELECT 1 FROM goals g WHERE g.id = s.goal_id)
+   AND NOT EXISTS (SELECT 1 FROM import_goals g WHERE g.id = s.goal_id))
+UNION ALL
+(SELECT 'project ' || s.id || ': goal ' || s.goal_id || ' not found'
+ FROM import_projects s
+ WHERE s.goal_id IS NOT NULL
+   AND NOT EXISTS (SELECT 1 FROM goals g WHERE g.id = s.goal_id)
+   AND NOT EXISTS (SELECT 1 FROM import_goals g WHERE g.id = s.goal_id))
+UNION ALL
+(SELECT 'task ' || s.id || ': project ' || s.project_id || ' not found'
+ FROM import_tasks s
+ WHERE NOT EXISTS (SELECT 1 FROM projects p WHERE p.id = s.project_id)
+   AND NOT EXISTS (SELECT 1 FROM import_projects p WHERE p.id = s.project_id))
+UNION ALL
+(SELECT 'project ' || s.id || ': dependency ' || d.id || ' not found'
+ FROM import_projects s CROSS JOIN LATERAL unnest(s.dependencies) AS d(id)
+ WHERE NOT EXISTS (SELECT 1 FROM projects p WHERE p.id = d.id)
+   AND NOT EXISTS (SELECT 1 FROM import_projects p WHERE p.id = d.id))
+UNION ALL
+(SELECT 'task ' || s.id || ': dependency ' || d.id || ' not found in project ' || s.project_id
+ FROM import_tasks s CROSS JOIN LATERAL unnest(s.dependencies) AS d(id)
+ WHERE NOT EXISTS (SELECT 1 FROM tasks t WHERE t.id = d.id AND t.project_id = s.project_id)
+   AND NOT EXISTS (
+     SELECT 1 FROM import_tasks t WHERE t.id = d.id AND t.project_id = s.project_id))
+LIMIT :limit
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class ImportSummary:
+    """Number of rows written per entity type."""
+
+    goals: int
+    milestones: int
+    projects: int
+    tasks: int
+
+
+def _graph_errors(batch: ImportBatch) -> list[str]:
+    """Find a dependency cycle among the imported projects and tasks in one pass each.
+
+    Existing rows never depend on imported ones, so any new cycle lies entirely
+    within the imported edges; edges into existing rows end at leaves here.
+    """
+    errors = []
+    validator = DagValidator()
+    for kind in ("project", "task"):
+        dependencies_at = IMPORT_SPECS[kind].column_names.index("dependencies")
+        graph: dict[UUID, list[UUID]] = {
+            row[0]: row[dependencies_at] for row in batch.rows[kind] if row[dependencies_at]
+        }
+        cycle = validator.find_cycle_path(graph)
+        if cycle is not None:
+            errors.append(f"{kind} dependency cycle: " + " -> ".join(map(str, cycle)))
+    return errors
+
+
+async def _stage(conn: AsyncConnection, batch: ImportBatch) -> None:
+    """Create the staging tables and COPY every batch row into them."""
+    for statement in _CREATE_STAGING:
+        await conn.execute(text(statement))
+    driver: Any = (await conn.get_raw_connection()).driver_connection
+    for kind, rows in batch.rows.items():
+        if rows:
+            await driver.copy_records_to_table(
+                _STAGING[kind].name, records=rows, columns=IMPORT_SPECS[kind].column_names
+            )
+    await conn.execute(text(_ANALYZE_STAGING))
+
+
+def _move(kind: str) -> Insert:
+    """`INSERT INTO <target> SELECT ... FROM <staging>` for the imported columns."""
+    spec = IMPORT_SPECS[kind]
+    staging = _STAGING[kind]
+    return spec.table.insert().from_select(
+        spec.column_names, select(*(staging.c[name] for name in spec.column_names))
+    )
+
+
+def _move_edges(kind: str, edges: Table, owner: str) -> Insert:
+    """Rebuild adjacency rows for the imported entities from their dependency arrays."""
+    staging = _STAGING[kind]
+    return edges.insert().from_select(
+        [owner, "depends_on_id"],
+        select(staging.c.id, func.unnest(staging.c.dependencies)).distinct(),
+    )
+
+
+def _count_open_blockers() -> Update:
+    """Set `open_blocker_count` of imported tasks from their not-done dependencies."""
+    dependency = tasks_table.alias("dependency")
+    imported = _STAGING["task"]
+    open_blockers = (
+        select(task_dependencies_table.c.task_id, func.count().label("n"))
+        .join(imported, imported.c.id == task_dependencies_table.c.task_id)
+        .join(dependency, dependency.c.id == task_dependencies_table.c.depends_on_id)
+        .where(dependency.c.status != DONE_STATUS)
+        .group_by(task_dependencies_table.c.task_id)
+        .subquery()
+    )
+    return (
+        tasks_table
+        .update()
+        .where(tasks_table.c.id == open_blockers.c.task_id)
+        .values(open_blocker_count=open_blockers.c.n)
+    )
+
+
+async def _recount_progress(conn: AsyncConnection) -> None:
+    """Recount the progress rows of the goals and projects that gained children."""
+    staged_milestones, staged_tasks = _STAGING["milestone"], _STAGING["task"]
+    goals = await conn.execute(select(staged_milestones.c.goal_id).distinct())
+    await conn.execute(goal_progress.recount(goals.scalars().all()))
+    projects = await conn.execute(select(staged_tasks.c.project_id).distinct())
+    await conn.execute(project_progress.recount(projects.scalars().all()))
+
+
+async def import_batch(engine: AsyncEngine, batch: ImportBatch) -> ImportSummary:
+    """Validate and write a parsed batch atomically.
+
+    Raises:
+        ImportValidationError: If any record, reference or dependency is invalid
+            (the transaction is rolled back and nothing is written)
+    """
+    batch.raise_errors()
+    cycles = _graph_errors(batch)
+    if cycles:
+        raise ImportValidationError(cycles)
+    async with engine.begin() as conn:
+        await _stage(conn, batch)
+        result = await conn.execute(text(_SET_CHECKS), {"limit": MAX_REPORTED_ERRORS})
+        problems = list(result.scalars().all())
+        if problems:
+            raise ImportValidationError(problems)
+        for kind in ("goal", "milestone", "project", "task"):
+            await conn.execute(_move(kind))
+        await conn.execute(_move_edges("project", project_dependencies_table, "project_id"))
+        await conn.execute(_move_edges("task", task_dependencies_table, "task_id"))
+        await conn.execute(_count_open_blockers())
+        await _recount_progress(conn)
+    counts = batch.counts()
+    return ImportSummary(
+        goals=counts["goal"],
+        milestones=counts["milestone"],
+        projects=counts["project"],
+        tasks=counts["task"],
+    )
@@ -0,0 +1,318 @@
+"""Parsing of bulk import files (NDJSON export format or single-entity CSV).
+
+Records are checked and converted row by row into tuples in COPY column order;
+everything that needs other rows (duplicates, references, cycles) is validated
+set-based later, against the staged batch.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+import csv
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+import io
+import json
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import Table
+
+from ai_life_backend.goals.repository.postgres_goal_repository import goals_table
+from ai_life_backend.milestones.repository.postgres_milestone_repository import (
+    milestones_table,
+)
+from ai_life_backend.projects.domain.project import ProjectPriority, ProjectRisk
+from ai_life_backend.projects.domain.task import (
+    TaskClarity,
+    TaskContinuity,
+    TaskEnergy,
+    TaskRisk,
+    TaskSize,
+)
+from ai_life_backend.projects.repository.postgres_project_repository import projects_table
+from ai_life_backend.projects.repository.postgres_task_repository import tasks_table
+from ai_life_backend.transfer.services.ndjson_export import EXPORT_FORMAT, EXPORT_VERSION
+
+MAX_TEXT_LENGTH = 255
+MAX_REPORTED_ERRORS = 50
+LIST_SEPARATOR = "|"
+STATUSES = frozenset({"todo", "doing", "done", "blocked"})
+
+# Edge records of the export mirror the `dependencies` arrays, which are the source
+# of truth on import; the edge tables are rebuilt from them.
+DERIVED_KINDS = frozenset({"meta", "project_dependency", "task_dependency"})
+
+Parser = Callable[[object], object]
+
+
+class ImportValidationError(ValueError):
+    """Raised when an import batch is rejected; nothing has been written."""
+
+    def __init__(self, errors: list[str]) -> None:
+        """Keep the individual problems (at most MAX_REPORTED_ERRORS)."""
+        self.errors = errors[:MAX_REPORTED_ERRORS]
+        super().__init__(f"Import rejected ({len(errors)} problem(s)): " + "; ".join(self.errors))
+
+
+def _uuid(value: object) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _items(value: object) -> list[object]:
+    if isinstance(value, str):
+        return list(value.split(LIST_SEPARATOR))
+    if isinstance(value, list | tuple):
+        return list(value)
+    msg = "must be a list"
+    raise TypeError(msg)
+
+
+def _uuids(value: object) -> list[UUID]:
+    return [_uuid(item) for item in _items(value) if str(item).strip()]
+
+
+def _strings(value: object) -> list[str]:
+    return [str(item) for item in _items(value) if str(item).strip()]
+
+
+def _bool(value: object) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in {"true", "1", "yes"}:
+        return True
+    if text in {"false", "0", "no"}:
+        return False
+    msg = f"invalid boolean {value!r}"
+    raise ValueError(msg)
+
+
+def _datetime(value: object) -> datetime:
+    moment = value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=UTC)
+
+
+def _title(value: object) -> str:
+    text = str(value)
+    if not text.strip():
+        msg = "cannot be empty"
+        raise ValueError(msg)
+    if len(text) > MAX_TEXT_LENGTH:
+        msg = f"cannot exceed {MAX_TEXT_LENGTH} characters"
+        raise ValueError(msg)
+    return text
+
+
+def _status(value: object) -> str:
+    if value not in STATUSES:
+        msg = f"must be one of {', '.join(sorted(STATUSES))}"
+        raise ValueError(msg)
+    return str(value)
+
+
+def _enum(enum_type: type[Enum]) -> Parser:
+    return lambda value: enum_type(value).value
+
+
+def _now() -> datetime:
+    return datetime.now(UTC)
+
+
+@dataclass(frozen=True, slots=True)
+class ImportColumn:
+    """One imported column: its parser and, if optional, a default factory.
+
+    Missing, null and empty-string values take the default (or are rejected when
+    the column has none); anything else goes through `parse`.
+    """
+
+    name: str
+    parse: Parser
+    default: Callable[[], Any] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ImportSpec:
+    """Record kind, target table and the columns loaded for it (in COPY order)."""
+
+    kind: str
+    table: Table
+    columns: tuple[ImportColumn, ...]
+
+    @property
+    def column_names(self) -> list[str]:
+        """Column names in COPY order."""
+        return [column.name for column in self.columns]
+
+    def row(self, data: Mapping[str, Any]) -> tuple[Any, ...]:
+        """Convert one record; raises ValueError naming the offending column."""
+        values = []
+        for column in self.columns:
+            raw = data.get(column.name)
+            if raw is None or (isinstance(raw, str) and not raw):
+                if column.default is None:
+                    msg = f"{column.name} is required"
+                    raise ValueError(msg)
+                values.append(column.default())
+                continue
+            try:
+                values.append(column.parse(raw))
+            except (TypeError, ValueError) as e:
+                msg = f"{column.name} {e}"
+                raise ValueError(msg) from e
+        return tuple(values)
+
+
+_ID = ImportColumn("id", _uuid, uuid4)
+_TIMESTAMPS = (
+    ImportColumn("date_created", _datetime, _now),
+    ImportColumn("date_updated", _datetime, _now),
+)
+
+IMPORT_SPECS: dict[str, ImportSpec] = {
+    spec.kind: spec
+    for spec in (
+        ImportSpec(
+            "goal",
+            goals_table,
+            (
+                _ID,
+                ImportColumn("title", _title),
+                ImportColumn("is_done", _bool, lambda: False),
+                *_TIMESTAMPS,
+            ),
+        ),
+        ImportSpec(
+            "milestone",
+            milestones_table,
+            (
+                _ID,
+                ImportColumn("goal_id", _uuid),
+                ImportColumn("title", _title),
+                ImportColumn("due", _datetime, lambda: None),
+                ImportColumn("status", _status, lambda: "todo"),
+                ImportColumn("demo_criterion", _title),
+                ImportColumn("blocking", _bool, lambda: False),
+                *_TIMESTAMPS,
+            ),
+        ),
+        ImportSpec(
+            "project",
+            projects_table,
+            (
+                _ID,
+                ImportColumn("goal_id", _uuid, lambda: None),
+                ImportColumn("title", _title),
+                ImportColumn("status", _status, lambda: "todo"),
+                ImportColumn("priority", _enum(ProjectPriority)),
+                ImportColumn("scope", str, str),
+                ImportColumn("risk", _enum(ProjectRisk)),
+                ImportColumn("tags", _strings, list),
+                ImportColumn("dependencies", _uuids, list),
+                *_TIMESTAMPS,
+            ),
+        ),
+        ImportSpec(
+            "task",
+            tasks_table,
+            (
+                _ID,
+                ImportColumn("project_id", _uuid),
+                ImportColumn("title", _title),
+                ImportColumn("status", _status, lambda: "todo"),
+                ImportColumn("dependencies", _uuids, list),
+                ImportColumn("size", _enum(TaskSize)),
+                ImportColumn("energy", _enum(TaskEnergy)),
+                ImportColumn("continuity", _enum(TaskContinuity)),
+                ImportColumn("clarity", _enum(TaskClarity)),
+                ImportColumn("risk", _enum(TaskRisk)),
+                ImportColumn("context", str, str),
+                *_TIMESTAMPS,
+            ),
+        ),
+    )
+}
+
+
+@dataclass(slots=True)
+class ImportBatch:
+    """Converted rows per record kind plus the per-record problems found so far."""
+
+    rows: dict[str, list[tuple[Any, ...]]] = field(
+        default_factory=lambda: {kind: [] for kind in IMPORT_SPECS}
+    )
+    errors: list[str] = field(default_factory=list)
+
+    def add(self, kind: str, data: object, line: int) -> None:
+        """Convert and append one record, recording a problem instead of raising."""
+        spec = IMPORT_SPECS.get(kind)
+        if spec is None:
+            self.errors.append(f"line {line}: unknown record type {kind!r}")
+            return
+        if not isinstance(data, Mapping):
+            self.errors.append(f"line {line}: {kind} data must be an object")
+            return
+        try:
+            self.rows[kind].append(spec.row(data))
+        except ValueError as e:
+            self.errors.append(f"line {line}: {kind} {e}")
+
+    def raise_errors(self) -> None:
+        """Reject the batch if any record was invalid."""
+        if self.errors:
+            raise ImportValidationError(self.errors)
+
+    def column_values(self, kind: str, name: str) -> set[Any]:
+        """Distinct values of one column across the rows of a kind."""
+        position = IMPORT_SPECS[kind].column_names.index(name)
+        return {row[position] for row in self.rows[kind]}
+
+    def counts(self) -> dict[str, int]:
+        """Number of rows per record kind."""
+        return {kind: len(rows) for kind, rows in self.rows.items()}
+
+
+def _check_meta(data: object, line: int, batch: ImportBatch) -> None:
+    if not isinstance(data, Mapping) or data.get("format") != EXPORT_FORMAT:
+        batch.errors.append(f"line {line}: meta record is not an {EXPORT_FORMAT} header")
+    elif data.get("version") != EXPORT_VERSION:
+        batch.errors.append(f"line {line}: unsupported export version {data.get('version')!r}")
+
+
+def parse_ndjson(lines: Iterable[bytes | str]) -> ImportBatch:
+    """Parse `{"type", "data"}` lines as written by the NDJSON export."""
+    batch = ImportBatch()
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            batch.errors.append(f"line {line_number}: invalid JSON")
+            continue
+        if not isinstance(record, dict):
+            batch.errors.append(f"line {line_number}: record must be an object")
+            continue
+        kind, data = record.get("type"), record.get("data")
+        if kind == "meta":
+            _check_meta(data, line_number, batch)
+        elif kind not in DERIVED_KINDS:
+            batch.add(str(kind), data, line_number)
+    return batch
+
+
+def parse_csv(kind: str, text: str) -> ImportBatch:
+    """Parse a CSV of one record kind; the header row names the columns.
+
+    List columns (`tags`, `dependencies`) hold `|`-separated values.
+    """
+    batch = ImportBatch()
+    if kind not in IMPORT_SPECS:
+        batch.errors.append(f"unknown record type {kind!r}")
+        return batch
+    reader = csv.DictReader(io.StringIO(text))
+    for data in reader:
+        batch.add(kind, data, reader.line_num)
+    return batch
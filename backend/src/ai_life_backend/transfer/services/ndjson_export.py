@@ -0,0 +1,109 @@
+"""Streaming NDJSON export of every entity and dependency edge.
+
+Each line is one record `{"type": <kind>, "data": {<column>: <value>}}`. The first
+line is a `meta` record; sections follow parent-first (goals, milestones, projects,
+tasks, then the `project_dependency` / `task_dependency` edges), so the stream can be
+replayed in order. Rows are read through a server-side cursor in `batch_size`
+partitions inside one read-only REPEATABLE READ transaction: memory stays flat and
+all sections come from the same snapshot.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import TypeAdapter
+from sqlalchemy import Select, Table, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ai_life_backend.goals.repository.postgres_goal_repository import goals_table
+from ai_life_backend.milestones.repository.postgres_milestone_repository import (
+    milestones_table,
+)
+from ai_life_backend.projects.repository.postgres_project_repository import (
+    project_dependencies_table,
+    projects_table,
+)
+from ai_life_backend.projects.repository.postgres_task_repository import (
+    task_dependencies_table,
+    tasks_table,
+)
+
+EXPORT_FORMAT = "ai-life-os.ndjson"
+EXPORT_VERSION = 1
+DEFAULT_BATCH_SIZE = 1000
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_record_adapter: TypeAdapter[dict[str, Any]] = TypeAdapter(dict[str, Any])
+
+
+@dataclass(frozen=True, slots=True)
+class ExportSection:
+    """One table of the export.
+
+    Attributes:
+        kind: Record `type` written for each row
+        table: Source table
+        derived: Columns left out because they are recomputed on import
+    """
+
+    kind: str
+    table: Table
+    derived: frozenset[str] = frozenset()
+
+    def statement(self) -> Select[Any]:
+        """Select the exported columns in primary-key order."""
+        columns = [column for column in self.table.c if column.name not in self.derived]
+        return select(*columns).order_by(*self.table.primary_key.columns)
+
+
+EXPORT_SECTIONS: tuple[ExportSection, ...] = (
+    ExportSection("goal", goals_table),
+    ExportSection("milestone", milestones_table),
+    ExportSection("project", projects_table),
+    ExportSection("task", tasks_table, frozenset({"open_blocker_count"})),
+    ExportSection("project_dependency", project_dependencies_table),
+    ExportSection("task_dependency", task_dependencies_table),
+)
+
+
+def encode_record(kind: str, data: dict[str, Any]) -> bytes:
+    """Serialize one NDJSON line (UUIDs and datetimes as ISO strings)."""
+    return _record_adapter.dump_json({"type": kind, "data": data}) + b"\n"
+
+
+def meta_record(exported_at: datetime | None = None) -> bytes:
+    """Header line identifying the format, its version and the export time."""
+    return encode_record(
+        "meta",
+        {
+            "format": EXPORT_FORMAT,
+            "version": EXPORT_VERSION,
+            "exported_at": exported_at or datetime.now(UTC),
+            "sections": [section.kind for section in EXPORT_SECTIONS],
+        },
+    )
+
+
+async def stream_export(
+    engine: AsyncEngine, batch_size: int = DEFAULT_BATCH_SIZE
+) -> AsyncIterator[bytes]:
+    """Yield the export as NDJSON chunks, one chunk per `batch_size` rows.
+
+    Args:
+        engine: Database engine (one pooled connection is held while streaming)
+        batch_size: Rows fetched per server-side cursor round trip
+    """
+    yield meta_record()
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="REPEATABLE READ", postgresql_readonly=True)
+        async with conn.begin():
+            for section in EXPORT_SECTIONS:
+                result = await conn.stream(
+                    section.statement().execution_options(yield_per=batch_size)
+                )
+                async for rows in result.partitions():
+                    yield b"".join(encode_record(section.kind, row._asdict()) for row in rows)
@@ -0,0 +1,125 @@
+"""Tests for the TTL cache backend and the read-through helper."""
+
+from ai_life_backend.core.public import CacheBackend, CacheSettings, ReadThroughCache, TTLCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+class TestTTLCache:
+    """Test expiry, LRU eviction and counters."""
+
+    async def test_entry_expires_after_ttl(self):
+        """Test that an entry is served until its TTL elapses."""
+        clock = FakeClock()
+        cache = TTLCache(ttl_seconds=10, max_entries=4, clock=clock)
+        await cache.set("a", 1)
+
+        clock.now = 9.9
+        assert await cache.get("a") == 1
+        clock.now = 10
+        assert await cache.get("a") is None
+        assert len(cache) == 0
+
+    async def test_evicts_least_recently_used(self):
+        """Test that reads refresh recency and the oldest entry is evicted."""
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+
+        await cache.set("c", 3)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    async def test_stats(self):
+        """Test hit/miss counters and hit ratio."""
+        cache = TTLCache(ttl_seconds=60, max_entries=8)
+        await cache.set("a", 1)
+        await cache.get("a")
+        await cache.get("a")
+        await cache.get("missing")
+        await cache.delete("a", "missing")
+
+        assert cache.stats() == {
+            "hits": 2,
+            "misses": 1,
+            "evictions": 0,
+            "size": 0,
+            "hit_ratio": 0.6667,
+        }
+
+    def test_implements_backend_protocol(self):
+        """Test that TTLCache satisfies the pluggable backend interface."""
+        assert isinstance(TTLCache(ttl_seconds=1, max_entries=1), CacheBackend)
+
+
+class TestReadThroughCache:
+    """Test loading, invalidation and the stale write-back guard."""
+
+    async def test_loads_once(self):
+        """Test that a hit skips the loader."""
+        cache = ReadThroughCache(TTLCache(ttl_seconds=60, max_entries=8))
+        calls = []
+
+        async def load():
+            calls.append(1)
+            return "value"
+
+        assert await cache.get_or_load("k", load) == "value"
+        assert await cache.get_or_load("k", load) == "value"
+        assert len(calls) == 1
+
+    async def test_none_is_not_cached(self):
+        """Test that a missing entity is looked up again next time."""
+        cache = ReadThroughCache(TTLCache(ttl_seconds=60, max_entries=8))
+        calls = []
+
+        async def load():
+            calls.append(1)
+
+        await cache.get_or_load("k", load)
+        await cache.get_or_load("k", load)
+        assert len(calls) == 2
+
+    async def test_invalidate_during_load_skips_write_back(self):
+        """Test that a load racing with a write does not cache its stale result."""
+        backend = TTLCache(ttl_seconds=60, max_entries=8)
+        cache = ReadThroughCache(backend)
+
+        async def load():
+            await cache.invalidate("k")
+            return "stale"
+
+        assert await cache.get_or_load("k", load) == "stale"
+        assert await backend.get("k") is None
+
+
+class TestCacheSettings:
+    """Test environment-driven cache settings."""
+
+    def test_defaults_enabled(self, monkeypatch):
+        """Test that caching is on by default."""
+        monkeypatch.delenv("CACHE_TTL_SECONDS", raising=False)
+        monkeypatch.delenv("CACHE_MAX_ENTRIES", raising=False)
+
+        assert CacheSettings.from_env() == CacheSettings()
+        assert CacheSettings().enabled
+
+    def test_zero_ttl_disables(self, monkeypatch):
+        """Test that CACHE_TTL_SECONDS=0 turns the cache off."""
+        monkeypatch.setenv("CACHE_TTL_SECONDS", "0")
+
+        assert not CacheSettings.from_env().enabled
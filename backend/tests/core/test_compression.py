@@ -0,0 +1,174 @@
+"""Tests for the response compression middleware."""
+
+import asyncio
+import gzip
+import zlib
+
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+import pytest
+
+from ai_life_backend.core.compression import negotiate_encoding
+from ai_life_backend.core.public import CompressionMiddleware, CompressionSettings
+
+LARGE = b'{"items":[' + b",".join(b'{"title":"Goal"}' for _ in range(200)) + b"]}"
+
+
+def build_app():
+    """App with a small, a large, an already encoded and a streamed response."""
+    app = FastAPI()
+
+    @app.get("/small")
+    async def small() -> Response:
+        return Response(b'{"ok":true}', media_type="application/json")
+
+    @app.get("/large")
+    async def large() -> Response:
+        return Response(LARGE, media_type="application/json", headers={"ETag": '"v1"'})
+
+    @app.get("/encoded")
+    async def encoded() -> Response:
+        return Response(gzip.compress(LARGE), headers={"Content-Encoding": "gzip"})
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def lines():
+            for i in range(3):
+                yield f'{{"line":{i}}}\n'.encode()
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return app
+
+
+@pytest.fixture
+async def client():
+    """Create a client for the app wrapped in the middleware."""
+    app = CompressionMiddleware(build_app(), CompressionSettings(minimum_size=500))
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def raw_get(client, path, accept="gzip"):
+    """GET without letting httpx decode the body."""
+    async with client.stream("GET", path, headers={"Accept-Encoding": accept}) as response:
+        body = b"".join([chunk async for chunk in response.aiter_raw()])
+    return response, body
+
+
+class TestNegotiateEncoding:
+    """Test Accept-Encoding parsing."""
+
+    def test_prefers_brotli_when_available(self):
+        """Test the server preference and the fallback without brotli."""
+        assert negotiate_encoding("gzip, deflate, br", brotli=True) == "br"
+        assert negotiate_encoding("gzip, deflate, br", brotli=False) == "gzip"
+
+    def test_quality_zero_refuses(self):
+        """Test that q=0 excludes a coding and `*` accepts any."""
+        assert negotiate_encoding("gzip;q=0, br;q=0.5", brotli=False) is None
+        assert negotiate_encoding("*", brotli=False) == "gzip"
+        assert negotiate_encoding("", brotli=True) is None
+
+    def test_wildcard_does_not_override_refusal(self):
+        """Test that `*` accepts only codings not refused by name."""
+        assert negotiate_encoding("gzip;q=0, *", brotli=False) is None
+        assert negotiate_encoding("br;q=0, *", brotli=True) == "gzip"
+
+
+class TestCompressionSettings:
+    """Test environment settings."""
+
+    def test_from_env(self, monkeypatch):
+        """Test that COMPRESSION_* variables override the defaults."""
+        monkeypatch.setenv("COMPRESSION_MIN_SIZE", "2048")
+        monkeypatch.setenv("COMPRESSION_ENABLED", "off")
+
+        settings = CompressionSettings.from_env()
+
+        assert settings.minimum_size == 2048
+        assert not settings.enabled
+
+    def test_rejects_invalid_level(self):
+        """Test that levels zlib would refuse fail at startup."""
+        with pytest.raises(ValueError, match="gzip level"):
+            CompressionSettings(gzip_level=0)
+        with pytest.raises(ValueError, match="brotli quality"):
+            CompressionSettings(brotli_quality=-1)
+
+
+class TestCompressionMiddleware:
+    """Test thresholds, headers and streaming."""
+
+    async def test_large_body_is_gzipped(self, client):
+        """Test that a body above the threshold is compressed with matching headers."""
+        response, body = await raw_get(client, "/large")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["content-length"] == str(len(body))
+        assert response.headers["etag"] == 'W/"v1"'
+        assert gzip.decompress(body) == LARGE
+
+    async def test_small_body_is_not_compressed(self, client):
+        """Test that bodies below the threshold are sent as is."""
+        response, body = await raw_get(client, "/small")
+
+        assert "content-encoding" not in response.headers
+        assert body == b'{"ok":true}'
+
+    async def test_identity_client(self, client):
+        """Test that clients without a supported coding get the plain body."""
+        response, body = await raw_get(client, "/large", accept="identity")
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"] == '"v1"'
+        assert body == LARGE
+
+    async def test_encoded_body_is_untouched(self, client):
+        """Test that a response with its own Content-Encoding is not compressed twice."""
+        _, body = await raw_get(client, "/encoded")
+
+        assert gzip.decompress(body) == LARGE
+
+    async def test_disabled(self):
+        """Test that disabled settings pass everything through."""
+        app = CompressionMiddleware(build_app(), CompressionSettings(enabled=False))
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response, _ = await raw_get(client, "/large")
+
+        assert "content-encoding" not in response.headers
+
+    async def test_stream_is_flushed_per_chunk(self):
+        """Test that every streamed chunk decodes on its own, before the stream ends."""
+        app = CompressionMiddleware(build_app(), CompressionSettings(minimum_size=500))
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/stream",
+            "raw_path": b"/stream",
+            "query_string": b"",
+            "headers": [(b"accept-encoding", b"gzip")],
+        }
+        sent = []
+        disconnected = asyncio.Event()
+
+        async def receive():
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+
+        await app(scope, receive, send)
+
+        headers = dict(sent[0]["headers"])
+        assert headers[b"content-encoding"] == b"gzip"
+        assert b"content-length" not in headers
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        chunks = [decoder.decompress(m["body"]) for m in sent[1:] if m["body"]]
+        assert chunks[:3] == [b'{"line":0}\n', b'{"line":1}\n', b'{"line":2}\n']
+        assert decoder.eof
@@ -0,0 +1,144 @@
+"""Tests for orjson response rendering and Problem Details error responses."""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import Enum
+from uuid import UUID
+
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.exceptions import RequestValidationError
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+import pytest
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from ai_life_backend.core import http_error
+from ai_life_backend.core.public import FastJSONResponse, ProblemJSONResponse, make_public_router
+from ai_life_backend.errors import http_exception_handler, validation_exception_handler
+
+
+class Color(str, Enum):
+    """Sample enum."""
+
+    RED = "red"
+
+
+@dataclass(frozen=True, slots=True)
+class Point:
+    """Sample dataclass."""
+
+    id: UUID
+    color: Color
+    at: datetime
+
+
+class Item(BaseModel):
+    """Sample response model."""
+
+    name: str
+
+
+class TestFastJSONResponse:
+    """Test rendering of values the standard encoder cannot handle."""
+
+    def test_renders_domain_values(self):
+        """Test that UUIDs, enums, dataclasses and UTC datetimes are encoded natively."""
+        point = Point(
+            UUID("12345678-1234-5678-1234-567812345678"),
+            Color.RED,
+            datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+        )
+
+        response = FastJSONResponse({"points": [point], 1: None})
+
+        assert response.body == (
+            b'{"points":[{"id":"12345678-1234-5678-1234-567812345678","color":"red",'
+            b'"at":"2025-01-02T03:04:05Z"}],"1":null}'
+        )
+        assert response.headers["content-type"] == "application/json"
+
+    def test_problem_media_type(self):
+        """Test that Problem responses declare application/problem+json."""
+        response = ProblemJSONResponse({"title": "Not Found", "status": 404}, status_code=404)
+
+        assert response.headers["content-type"] == "application/problem+json"
+
+    async def test_public_router_defaults_to_fast_response(self, monkeypatch):
+        """Test that routes of a public router, response-model ones included, use it."""
+        monkeypatch.setattr(FastJSONResponse, "render", staticmethod(lambda _: b'"fast"'))
+        internal = APIRouter()
+
+        @internal.get("/item", response_model=Item)
+        async def read_item() -> Item:
+            return Item(name="x")
+
+        app = FastAPI()
+        app.include_router(make_public_router(internal))
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/item")
+
+        assert response.json() == "fast"
+
+
+@pytest.fixture
+async def client():
+    """Create a client for an app using the Problem Details handlers."""
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.exception_handler(StarletteHTTPException)(http_exception_handler)
+    app.exception_handler(RequestValidationError)(validation_exception_handler)
+
+    @app.get("/plain")
+    async def plain() -> None:
+        raise HTTPException(status_code=404, detail="Goal not found")
+
+    @app.get("/problem")
+    async def built() -> None:
+        raise http_error(title="Conflict", status=409, detail="Already exists")
+
+    @app.get("/items/{item_id}")
+    async def read(item_id: int) -> dict[str, int]:
+        return {"id": item_id}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+class TestProblemHandlers:
+    """Test that errors are rendered as RFC 7807 Problem documents."""
+
+    async def test_string_detail(self, client):
+        """Test that a plain detail is the title and is repeated under detail."""
+        response = await client.get("/plain")
+
+        assert response.status_code == 404
+        assert response.headers["content-type"] == "application/problem+json"
+        assert response.json() == {
+            "title": "Goal not found",
+            "status": 404,
+            "detail": "Goal not found",
+        }
+
+    async def test_problem_detail_is_sent_as_is(self, client):
+        """Test that a payload built by `core.problem` becomes the body."""
+        response = await client.get("/problem")
+
+        assert response.status_code == 409
+        assert response.json() == {"title": "Conflict", "status": 409, "detail": "Already exists"}
+
+    async def test_validation_errors(self, client):
+        """Test that request validation problems list each invalid field."""
+        response = await client.get("/items/abc")
+
+        body = response.json()
+        assert response.status_code == 422
+        assert response.headers["content-type"] == "application/problem+json"
+        assert body["title"] == "Validation Error"
+        assert body["errors"][0]["loc"] == ["path", "item_id"]
+
+    async def test_unknown_route(self, client):
+        """Test that framework 404s are Problems too."""
+        response = await client.get("/missing")
+
+        assert response.json() == {"title": "Not Found", "status": 404, "detail": "Not Found"}
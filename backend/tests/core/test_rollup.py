@@ -0,0 +1,71 @@
+"""Tests for the per-parent status rollup statements."""
+
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from ai_life_backend.projects.repository.postgres_task_repository import project_progress
+
+
+def compile_sql(statement):
+    """Render a statement for PostgreSQL on a single line."""
+    return " ".join(str(statement.compile(dialect=postgresql.dialect())).split())
+
+
+def delta(statement):
+    """Counter values an upsert inserts, by column name."""
+    params = statement.compile(dialect=postgresql.dialect()).params
+    return (params["task_count"], params["tasks_done"], params["tasks_blocked"])
+
+
+class TestShift:
+    """Test the single-row delta upsert."""
+
+    def test_new_and_deleted_children(self):
+        """Test that create adds and delete subtracts the child's weights."""
+        project_id = uuid4()
+
+        assert delta(project_progress.shift(project_id, None, "done")) == (1, 1, 0)
+        assert delta(project_progress.shift(project_id, "blocked", None)) == (-1, 0, -1)
+
+    def test_status_change_moves_between_counters(self):
+        """Test that a status change keeps the total and moves the status counters."""
+        assert delta(project_progress.shift(uuid4(), "blocked", "done")) == (0, 1, -1)
+
+    def test_unchanged_counters_need_no_statement(self):
+        """Test that updates not affecting any counter write nothing."""
+        assert project_progress.shift(uuid4(), "todo", "doing") is None
+        assert project_progress.shift(uuid4(), "done", "done") is None
+
+    def test_adds_to_the_stored_row(self):
+        """Test that an existing row is incremented, not overwritten."""
+        sql = compile_sql(project_progress.shift(uuid4(), None, "todo"))
+
+        assert "ON CONFLICT (project_id) DO UPDATE" in sql
+        assert "task_count = (project_progress.task_count + excluded.task_count)" in sql
+
+
+class TestRecount:
+    """Test the set-based recount and the drift check."""
+
+    def test_recount_touched_parents(self):
+        """Test that a recount of given parents counts their children from scratch."""
+        sql = compile_sql(project_progress.recount([uuid4()]))
+
+        assert sql.startswith("INSERT INTO project_progress (project_id, task_count,")
+        assert "FROM projects LEFT OUTER JOIN tasks ON tasks.project_id = projects.id" in sql
+        assert "WHERE projects.id = ANY (" in sql
+        assert "SET task_count = excluded.task_count" in sql
+
+    def test_recount_all_parents(self):
+        """Test that a full recount is not filtered."""
+        assert "= ANY (" not in compile_sql(project_progress.recount())
+
+    def test_drift_compares_stored_and_actual(self):
+        """Test that drift reports stored and actual counters where they differ."""
+        sql = compile_sql(project_progress.drift())
+
+        assert "coalesce(project_progress.tasks_done, " in sql
+        assert "AS stored_tasks_done" in sql
+        assert "LEFT OUTER JOIN project_progress" in sql
+        assert " OR " in sql
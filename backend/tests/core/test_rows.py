@@ -0,0 +1,77 @@
+"""Tests for the shared row mapper and trusted JSON serialization."""
+
+from dataclasses import asdict
+from datetime import datetime, timezone
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+
+from ai_life_backend.core.public import RowMapper, trusted_json_response
+from ai_life_backend.goals.api.schemas import GoalListPayload, GoalListResponse, goal_list_adapter
+from ai_life_backend.goals.domain import Goal
+from ai_life_backend.goals.repository.postgres_goal_repository import goals_table
+from ai_life_backend.projects.domain.project import Project, ProjectPriority, ProjectRisk
+from ai_life_backend.projects.repository.postgres_project_repository import projects_table
+
+
+def make_rows(table, values):
+    """Build real SQLAlchemy rows for `select(table)` from plain tuples."""
+    metadata = SimpleResultMetaData(list(table.c.keys()))
+    return IteratorResult(metadata, iter(values)).all()
+
+
+def goal_values(title="Goal"):
+    """Return a tuple in `goals` column order."""
+    now = datetime.now(timezone.utc)
+    return (uuid4(), title, False, now, now)
+
+
+class TestRowMapper:
+    """Test RowMapper."""
+
+    def test_maps_rows_to_dataclasses(self):
+        """Test that rows become equal dataclasses, one or many at a time."""
+        values = [goal_values("a"), goal_values("b")]
+        rows = make_rows(goals_table, values)
+        mapper = RowMapper(Goal, goals_table)
+
+        assert mapper(rows[0]) == Goal(*values[0])
+        assert mapper.many(rows) == [Goal(*v) for v in values]
+
+    def test_applies_converters(self):
+        """Test that converters run only on their fields."""
+        now = datetime.now(timezone.utc)
+        dep = uuid4()
+        values = (uuid4(), None, "P", "todo", "P1", "", "red", ["x"], [dep], now, now)
+        mapper = RowMapper(
+            Project, projects_table, {"priority": ProjectPriority, "risk": ProjectRisk}
+        )
+
+        project = mapper.many(make_rows(projects_table, [values]))[0]
+
+        assert project.priority is ProjectPriority.P1
+        assert project.risk is ProjectRisk.RED
+        assert project.dependencies == [dep]
+
+    def test_rejects_table_without_field_column(self):
+        """Test that a missing column fails at construction time."""
+        with pytest.raises(ValueError, match="no column"):
+            RowMapper(Project, goals_table)
+
+
+class TestTrustedJsonResponse:
+    """Test serialization without re-validation."""
+
+    def test_matches_response_model_output(self):
+        """Test that the fast path emits the same JSON as the response model."""
+        goals = [Goal(*goal_values("a")), Goal(*goal_values("b"))]
+
+        response = trusted_json_response(goal_list_adapter, GoalListPayload(goals, "next"))
+
+        expected = GoalListResponse.model_validate(
+            {"goals": [asdict(g) for g in goals], "next_cursor": "next"}
+        ).model_dump(mode="json")
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == expected
@@ -0,0 +1,223 @@
+"""Tests for cache invalidation of the cached goal and milestone repositories."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from ai_life_backend.core.public import ReadThroughCache, TTLCache
+from ai_life_backend.goals.domain import Goal
+from ai_life_backend.goals.repository import CachedGoalRepository, PostgresGoalRepository
+from ai_life_backend.milestones.domain.milestone import (
+    CreateMilestoneInput,
+    Milestone,
+    UpdateMilestoneInput,
+)
+from ai_life_backend.milestones.repository.cached_milestone_repository import (
+    CachedMilestoneRepository,
+)
+from ai_life_backend.milestones.repository.postgres_milestone_repository import (
+    PostgresMilestoneRepository,
+)
+
+
+class FakeGoalStore(PostgresGoalRepository):
+    """Dict-backed stand-in for the Postgres queries, counting reads."""
+
+    def __init__(self, engine=None):
+        """Start empty."""
+        self.goals = {}
+        self.reads = 0
+
+    async def create(self, title):
+        """Store a new open goal."""
+        now = datetime.now(timezone.utc)
+        goal = Goal(id=uuid4(), title=title, is_done=False, date_created=now, date_updated=now)
+        self.goals[goal.id] = goal
+        return goal
+
+    async def get_by_id(self, goal_id):
+        """Return a stored goal."""
+        self.reads += 1
+        return self.goals.get(goal_id)
+
+    async def list_all(self):
+        """Return every goal."""
+        self.reads += 1
+        return list(self.goals.values())
+
+    async def list_by_status(self, is_done):
+        """Return goals with the given status."""
+        self.reads += 1
+        return [goal for goal in self.goals.values() if goal.is_done == is_done]
+
+    async def update(self, goal_id, title=None, is_done=None):
+        """Replace the stored goal."""
+        goal = self.goals.get(goal_id)
+        if goal is None:
+            return None
+        goal = Goal(
+            id=goal.id,
+            title=title if title is not None else goal.title,
+            is_done=is_done if is_done is not None else goal.is_done,
+            date_created=goal.date_created,
+            date_updated=datetime.now(timezone.utc),
+        )
+        self.goals[goal_id] = goal
+        return goal
+
+    async def delete(self, goal_id):
+        """Remove a stored goal."""
+        return self.goals.pop(goal_id, None) is not None
+
+
+class FakeMilestoneStore(PostgresMilestoneRepository):
+    """Dict-backed stand-in for the Postgres queries, counting reads."""
+
+    def __init__(self, engine=None):
+        """Start empty."""
+        self.milestones = {}
+        self.reads = 0
+
+    async def create(self, input_data):
+        """Store a new milestone."""
+        now = datetime.now(timezone.utc)
+        milestone = Milestone(
+            id=uuid4(),
+            title=input_data.title,
+            goal_id=input_data.goal_id,
+            due=input_data.due,
+            status=input_data.status,
+            demo_criterion=input_data.demo_criterion,
+            blocking=input_data.blocking,
+            date_created=now,
+            date_updated=now,
+        )
+        self.milestones[milestone.id] = milestone
+        return milestone
+
+    async def get_by_id(self, milestone_id):
+        """Return a stored milestone."""
+        self.reads += 1
+        return self.milestones.get(milestone_id)
+
+    async def list_by_goal(self, goal_id):
+        """Return one goal's milestones."""
+        self.reads += 1
+        return [m for m in self.milestones.values() if m.goal_id == goal_id]
+
+    async def update(self, milestone_id, input_data):
+        """Return the stored milestone unchanged."""
+        return self.milestones.get(milestone_id)
+
+    async def delete(self, milestone_id):
+        """Remove a stored milestone."""
+        return self.milestones.pop(milestone_id, None) is not None
+
+
+class Goals(CachedGoalRepository, FakeGoalStore):
+    """Cached goal repository whose `super()` calls land on the fake store."""
+
+
+class Milestones(CachedMilestoneRepository, FakeMilestoneStore):
+    """Cached milestone repository whose `super()` calls land on the fake store."""
+
+
+def make_cache():
+    """Return a fresh read-through cache."""
+    return ReadThroughCache(TTLCache(ttl_seconds=60, max_entries=64))
+
+
+def milestone_input(goal_id):
+    """Return a valid milestone create input for a goal."""
+    return CreateMilestoneInput(
+        goal_id=goal_id, title="Milestone", status="todo", demo_criterion="Demo", blocking=False
+    )
+
+
+class TestCachedGoalRepository:
+    """Test read-through and precise invalidation of goal reads."""
+
+    async def test_reads_are_cached(self):
+        """Test that repeated point and list reads hit the store once each."""
+        repo = Goals(None, make_cache())
+        goal = await repo.create("Goal")
+
+        for _ in range(3):
+            assert await repo.get_by_id(goal.id) == goal
+            assert await repo.list_all() == [goal]
+            assert await repo.list_by_status(False) == [goal]
+
+        assert repo.reads == 3
+
+    async def test_update_invalidates_entity_and_both_status_lists(self):
+        """Test that completing a goal moves it between cached status lists."""
+        repo = Goals(None, make_cache())
+        goal = await repo.create("Goal")
+        await repo.list_by_status(False)
+        await repo.list_by_status(True)
+
+        done = await repo.update(goal.id, is_done=True)
+
+        assert await repo.get_by_id(goal.id) == done
+        assert await repo.list_by_status(False) == []
+        assert await repo.list_by_status(True) == [done]
+
+    async def test_title_update_keeps_other_status_list(self):
+        """Test that a title change leaves the other status list cached."""
+        repo = Goals(None, make_cache())
+        goal = await repo.create("Goal")
+        await repo.list_by_status(True)
+        reads = repo.reads
+
+        await repo.update(goal.id, title="Renamed")
+        await repo.list_by_status(True)
+
+        assert repo.reads == reads
+
+    async def test_delete_invalidates_cascaded_milestones(self):
+        """Test that deleting a goal drops its cascade-deleted milestones from the cache."""
+        cache = make_cache()
+        milestones = Milestones(None, cache)
+        goals = Goals(None, cache, cascade_keys=milestones.keys_for_goal)
+        goal = await goals.create("Goal")
+        milestone = await milestones.create(milestone_input(goal.id))
+        await milestones.get_by_id(milestone.id)
+        await milestones.list_by_goal(goal.id)
+
+        await goals.delete(goal.id)
+        milestones.milestones.clear()
+
+        assert await goals.get_by_id(goal.id) is None
+        assert await milestones.get_by_id(milestone.id) is None
+        assert await milestones.list_by_goal(goal.id) == []
+
+
+class TestCachedMilestoneRepository:
+    """Test read-through and precise invalidation of milestone reads."""
+
+    async def test_create_invalidates_only_its_goal_list(self):
+        """Test that a new milestone refreshes its goal's list and no other."""
+        repo = Milestones(None, make_cache())
+        goal_id, other_goal_id = uuid4(), uuid4()
+        await repo.list_by_goal(goal_id)
+        await repo.list_by_goal(other_goal_id)
+        reads = repo.reads
+
+        milestone = await repo.create(milestone_input(goal_id))
+
+        assert await repo.list_by_goal(goal_id) == [milestone]
+        assert await repo.list_by_goal(other_goal_id) == []
+        assert repo.reads == reads + 1
+
+    async def test_update_and_delete_invalidate_entity(self):
+        """Test that writes drop the cached milestone."""
+        repo = Milestones(None, make_cache())
+        milestone = await repo.create(milestone_input(uuid4()))
+        await repo.get_by_id(milestone.id)
+        reads = repo.reads
+
+        await repo.update(milestone.id, UpdateMilestoneInput(title="Renamed"))
+        await repo.get_by_id(milestone.id)
+        assert repo.reads == reads + 1
+
+        assert await repo.delete(milestone.id)
+        assert await repo.get_by_id(milestone.id) is None
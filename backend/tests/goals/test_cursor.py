@@ -0,0 +1,64 @@
+"""Tests for the goals keyset pagination cursor."""
+
+import pytest
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from ai_life_backend.goals.domain import Goal, GoalCursor
+
+
+class TestGoalCursor:
+    """Test GoalCursor encoding and decoding."""
+
+    def test_round_trip(self):
+        """Test that a decoded token equals the original cursor."""
+        cursor = GoalCursor(
+            is_done=True,
+            date_updated=datetime(2025, 10, 8, 12, 30, 15, 123456, tzinfo=timezone.utc),
+            id=uuid4(),
+        )
+        assert GoalCursor.decode(cursor.encode()) == cursor
+
+    def test_token_is_url_safe(self):
+        """Test that the token can be used as a query parameter without escaping."""
+        cursor = GoalCursor(is_done=False, date_updated=datetime.now(timezone.utc), id=uuid4())
+        token = cursor.encode()
+        assert all(c.isalnum() or c in "-_" for c in token)
+
+    def test_after_goal(self):
+        """Test building the cursor from the last goal of a page."""
+        goal = Goal(
+            id=uuid4(),
+            title="Last on page",
+            is_done=False,
+            date_created=datetime.now(timezone.utc),
+            date_updated=datetime.now(timezone.utc),
+        )
+        cursor = GoalCursor.after(goal)
+        assert (cursor.is_done, cursor.date_updated, cursor.id) == (
+            goal.is_done,
+            goal.date_updated,
+            goal.id,
+        )
+
+    @pytest.mark.parametrize(
+        "token",
+        [
+            "",
+            "not-base64!",
+            "eyJhIjoxfQ",  # {"a":1}
+            GoalCursor(is_done=False, date_updated=datetime.now(timezone.utc), id=uuid4())
+            .encode()
+            .swapcase(),
+        ],
+    )
+    def test_invalid_token(self, token):
+        """Test that malformed tokens are rejected."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            GoalCursor.decode(token)
+
+    def test_naive_timestamp_rejected(self):
+        """Test that a cursor without timezone is rejected."""
+        cursor = GoalCursor(is_done=False, date_updated=datetime(2025, 1, 1), id=uuid4())
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            GoalCursor.decode(cursor.encode())
@@ -0,0 +1,238 @@
+"""Tests for ETag / If-None-Match conditional GETs on goal and milestone routes."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from ai_life_backend.core.public import entity_etag, etag_matches, list_etag
+from ai_life_backend.goals.api.routes import get_repository as get_goal_repository
+from ai_life_backend.goals.api.routes import router as goals_router
+from ai_life_backend.goals.domain import Goal
+from ai_life_backend.milestones.api.routes import get_repository as get_milestone_repository
+from ai_life_backend.milestones.api.routes import router as milestones_router
+from ai_life_backend.milestones.domain.milestone import Milestone
+
+
+class FakeGoalRepository:
+    """Dict-backed goal reads recording which queries ran."""
+
+    def __init__(self):
+        """Start empty."""
+        self.goals = {}
+        self.row_reads = 0
+
+    def add(self, is_done=False, date_updated=None):
+        """Store a goal and return it."""
+        now = date_updated or datetime.now(timezone.utc)
+        goal = Goal(id=uuid4(), title="Goal", is_done=is_done, date_created=now, date_updated=now)
+        self.goals[goal.id] = goal
+        return goal
+
+    async def get_by_id(self, goal_id):
+        """Return a stored goal."""
+        return self.goals.get(goal_id)
+
+    async def list_all(self):
+        """Return every goal."""
+        self.row_reads += 1
+        return list(self.goals.values())
+
+    async def list_by_status(self, is_done):
+        """Return goals with the given status."""
+        self.row_reads += 1
+        return [goal for goal in self.goals.values() if goal.is_done == is_done]
+
+    async def list_page(self, limit, after=None, is_done=None):
+        """Return a single page holding every goal."""
+        return list(self.goals.values())[:limit], None
+
+    async def list_version(self, is_done=None):
+        """Return count and newest date_updated, like the SQL aggregate."""
+        goals = [g for g in self.goals.values() if is_done is None or g.is_done == is_done]
+        return len(goals), max((g.date_updated for g in goals), default=None)
+
+
+class FakeMilestoneRepository:
+    """Dict-backed milestone reads."""
+
+    def __init__(self):
+        """Start empty."""
+        self.milestones = {}
+        self.row_reads = 0
+
+    def add(self):
+        """Store a milestone and return it."""
+        now = datetime.now(timezone.utc)
+        milestone = Milestone(
+            id=uuid4(),
+            goal_id=uuid4(),
+            title="Milestone",
+            due=None,
+            status="todo",
+            demo_criterion="Demo",
+            blocking=False,
+            date_created=now,
+            date_updated=now,
+        )
+        self.milestones[milestone.id] = milestone
+        return milestone
+
+    async def get_by_id(self, milestone_id):
+        """Return a stored milestone."""
+        return self.milestones.get(milestone_id)
+
+    async def list_all(self):
+        """Return every milestone."""
+        self.row_reads += 1
+        return list(self.milestones.values())
+
+    async def list_filtered(self, filters):
+        """Return every milestone; these tests do not filter."""
+        return await self.list_all()
+
+    async def list_version(self, filters=None):
+        """Return count and newest date_updated, like the SQL aggregate."""
+        stamps = [m.date_updated for m in self.milestones.values()]
+        return len(stamps), max(stamps, default=None)
+
+
+@pytest.fixture
+def goals():
+    """Create an empty fake goal repository."""
+    return FakeGoalRepository()
+
+
+@pytest.fixture
+def milestones():
+    """Create an empty fake milestone repository."""
+    return FakeMilestoneRepository()
+
+
+@pytest.fixture
+async def client(goals, milestones):
+    """Create an async HTTP client for goal and milestone routes over the fakes."""
+    app = FastAPI()
+    app.include_router(goals_router, prefix="/api")
+    app.include_router(milestones_router, prefix="/api")
+    app.dependency_overrides[get_goal_repository] = lambda: goals
+    app.dependency_overrides[get_milestone_repository] = lambda: milestones
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+class TestEtagHelpers:
+    """Test ETag derivation and matching."""
+
+    def test_list_etag_changes_with_count_and_timestamp(self):
+        """Test that creates (newer max) and deletes (lower count) change the tag."""
+        now = datetime.now(timezone.utc)
+        base = list_etag("goals:None", 2, now)
+
+        assert list_etag("goals:None", 2, now) == base
+        assert list_etag("goals:None", 1, now) != base
+        assert list_etag("goals:None", 2, now + timedelta(microseconds=1)) != base
+        assert list_etag("goals:done", 2, now) != base
+
+    def test_timestamps_compare_across_timezones(self):
+        """Test that the same instant in different offsets yields the same tag."""
+        goal_id = uuid4()
+        utc = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+        shifted = utc.astimezone(timezone(timedelta(hours=3)))
+
+        assert entity_etag(goal_id, utc) == entity_etag(goal_id, shifted)
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [(None, False), ('"x"', False), ('"x", "TAG"', True), ('W/"TAG"', True), ("*", True)],
+    )
+    def test_etag_matches(self, header, expected):
+        """Test If-None-Match lists, weak prefixes and the wildcard."""
+        assert etag_matches(header, '"TAG"') is expected
+
+
+class TestGoalConditionalGet:
+    """Test 304 short-circuits on goal routes."""
+
+    async def test_list_not_modified_skips_row_reads(self, client, goals):
+        """Test that a current ETag is answered from the aggregate alone."""
+        goals.add()
+        first = await client.get("/api/goals")
+        etag = first.headers["etag"]
+
+        second = await client.get("/api/goals", headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+        assert goals.row_reads == 1
+
+    async def test_list_changes_after_write(self, client, goals):
+        """Test that a new goal invalidates the previous ETag."""
+        goals.add(date_updated=datetime.now(timezone.utc) - timedelta(minutes=1))
+        etag = (await client.get("/api/goals")).headers["etag"]
+        goals.add()
+
+        response = await client.get("/api/goals", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert len(response.json()["goals"]) == 2
+        assert response.headers["etag"] != etag
+
+    async def test_status_filters_have_distinct_etags(self, client, goals):
+        """Test that filtered lists do not share a tag with the full list."""
+        goals.add()
+        full = (await client.get("/api/goals")).headers["etag"]
+
+        response = await client.get("/api/goals?status=active", headers={"If-None-Match": full})
+
+        assert response.status_code == 200
+
+    async def test_detail_not_modified(self, client, goals):
+        """Test that a goal detail is revalidated by id and date_updated."""
+        goal = goals.add()
+        first = await client.get(f"/api/goals/{goal.id}")
+
+        second = await client.get(
+            f"/api/goals/{goal.id}", headers={"If-None-Match": first.headers["etag"]}
+        )
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+
+    async def test_paginated_list_has_no_etag(self, client, goals):
+        """Test that keyset pages are not conditional."""
+        goals.add()
+
+        response = await client.get("/api/goals?limit=10")
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
+
+class TestMilestoneConditionalGet:
+    """Test 304 short-circuits on milestone routes."""
+
+    async def test_list_not_modified(self, client, milestones):
+        """Test that a current list ETag skips loading milestones."""
+        milestones.add()
+        etag = (await client.get("/api/milestones")).headers["etag"]
+
+        response = await client.get("/api/milestones", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert milestones.row_reads == 1
+
+    async def test_detail_not_modified(self, client, milestones):
+        """Test that a current detail ETag yields 304."""
+        milestone = milestones.add()
+        etag = (await client.get(f"/api/milestones/{milestone.id}")).headers["etag"]
+
+        response = await client.get(
+            f"/api/milestones/{milestone.id}", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
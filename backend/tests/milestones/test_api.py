@@ -228,3 +228,120 @@ class TestMilestonesAPI:
         data = response.json()
         # Should have at least 'detail' field (FastAPI default)
         assert "detail" in data
+
+
+@pytest.mark.asyncio
+class TestMilestonesFilterAPI:
+    """Test the filters and sort order of GET /api/milestones."""
+
+    async def test_filters_by_goal_status_due_and_blocking(self, client, test_goal):
+        """Test that every filter narrows the list in SQL."""
+        base = {"goal_id": test_goal["id"], "demo_criterion": "Demo"}
+        for title, status, due, blocking in [
+            ("Early", "todo", "2030-01-10T00:00:00Z", True),
+            ("Late", "doing", "2030-03-10T00:00:00Z", False),
+            ("Done", "done", "2030-01-20T00:00:00Z", True),
+            ("Undated", "todo", None, False),
+        ]:
+            payload = {**base, "title": title, "status": status, "due": due, "blocking": blocking}
+            await client.post("/api/milestones", json=payload)
+
+        async def titles(**params):
+            response = await client.get(
+                "/api/milestones", params={"goal_id": test_goal["id"], **params}
+            )
+            assert response.status_code == 200
+            return [m["title"] for m in response.json()["milestones"]]
+
+        assert await titles(sort="due") == ["Undated", "Early", "Done", "Late"]
+        assert await titles(status=["todo", "doing"], sort="due") == ["Undated", "Early", "Late"]
+        assert await titles(due_from="2030-01-15T00:00:00Z", sort="due") == ["Done", "Late"]
+        assert await titles(due_to="2030-01-31T00:00:00Z", blocking="true") == ["Done", "Early"]
+
+    async def test_empty_due_window_is_422(self, client):
+        """Test that due_from after due_to is rejected."""
+        response = await client.get(
+            "/api/milestones",
+            params={"due_from": "2030-02-01T00:00:00Z", "due_to": "2030-01-01T00:00:00Z"},
+        )
+
+        assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+class TestMilestonesBlockingAPI:
+    """Test GET /api/milestones/blocking."""
+
+    async def test_lists_open_blocking_up_to_horizon(self, client, test_goal):
+        """Test that done, non-blocking and later milestones are left out, earliest first."""
+        base = {"goal_id": test_goal["id"], "demo_criterion": "Demo"}
+        for title, status, due, blocking in [
+            ("Later", "todo", "1999-12-20T00:00:00Z", True),
+            ("Overdue", "blocked", "1999-12-01T00:00:00Z", True),
+            ("Done", "done", "1999-12-05T00:00:00Z", True),
+            ("Optional", "todo", "1999-12-06T00:00:00Z", False),
+            ("Beyond", "doing", "2000-02-01T00:00:00Z", True),
+        ]:
+            payload = {**base, "title": title, "status": status, "due": due, "blocking": blocking}
+            await client.post("/api/milestones", json=payload)
+
+        async def titles(**params):
+            response = await client.get(
+                "/api/milestones/blocking", params={"horizon": "2000-01-01T00:00:00Z", **params}
+            )
+            assert response.status_code == 200
+            milestones = response.json()["milestones"]
+            return [m["title"] for m in milestones if m["goal_id"] == test_goal["id"]]
+
+        assert await titles() == ["Overdue", "Later"]
+        assert await titles(horizon="1999-12-10T00:00:00Z") == ["Overdue"]
+
+    async def test_rejects_naive_horizon_and_bad_limit(self, client):
+        """Test that a horizon without timezone and an out-of-range limit are 422."""
+        naive = await client.get("/api/milestones/blocking", params={"horizon": "2030-01-01T00:00"})
+        too_many = await client.get("/api/milestones/blocking", params={"limit": 101})
+
+        assert naive.status_code == 422
+        assert too_many.status_code == 422
+
+
+@pytest.mark.asyncio
+class TestMilestonesBatchAPI:
+    """Test POST /api/milestones:batch."""
+
+    async def test_batch_creates_updates_and_deletes(self, client, test_goal):
+        """Test that all items are applied and reported in request order."""
+        payload = {"goal_id": test_goal["id"], "title": "Existing", "demo_criterion": "Demo"}
+        existing = (await client.post("/api/milestones", json=payload)).json()
+        doomed = (await client.post("/api/milestones", json=payload)).json()
+        items = [
+            {"op": "create", **payload, "title": "New A"},
+            {"op": "create", **payload, "title": "New B"},
+            {"op": "update", "id": existing["id"], "status": "done"},
+            {"op": "delete", "id": doomed["id"]},
+        ]
+
+        response = await client.post("/api/milestones:batch", json={"items": items})
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["status"] for r in results] == ["created", "created", "updated", "deleted"]
+        assert [r["milestone"]["title"] for r in results[:2]] == ["New A", "New B"]
+        assert results[2]["milestone"]["status"] == "done"
+        assert (await client.get(f"/api/milestones/{doomed['id']}")).status_code == 404
+
+    async def test_batch_with_unknown_goal_writes_nothing(self, client, test_goal):
+        """Test that one invalid item rejects the whole batch with per-item results."""
+        items = [
+            {"op": "create", "goal_id": test_goal["id"], "title": "Kept", "demo_criterion": "D"},
+            {"op": "create", "goal_id": str(uuid4()), "title": "Orphan", "demo_criterion": "D"},
+        ]
+
+        response = await client.post("/api/milestones:batch", json={"items": items})
+
+        assert response.status_code == 422
+        data = response.json()
+        assert data["applied"] is False
+        assert [r["status"] for r in data["results"]] == ["skipped", "rejected"]
+        listed = (await client.get("/api/milestones")).json()["milestones"]
+        assert "Kept" not in [m["title"] for m in listed]
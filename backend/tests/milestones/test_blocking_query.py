@@ -0,0 +1,36 @@
+"""Tests for the open blocking milestones query."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy.dialects import postgresql
+
+from ai_life_backend.milestones.repository.postgres_milestone_repository import (
+    open_blocking_due_query,
+)
+
+
+def compile_sql(horizon, limit):
+    """Render the query for PostgreSQL on a single line."""
+    query = open_blocking_due_query(horizon, limit)
+    return " ".join(str(query.compile(dialect=postgresql.dialect())).split())
+
+
+class TestOpenBlockingDueQuery:
+    """Test that the query can be answered from the partial index."""
+
+    def test_repeats_the_index_predicate(self):
+        """Test that the WHERE clause carries the predicate of the partial index verbatim.
+
+        The planner only uses a partial index when the query implies its predicate,
+        which it cannot prove for a bound parameter such as `status != $1`.
+        """
+        sql = compile_sql(datetime(2030, 1, 1, tzinfo=UTC), 20)
+
+        assert "milestones.blocking AND milestones.status != 'done'" in sql
+
+    def test_orders_by_due_and_limits(self):
+        """Test that rows come in index order, bounded by the horizon and the limit."""
+        sql = compile_sql(datetime(2030, 1, 1, tzinfo=UTC), 20)
+
+        assert "AND milestones.due <= %(due_1)s" in sql
+        assert "ORDER BY milestones.due LIMIT %(param_1)s" in sql
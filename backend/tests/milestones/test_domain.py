@@ -4,7 +4,7 @@ import pytest
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from ai_life_backend.milestones.domain.milestone import Milestone
+from ai_life_backend.milestones.domain.milestone import Milestone, MilestoneFilter
 
 
 class TestMilestone:
@@ -92,3 +92,22 @@ class TestMilestone:
         )
         with pytest.raises(Exception):  # FrozenInstanceError
             milestone.title = "Modified"  # type: ignore
+
+
+class TestMilestoneFilter:
+    """Test the milestone list filter."""
+
+    def test_defaults_match_everything(self):
+        """Test that an empty filter sorts newest first without constraints."""
+        filters = MilestoneFilter()
+
+        assert filters.statuses == ()
+        assert filters.sort == "created"
+
+    def test_empty_due_window_is_rejected(self):
+        """Test that due_from must not be later than due_to."""
+        with pytest.raises(ValueError, match="due_from must not be later than due_to"):
+            MilestoneFilter(
+                due_from=datetime(2030, 2, 1, tzinfo=timezone.utc),
+                due_to=datetime(2030, 1, 1, tzinfo=timezone.utc),
+            )
@@ -0,0 +1,159 @@
+"""Tests for the goal overview query and endpoint."""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+
+from ai_life_backend.goals.domain import GoalCursor
+from ai_life_backend.overview.api.routes import get_engine, router
+from ai_life_backend.overview.public import MilestoneCounts, list_goal_overviews
+from ai_life_backend.overview.services.goal_overview import goal_overview_query
+
+COLUMNS = [
+    "id",
+    "title",
+    "is_done",
+    "date_created",
+    "date_updated",
+    "todo",
+    "doing",
+    "done",
+    "blocked",
+    "next_id",
+    "next_title",
+    "next_due",
+    "next_status",
+    "next_blocking",
+    "project_count",
+    "task_count",
+    "tasks_done",
+]
+NOW = datetime(2030, 1, 1, tzinfo=UTC)
+
+
+def overview_row(title, *, is_done=False, next_due=None, tasks=(0, 0)):
+    """One result row of the overview statement."""
+    upcoming = (uuid4(), "Ship", next_due, "doing", True) if next_due else (None,) * 5
+    return (uuid4(), title, is_done, NOW, NOW, 1, 2, 3, 0, *upcoming, 2, *tasks)
+
+
+class FakeEngine:
+    """Engine stand-in returning fixed rows and recording statements."""
+
+    def __init__(self, rows):
+        """Serve `rows` for every statement."""
+        self.rows = rows
+        self.statements = []
+
+    @asynccontextmanager
+    async def connect(self):
+        """Yield itself as the connection."""
+        yield self
+
+    async def execute(self, statement):
+        """Record the statement and return the rows."""
+        self.statements.append(statement)
+        return IteratorResult(SimpleResultMetaData(COLUMNS), iter(self.rows))
+
+
+def compile_sql(statement):
+    """Render a statement for PostgreSQL on a single line."""
+    return " ".join(str(statement.compile(dialect=postgresql.dialect())).split())
+
+
+class TestGoalOverviewQuery:
+    """Test the shape of the single overview statement."""
+
+    def test_aggregates_the_page_with_lateral_subqueries(self):
+        """Test that aggregates join the page of goals laterally, in one statement."""
+        sql = compile_sql(goal_overview_query(51, [False, True], None))
+
+        assert sql.count("JOIN LATERAL") == 3
+        assert "UNION ALL" in sql
+        assert "WHERE milestones.goal_id = goal.id" in sql
+        assert "ORDER BY milestones.due ASC NULLS FIRST, milestones.date_created DESC" in sql
+        assert "ORDER BY goal.is_done, goal.date_updated DESC, goal.id DESC LIMIT" in sql
+
+    def test_cursor_seeks_within_its_partition(self):
+        """Test that the cursor bounds only the partition it points into."""
+        after = GoalCursor(is_done=False, date_updated=NOW, id=uuid4())
+
+        sql = compile_sql(goal_overview_query(11, [False, True], after))
+
+        assert sql.count("(goals.date_updated, goals.id) <") == 1
+
+
+class TestListGoalOverviews:
+    """Test mapping rows to overviews and paging."""
+
+    async def test_maps_aggregates(self):
+        """Test counts, next milestone and completion ratio."""
+        due = datetime(2030, 2, 1, tzinfo=UTC)
+        engine = FakeEngine([overview_row("A", next_due=due, tasks=(4, 1)), overview_row("B")])
+
+        overviews, next_cursor = await list_goal_overviews(engine, 5)
+
+        first, second = overviews
+        assert first.milestones == MilestoneCounts(todo=1, doing=2, done=3, blocked=0)
+        assert first.next_milestone.due == due
+        assert first.task_completion == pytest.approx(0.25)
+        assert second.next_milestone is None
+        assert second.task_completion is None
+        assert next_cursor is None
+
+    async def test_extra_row_yields_cursor(self):
+        """Test that a row beyond the limit produces the next cursor."""
+        engine = FakeEngine([overview_row("A"), overview_row("B", is_done=True)])
+
+        overviews, next_cursor = await list_goal_overviews(engine, 1)
+
+        assert [o.title for o in overviews] == ["A"]
+        assert next_cursor == GoalCursor.after(overviews[0])
+
+    async def test_nothing_left_skips_the_query(self):
+        """Test that a cursor past the last partition returns without a query."""
+        engine = FakeEngine([])
+        after = GoalCursor(is_done=True, date_updated=NOW, id=uuid4())
+
+        assert await list_goal_overviews(engine, 5, after, is_done=False) == ([], None)
+        assert engine.statements == []
+
+
+@pytest.fixture
+async def client():
+    """Create a client for the overview router backed by two fixed rows."""
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    due = datetime(2030, 2, 1, tzinfo=UTC)
+    rows = [overview_row("A", next_due=due, tasks=(2, 1)), overview_row("B")]
+    app.dependency_overrides[get_engine] = lambda: FakeEngine(rows)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+class TestGoalOverviewAPI:
+    """Test GET /api/goals/overview."""
+
+    async def test_returns_page_with_cursor(self, client):
+        """Test the response shape and the next cursor."""
+        response = await client.get("/api/goals/overview", params={"limit": 1})
+
+        body = response.json()
+        assert response.status_code == 200
+        assert body["goals"][0]["milestones"] == {"todo": 1, "doing": 2, "done": 3, "blocked": 0}
+        assert body["goals"][0]["next_milestone"]["due"] == "2030-02-01T00:00:00Z"
+        assert body["goals"][0]["task_completion"] == pytest.approx(0.5)
+        assert GoalCursor.decode(body["next_cursor"]).id is not None
+
+    async def test_invalid_cursor_is_422(self, client):
+        """Test that a malformed cursor is rejected."""
+        response = await client.get("/api/goals/overview", params={"cursor": "nope"})
+
+        assert response.status_code == 422
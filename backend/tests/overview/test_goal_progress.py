@@ -0,0 +1,105 @@
+"""Tests for the goal progress query and endpoint."""
+
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+
+from ai_life_backend.overview.api.routes import get_engine, router
+from ai_life_backend.overview.public import get_goal_progress
+from ai_life_backend.overview.services.goal_progress import goal_progress_query
+
+COLUMNS = [
+    "goal_id",
+    "milestone_count",
+    "milestones_done",
+    "milestones_blocked",
+    "project_count",
+    "task_count",
+    "tasks_done",
+    "tasks_blocked",
+]
+
+
+class FakeEngine:
+    """Engine stand-in returning fixed rows and recording statements."""
+
+    def __init__(self, rows):
+        """Serve `rows` for every statement."""
+        self.rows = rows
+        self.statements = []
+
+    @asynccontextmanager
+    async def connect(self):
+        """Yield itself as the connection."""
+        yield self
+
+    async def execute(self, statement):
+        """Record the statement and return the rows."""
+        self.statements.append(statement)
+        return IteratorResult(SimpleResultMetaData(COLUMNS), iter(self.rows))
+
+
+def test_query_reads_only_rollup_rows():
+    """Test that the statement reads the rollups, not milestones or tasks."""
+    statement = goal_progress_query(uuid4())
+    sql = " ".join(str(statement.compile(dialect=postgresql.dialect())).split())
+
+    assert "LEFT OUTER JOIN goal_progress ON goal_progress.goal_id = goals.id" in sql
+    assert "sum(project_progress.task_count)" in sql
+    assert "milestones" not in sql.replace("milestones_", "")
+    assert "tasks." not in sql
+
+
+async def test_maps_counters_and_completions():
+    """Test the summary and its completion ratios."""
+    goal_id = uuid4()
+    engine = FakeEngine([(goal_id, 4, 3, 1, 2, 0, 0, 0)])
+
+    progress = await get_goal_progress(engine, goal_id)
+
+    assert progress.milestone_completion == pytest.approx(0.75)
+    assert progress.task_completion is None
+
+
+@pytest.fixture
+def rows():
+    """Rows served to the endpoint; empty means the goal does not exist."""
+    return []
+
+
+@pytest.fixture
+async def client(rows):
+    """Create a client for the overview router backed by `rows`."""
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_engine] = lambda: FakeEngine(rows)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+class TestGoalProgressAPI:
+    """Test GET /api/goals/{goal_id}/progress."""
+
+    async def test_returns_counters(self, client, rows):
+        """Test the response shape."""
+        rows.append((uuid4(), 2, 1, 0, 1, 8, 2, 1))
+
+        response = await client.get(f"/api/goals/{uuid4()}/progress")
+
+        body = response.json()
+        assert response.status_code == 200
+        assert body["milestone_completion"] == pytest.approx(0.5)
+        assert (body["task_count"], body["tasks_done"], body["tasks_blocked"]) == (8, 2, 1)
+        assert body["task_completion"] == pytest.approx(0.25)
+
+    async def test_unknown_goal_returns_404(self, client):
+        """Test that a missing goal is a 404."""
+        response = await client.get(f"/api/goals/{uuid4()}/progress")
+
+        assert response.status_code == 404
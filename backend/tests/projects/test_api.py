@@ -0,0 +1,364 @@
+"""API tests for Projects and Tasks routes backed by in-memory repositories."""
+
+import json
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from ai_life_backend.projects.api.routes import (
+    get_next_task_scheduler,
+    get_project_repository,
+    get_scheduler,
+    get_task_repository,
+    projects_router,
+    tasks_router,
+)
+from ai_life_backend.projects.repository import InMemoryProjectRepository, InMemoryTaskRepository
+from ai_life_backend.projects.services.next_task import NextTaskScheduler
+from ai_life_backend.projects.services.schedule import ProjectScheduler
+
+
+@pytest.fixture
+def app():
+    """Create a FastAPI test app with in-memory repositories."""
+    app = FastAPI()
+    app.include_router(projects_router, prefix="/api")
+    app.include_router(tasks_router, prefix="/api")
+    project_repo = InMemoryProjectRepository()
+    task_repo = InMemoryTaskRepository()
+    app.dependency_overrides[get_project_repository] = lambda: project_repo
+    app.dependency_overrides[get_task_repository] = lambda: task_repo
+    scheduler = ProjectScheduler(task_repo)
+    next_tasks = NextTaskScheduler(task_repo, project_repo, scheduler)
+    app.dependency_overrides[get_scheduler] = lambda: scheduler
+    app.dependency_overrides[get_next_task_scheduler] = lambda: next_tasks
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    """Create an async HTTP client."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+def task_payload(project_id, dependencies=None, **overrides):
+    """Build a valid task creation payload."""
+    payload = {
+        "project_id": str(project_id),
+        "title": "Task",
+        "dependencies": [str(d) for d in dependencies or []],
+        "size": "M",
+        "energy": "Focus",
+        "continuity": "chain",
+        "clarity": "clear",
+        "risk": "green",
+    }
+    payload.update(overrides)
+    return payload
+
+
+def project_payload(dependencies=None):
+    """Build a valid project creation payload."""
+    return {
+        "title": "Project",
+        "priority": "P2",
+        "scope": "",
+        "risk": "green",
+        "dependencies": [str(d) for d in dependencies or []],
+    }
+
+
+class TestDeleteBlocking:
+    """Test that entities with dependents cannot be deleted."""
+
+    async def test_delete_task_with_dependents_returns_409(self, client):
+        """Test that a task others depend on is not deleted."""
+        project_id = uuid4()
+        base = (await client.post("/api/tasks", json=task_payload(project_id))).json()
+        dependent = (
+            await client.post("/api/tasks", json=task_payload(project_id, [base["id"]]))
+        ).json()
+
+        response = await client.delete(f"/api/tasks/{base['id']}")
+        assert response.status_code == 409
+        assert (await client.get(f"/api/tasks/{base['id']}")).status_code == 200
+
+        assert (await client.delete(f"/api/tasks/{dependent['id']}")).status_code == 204
+        assert (await client.delete(f"/api/tasks/{base['id']}")).status_code == 204
+
+    async def test_delete_project_with_dependents_returns_409(self, client):
+        """Test that a project others depend on is not deleted."""
+        base = (await client.post("/api/projects", json=project_payload())).json()
+        await client.post("/api/projects", json=project_payload([base["id"]]))
+
+        response = await client.delete(f"/api/projects/{base['id']}")
+
+        assert response.status_code == 409
+
+
+class TestDependencyValidation:
+    """Test that the repository's dependency checks surface as 422 or 404."""
+
+    async def test_create_with_missing_dependency_returns_422(self, client):
+        """Test that an unknown dependency is rejected."""
+        response = await client.post("/api/tasks", json=task_payload(uuid4(), [uuid4()]))
+
+        assert response.status_code == 422
+        assert "not found" in response.text
+
+    async def test_update_with_dependency_from_other_project_returns_422(self, client):
+        """Test that a dependency outside the task's project is rejected."""
+        other = (await client.post("/api/tasks", json=task_payload(uuid4()))).json()
+        task = (await client.post("/api/tasks", json=task_payload(uuid4()))).json()
+
+        response = await client.put(
+            f"/api/tasks/{task['id']}", json={"dependencies": [other["id"]]}
+        )
+
+        assert response.status_code == 422
+        assert "same project" in response.text
+
+    async def test_update_missing_task_returns_404(self, client):
+        """Test that updating an unknown task is a 404 even with dependencies."""
+        response = await client.put(f"/api/tasks/{uuid4()}", json={"dependencies": []})
+
+        assert response.status_code == 404
+
+
+class TestDependencyCycles:
+    """Test that updates closing a dependency cycle are rejected."""
+
+    async def test_task_update_closing_cycle_returns_422(self, client):
+        """Test that the repository's cycle check surfaces as 422 with the path."""
+        project_id = uuid4()
+        base = (await client.post("/api/tasks", json=task_payload(project_id))).json()
+        dependent = (
+            await client.post("/api/tasks", json=task_payload(project_id, [base["id"]]))
+        ).json()
+
+        response = await client.put(
+            f"/api/tasks/{base['id']}", json={"dependencies": [dependent["id"]]}
+        )
+
+        assert response.status_code == 422
+        assert f"{base['id']} -> {dependent['id']} -> {base['id']}" in response.text
+
+    async def test_project_update_closing_cycle_returns_422(self, client):
+        """Test that a project cannot depend on its own dependent."""
+        base = (await client.post("/api/projects", json=project_payload())).json()
+        dependent = (
+            await client.post("/api/projects", json=project_payload([base["id"]]))
+        ).json()
+
+        response = await client.put(
+            f"/api/projects/{base['id']}", json={"dependencies": [dependent["id"]]}
+        )
+
+        assert response.status_code == 422
+
+
+class TestUnblockedTasks:
+    """Test GET /api/tasks/unblocked."""
+
+    async def test_lists_ready_tasks(self, client):
+        """Test that the route is not shadowed by /{task_id} and filters blocked tasks."""
+        project_id = uuid4()
+        base = (await client.post("/api/tasks", json=task_payload(project_id))).json()
+        await client.post("/api/tasks", json=task_payload(project_id, [base["id"]]))
+
+        response = await client.get("/api/tasks/unblocked", params={"project_id": str(project_id)})
+
+        assert response.status_code == 200
+        assert [t["id"] for t in response.json()] == [base["id"]]
+
+
+class TestTaskBatch:
+    """Test POST /api/tasks:batch."""
+
+    async def test_applies_items_in_one_batch(self, client):
+        """Test creates referencing each other, an update and blocker counts."""
+        project_id = (await client.post("/api/projects", json=project_payload())).json()["id"]
+        first_id = str(uuid4())
+        base = (await client.post("/api/tasks", json=task_payload(project_id))).json()
+        items = [
+            {"op": "create", "id": first_id, **task_payload(project_id, title="First")},
+            {"op": "create", **task_payload(project_id, [first_id], title="Second")},
+            {"op": "update", "id": base["id"], "status": "done"},
+        ]
+
+        response = await client.post("/api/tasks:batch", json={"items": items})
+
+        body = response.json()
+        assert response.status_code == 200
+        assert body["applied"] is True
+        assert [r["status"] for r in body["results"]] == ["created", "created", "updated"]
+        assert body["results"][0]["task"]["id"] == first_id
+        unblocked = await client.get("/api/tasks/unblocked", params={"project_id": str(project_id)})
+        assert [t["id"] for t in unblocked.json()] == [first_id]
+
+    async def test_invalid_item_rejects_whole_batch(self, client):
+        """Test that nothing is written and each item reports its outcome."""
+        project_id = (await client.post("/api/projects", json=project_payload())).json()["id"]
+        items = [
+            {"op": "create", **task_payload(project_id)},
+            {"op": "delete", "id": str(uuid4())},
+        ]
+
+        response = await client.post("/api/tasks:batch", json={"items": items})
+
+        assert response.status_code == 422
+        assert response.json() == {
+            "applied": False,
+            "results": [
+                {"index": 0, "op": "create", "status": "skipped", "task": None, "error": None},
+                {
+                    "index": 1,
+                    "op": "delete",
+                    "status": "rejected",
+                    "task": None,
+                    "error": "Task not found",
+                },
+            ],
+        }
+        assert (await client.get("/api/tasks")).json() == []
+
+    async def test_unknown_project_is_422_per_item(self, client):
+        """Test that a create in a missing project is rejected, not a 409 retry."""
+        project_id = uuid4()
+
+        response = await client.post(
+            "/api/tasks:batch", json={"items": [{"op": "create", **task_payload(project_id)}]}
+        )
+
+        assert response.status_code == 422
+        assert response.json()["results"][0]["error"] == f"Project {project_id} not found"
+
+
+class TestProjectProgress:
+    """Test GET /api/projects/{project_id}/progress."""
+
+    async def test_counts_tasks_by_status(self, client):
+        """Test the counters and completion ratio of a project's tasks."""
+        project = (await client.post("/api/projects", json=project_payload())).json()
+        for status in ("done", "blocked", "todo", "todo"):
+            await client.post("/api/tasks", json=task_payload(project["id"], status=status))
+
+        response = await client.get(f"/api/projects/{project['id']}/progress")
+
+        body = response.json()
+        assert response.status_code == 200
+        assert (body["task_count"], body["tasks_done"], body["tasks_blocked"]) == (4, 1, 1)
+        assert body["completion"] == pytest.approx(0.25)
+
+    async def test_empty_project_has_no_completion(self, client):
+        """Test that a project without tasks reports zeros and a null completion."""
+        project = (await client.post("/api/projects", json=project_payload())).json()
+
+        body = (await client.get(f"/api/projects/{project['id']}/progress")).json()
+
+        assert body["task_count"] == 0
+        assert body["completion"] is None
+
+    async def test_unknown_project_returns_404(self, client):
+        """Test that a missing project is not reported as empty."""
+        response = await client.get(f"/api/projects/{uuid4()}/progress")
+
+        assert response.status_code == 404
+
+
+class TestProjectSchedule:
+    """Test GET /api/projects/{project_id}/schedule."""
+
+    async def test_returns_critical_path(self, client):
+        """Test slack and the critical path of a small DAG."""
+        project = (await client.post("/api/projects", json=project_payload())).json()
+        first = (await client.post("/api/tasks", json=task_payload(project["id"]))).json()
+        long = task_payload(project["id"], [first["id"]], size="L")
+        short = task_payload(project["id"], [first["id"]], size="XS")
+        long_id = (await client.post("/api/tasks", json=long)).json()["id"]
+        short_id = (await client.post("/api/tasks", json=short)).json()["id"]
+
+        response = await client.get(f"/api/projects/{project['id']}/schedule")
+
+        body = response.json()
+        slack = {t["task_id"]: t["slack"] for t in body["tasks"]}
+        assert response.status_code == 200
+        assert body["duration"] == 8
+        assert body["critical_path"] == [first["id"], long_id]
+        assert slack[short_id] == 4
+        assert body["tasks"][0]["critical"] is True
+
+    async def test_unknown_project_returns_404(self, client):
+        """Test that a missing project has no schedule."""
+        response = await client.get(f"/api/projects/{uuid4()}/schedule")
+
+        assert response.status_code == 404
+
+
+class TestNextTasks:
+    """Test GET /api/tasks/next."""
+
+    async def test_suggests_ready_tasks_within_budget(self, client):
+        """Test that blocked and oversized work is not suggested."""
+        project = (await client.post("/api/projects", json=project_payload())).json()
+        first = (await client.post("/api/tasks", json=task_payload(project["id"], size="S"))).json()
+        await client.post("/api/tasks", json=task_payload(project["id"], [first["id"]], size="XS"))
+        await client.post("/api/tasks", json=task_payload(project["id"], size="XL"))
+
+        response = await client.get("/api/tasks/next", params={"energy": "Focus", "budget": 3})
+
+        body = response.json()
+        assert response.status_code == 200
+        assert [s["task"]["id"] for s in body["suggestions"]] == [first["id"]]
+        assert body["suggestions"][0]["project_priority"] == "P2"
+        assert body["budget_left"] == 1
+
+    async def test_energy_is_required(self, client):
+        """Test that the route is not shadowed by /{task_id} and validates energy."""
+        response = await client.get("/api/tasks/next", params={"budget": 3})
+
+        assert response.status_code == 422
+
+
+class TestDependencyClosure:
+    """Test GET /api/tasks/{task_id}/upstream and /downstream."""
+
+    @staticmethod
+    async def chain(client):
+        """Create tasks a <- b <- c <- d (each depends on the previous) and return IDs."""
+        project = (await client.post("/api/projects", json=project_payload())).json()
+        ids: list[str] = []
+        for _ in range(4):
+            payload = task_payload(project["id"], ids[-1:])
+            ids.append((await client.post("/api/tasks", json=payload)).json()["id"])
+        return ids
+
+    async def test_upstream_streams_dependencies_first(self, client):
+        """Test NDJSON lines in topological order, cut at the depth limit."""
+        _, b, c, d = await self.chain(client)
+
+        response = await client.get(f"/api/tasks/{d}/upstream", params={"depth": 2})
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [(e["task"]["id"], e["depth"]) for e in lines] == [(b, 2), (c, 1)]
+
+    async def test_downstream_follows_dependents(self, client):
+        """Test that the downstream closure lists every dependent, nearest first."""
+        a, b, c, d = await self.chain(client)
+
+        response = await client.get(f"/api/tasks/{a}/downstream")
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [(e["task"]["id"], e["depth"]) for e in lines] == [(b, 1), (c, 2), (d, 3)]
+
+    async def test_unknown_task_returns_404(self, client):
+        """Test that a missing root task is a 404, not an empty stream."""
+        response = await client.get(f"/api/tasks/{uuid4()}/upstream")
+
+        assert response.status_code == 404
@@ -0,0 +1,146 @@
+"""Tests for transitive dependency closures."""
+
+from collections import namedtuple
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from ai_life_backend.projects.domain.task import (
+    Task,
+    TaskClarity,
+    TaskContinuity,
+    TaskEnergy,
+    TaskRisk,
+    TaskSize,
+)
+from ai_life_backend.projects.repository.postgres_task_repository import (
+    PostgresTaskRepository,
+    closure_query,
+    tasks_table,
+)
+from ai_life_backend.projects.services.closure import closure_depths, order_closure
+
+
+def make_task(dependencies=()):
+    """Build an open task with the given dependencies."""
+    now = datetime.now(UTC)
+    return Task(
+        id=uuid4(),
+        project_id=uuid4(),
+        title="Task",
+        status="todo",
+        dependencies=list(dependencies),
+        size=TaskSize.M,
+        energy=TaskEnergy.FOCUS,
+        continuity=TaskContinuity.CHAIN,
+        clarity=TaskClarity.CLEAR,
+        risk=TaskRisk.GREEN,
+        context="",
+        date_created=now,
+        date_updated=now,
+    )
+
+
+class TestClosureDepths:
+    """Test the depth-limited breadth-first search."""
+
+    def test_fewest_edges_within_limit(self):
+        """Test that each node gets its shortest distance and the limit cuts the walk."""
+        a, b, c, d = uuid4(), uuid4(), uuid4(), uuid4()
+        edges = {a: [b, c], b: [c], c: [d], d: []}
+
+        assert closure_depths(a, edges.__getitem__, 10) == {b: 1, c: 1, d: 2}
+        assert closure_depths(a, edges.__getitem__, 1) == {b: 1, c: 1}
+
+
+class TestOrderClosure:
+    """Test topological ordering of a closure."""
+
+    def test_dependencies_come_first_despite_depth(self):
+        """Test that a shallow task still follows a deeper dependency inside the closure."""
+        a = make_task()
+        b = make_task(dependencies=[a.id])
+        c = make_task(dependencies=[a.id, b.id])
+
+        entries = order_closure([c, a, b], {c.id: 1, b.id: 1, a.id: 1})
+
+        assert [e.task.id for e in entries] == [a.id, b.id, c.id]
+
+    def test_rank_then_depth(self):
+        """Test that tasks without dependencies inside the closure come first, nearest first."""
+        deep = make_task()
+        dependent = make_task(dependencies=[deep.id])
+        shallow = make_task()
+
+        entries = order_closure(
+            [dependent, deep, shallow], {dependent.id: 1, deep.id: 2, shallow.id: 1}
+        )
+
+        assert [e.task.id for e in entries] == [shallow.id, deep.id, dependent.id]
+
+
+class TestClosureQuery:
+    """Test the Postgres statement shape."""
+
+    def test_recursive_and_depth_limited(self):
+        """Test that the closure is one WITH RECURSIVE statement bounded by depth."""
+        sql = str(closure_query(uuid4(), "downstream", 5).compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("WITH RECURSIVE closure")
+        assert "closure.depth < " in sql
+        assert "min(closure.depth)" in sql
+
+    def test_sorted_by_rank_in_the_database(self):
+        """Test that the statement orders rows itself, so they can be streamed as read."""
+        sql = str(closure_query(uuid4(), "upstream", 5).compile(dialect=postgresql.dialect()))
+
+        assert "levels(id, rank)" in sql
+        assert sql.endswith("ORDER BY ranks.rank, depths.depth, tasks.id")
+
+
+class FakeStreamResult:
+    """Server-side cursor stand-in returning rows in fixed partitions."""
+
+    def __init__(self, partitions):
+        """Hold the partitions."""
+        self._partitions = partitions
+
+    async def partitions(self):
+        """Yield each partition."""
+        for rows in self._partitions:
+            yield rows
+
+
+class TestStreamClosure:
+    """Test that the Postgres closure is streamed batch by batch."""
+
+    async def test_yields_one_batch_per_partition(self):
+        """Test that each cursor partition becomes one batch, in the query's order."""
+        first, second = make_task(), make_task()
+        names = [column.name for column in tasks_table.c]
+        row = namedtuple("Row", [*names, "depth"])
+        rows = [
+            row(*(getattr(t, name, 0) for name in names), d) for t, d in ((first, 1), (second, 2))
+        ]
+        streamed = []
+
+        class Connection:
+            async def stream(self, statement):
+                streamed.append(statement.get_execution_options()["yield_per"])
+                return FakeStreamResult([rows[:1], rows[1:]])
+
+        @asynccontextmanager
+        async def connect():
+            yield Connection()
+
+        repo = PostgresTaskRepository(SimpleNamespace(connect=connect))
+        batches = [b async for b in repo.stream_closure(uuid4(), "upstream", 5, batch_size=1)]
+
+        assert streamed == [1]
+        assert [[(e.task.id, e.depth) for e in b] for b in batches] == [
+            [(first.id, 1)],
+            [(second.id, 2)],
+        ]
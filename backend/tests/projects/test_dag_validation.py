@@ -1,8 +1,16 @@
 """Tests for DAG (Directed Acyclic Graph) validation."""
 
+from types import SimpleNamespace
+
 import pytest
 from uuid import uuid4
 
+from sqlalchemy.dialects import postgresql
+
+from ai_life_backend.projects.repository.dependency_cycles import cycle_path, cycle_query
+from ai_life_backend.projects.repository.postgres_task_repository import (
+    task_dependencies_table,
+)
 from ai_life_backend.projects.services.dag_validator import (
     DagValidator,
     CycleDetectedError,
@@ -111,3 +119,113 @@ class TestDagValidator:
         assert cycle_path is not None
         # Should contain the cycle participants
         assert a in cycle_path or b in cycle_path or c in cycle_path
+
+    def test_validate_edges_accepts_acyclic_edit(self):
+        """Test replacing edges without closing a cycle."""
+        validator = DagValidator()
+        a, b, c = uuid4(), uuid4(), uuid4()
+        graph = {a: [b], b: [], c: []}
+        validator.validate_edges(graph, b, [c])  # Should not raise
+
+    def test_validate_edges_detects_cycle_with_path(self):
+        """Test that a new edge back to an ancestor is rejected with its path."""
+        validator = DagValidator()
+        a, b, c = uuid4(), uuid4(), uuid4()
+        graph = {a: [b], b: [c], c: []}
+        with pytest.raises(CycleDetectedError) as exc_info:
+            validator.validate_edges(graph, c, [a])
+        assert str(exc_info.value).endswith(f"{c} -> {a} -> {b} -> {c}")
+
+    def test_validate_edges_self_loop(self):
+        """Test that a self-dependency is rejected."""
+        validator = DagValidator()
+        a = uuid4()
+        with pytest.raises(CycleDetectedError):
+            validator.validate_edges({a: []}, a, [a])
+
+    def test_validate_edges_ignores_unrelated_region(self):
+        """Test that only the region reachable from the new targets is visited."""
+
+        class CountingGraph(dict):
+            """Adjacency dict that records visited nodes."""
+
+            visited: set
+
+            def get(self, key, default=None):
+                self.visited.add(key)
+                return super().get(key, default)
+
+        validator = DagValidator()
+        a, b = uuid4(), uuid4()
+        unrelated = [uuid4() for _ in range(100)]
+        graph = CountingGraph({a: [], b: [], **{n: [] for n in unrelated}})
+        graph.visited = set()
+        validator.validate_edges(graph, a, [b])
+        assert graph.visited == {b}
+
+
+class TestDagValidatorDeepGraphs:
+    """Test that validation does not depend on Python's recursion limit."""
+
+    DEPTH = 20_000  # well above the default recursion limit
+
+    def test_deep_chain_no_cycle(self):
+        """Test a chain far deeper than the recursion limit."""
+        nodes = [uuid4() for _ in range(self.DEPTH)]
+        graph = {a: [b] for a, b in zip(nodes, nodes[1:])}
+        graph[nodes[-1]] = []
+        validator = DagValidator()
+        assert validator.has_cycle(graph) is False
+        validator.validate(graph)  # Should not raise
+
+    def test_deep_chain_cycle_path(self):
+        """Test that a cycle closing a deep chain is reported with its full path."""
+        nodes = [uuid4() for _ in range(self.DEPTH)]
+        graph = {a: [b] for a, b in zip(nodes, nodes[1:])}
+        graph[nodes[-1]] = [nodes[0]]
+        cycle_path = DagValidator().find_cycle_path(graph)
+        assert cycle_path == [*nodes, nodes[0]]
+
+    def test_cycle_path_excludes_acyclic_prefix(self):
+        """Test that only the cycle members are returned: A -> B -> C -> D -> B."""
+        a, b, c, d = uuid4(), uuid4(), uuid4(), uuid4()
+        graph = {a: [b], b: [c], c: [d], d: [b]}
+        assert DagValidator().find_cycle_path(graph) == [b, c, d, b]
+
+    def test_dangling_dependency_is_not_a_cycle(self):
+        """Test neighbors that are not keys of the graph."""
+        a, b = uuid4(), uuid4()
+        assert DagValidator().find_cycle_path({a: [b]}) is None
+
+
+class TestCycleQuery:
+    """Test the in-database cycle check used by dependency updates."""
+
+    def test_recursive_walk_from_new_dependencies(self):
+        """Test that one WITH RECURSIVE walk starts at the targets and stops at the source."""
+        sql = str(
+            cycle_query(task_dependencies_table, uuid4(), [uuid4()]).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        assert sql.startswith("WITH RECURSIVE walk")
+        assert "unnest(" in sql
+        assert "walk.id != " in sql
+        assert "EXISTS (SELECT hit.id" in sql
+
+    def test_cycle_path_from_parent_rows(self):
+        """Test rebuilding source -> target -> ... -> source from the walk rows."""
+        a, b, c, d = uuid4(), uuid4(), uuid4(), uuid4()
+        rows = [
+            SimpleNamespace(id=b, parent=None),
+            SimpleNamespace(id=d, parent=None),
+            SimpleNamespace(id=c, parent=b),
+            SimpleNamespace(id=a, parent=c),
+        ]
+
+        assert cycle_path(a, rows) == [a, b, c, a]
+
+    def test_no_rows_is_no_cycle(self):
+        """Test that an acyclic edit (no rows) reports no path."""
+        assert cycle_path(uuid4(), []) is None
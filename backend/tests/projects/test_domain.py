@@ -1,6 +1,7 @@
 """Tests for Projects and Tasks domain entities."""
 
 import pytest
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timezone
 from uuid import uuid4
 
@@ -179,3 +180,24 @@ class TestTask:
         assert task.size == TaskSize.XL
         assert task.energy == TaskEnergy.DEEP
         assert task.risk == TaskRisk.RED
+
+    def test_task_is_slotted_and_frozen(self):
+        """Test that tasks carry no per-instance __dict__ and stay immutable."""
+        task = Task(
+            id=uuid4(),
+            project_id=uuid4(),
+            title="Slotted",
+            status="todo",
+            dependencies=[],
+            size=TaskSize.S,
+            energy=TaskEnergy.FOCUS,
+            continuity=TaskContinuity.CHAIN,
+            clarity=TaskClarity.CLEAR,
+            risk=TaskRisk.GREEN,
+            context="",
+            date_created=datetime.now(timezone.utc),
+            date_updated=datetime.now(timezone.utc),
+        )
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            task.title = "Changed"
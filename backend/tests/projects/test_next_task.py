@@ -0,0 +1,88 @@
+"""Tests for the next-task scheduler."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from ai_life_backend.projects.domain.project import ProjectPriority
+from ai_life_backend.projects.domain.task import (
+    Task,
+    TaskClarity,
+    TaskContinuity,
+    TaskEnergy,
+    TaskRisk,
+    TaskSize,
+)
+from ai_life_backend.projects.services.next_task import NextTaskQuery, pick_next_tasks
+
+URGENT, LATER = uuid4(), uuid4()
+PRIORITIES = {URGENT: ProjectPriority.P0, LATER: ProjectPriority.P2}
+START = datetime(2030, 1, 1, tzinfo=UTC)
+
+
+def make_task(project_id=LATER, size="S", energy="Focus", continuity="chain", age=0):
+    """Build a ready task; larger `age` means created earlier."""
+    return Task(
+        id=uuid4(),
+        project_id=project_id,
+        title="Task",
+        status="todo",
+        dependencies=[],
+        size=TaskSize(size),
+        energy=TaskEnergy(energy),
+        continuity=TaskContinuity(continuity),
+        clarity=TaskClarity.CLEAR,
+        risk=TaskRisk.GREEN,
+        context="",
+        date_created=START - timedelta(days=age),
+        date_updated=START,
+    )
+
+
+def pick(ready, slack=None, energy="Deep", budget=100, limit=10):
+    """Run the picker and return the picked tasks."""
+    query = NextTaskQuery(TaskEnergy(energy), budget, limit)
+    return [s.task for s in pick_next_tasks(ready, PRIORITIES, slack or {}, query)]
+
+
+class TestPickNextTasks:
+    """Test ranking, filtering and the budget."""
+
+    def test_project_priority_then_slack(self):
+        """Test that P0 comes first and critical tasks precede tasks with slack."""
+        relaxed, critical, urgent = make_task(), make_task(), make_task(URGENT)
+
+        assert pick([relaxed, critical, urgent], {relaxed.id: 4}) == [urgent, critical, relaxed]
+
+    def test_energy_match_continuity_and_age_break_ties(self):
+        """Test that matching energy, chain continuity and older tasks rank first."""
+        light = make_task(energy="Light")
+        puzzle = make_task(energy="Deep", continuity="puzzle")
+        chain_new = make_task(energy="Deep")
+        chain_old = make_task(energy="Deep", age=3)
+
+        assert pick([light, puzzle, chain_new, chain_old]) == [chain_old, chain_new, puzzle, light]
+
+    def test_tasks_needing_more_energy_are_skipped(self):
+        """Test that a Light slot never gets Focus or Deep work."""
+        light, focus = make_task(energy="Light"), make_task(energy="Focus")
+
+        assert pick([focus, light], energy="Light") == [light]
+
+    def test_budget_is_filled_greedily(self):
+        """Test that tasks that no longer fit are skipped, not the rest of the queue."""
+        large = make_task(URGENT, size="L")
+        medium, small = make_task(size="M", age=2), make_task(size="S", age=1)
+
+        suggestions = pick_next_tasks(
+            [small, medium, large], PRIORITIES, {}, NextTaskQuery(TaskEnergy.DEEP, 7, 10)
+        )
+
+        assert [s.task for s in suggestions] == [large, small]
+        assert [s.effort for s in suggestions] == [5, 2]
+        assert suggestions[0].project_priority == ProjectPriority.P0
+
+    def test_limit_and_unknown_project(self):
+        """Test the limit and that tasks of unknown projects rank as P3."""
+        orphan, known = make_task(uuid4()), make_task()
+
+        assert pick([orphan, known], limit=1) == [known]
@@ -0,0 +1,168 @@
+"""Tests for validating task batches against the affected projects."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from ai_life_backend.core.public import BatchRejectedError
+from ai_life_backend.projects.domain.task import (
+    CreateTaskInput,
+    Task,
+    TaskBatchCreate,
+    TaskBatchDelete,
+    TaskBatchUpdate,
+    TaskClarity,
+    TaskContinuity,
+    TaskEnergy,
+    TaskRisk,
+    TaskSize,
+    UpdateTaskInput,
+)
+from ai_life_backend.projects.services.dag_validator import DagValidator
+from ai_life_backend.projects.services.task_batch import batch_scope, plan_task_batch
+
+
+def create_item(project_id, dependencies=(), task_id=None, title="Task"):
+    """Build a create item."""
+    return TaskBatchCreate(
+        id=task_id,
+        data=CreateTaskInput(
+            project_id=project_id,
+            title=title,
+            dependencies=list(dependencies),
+            size=TaskSize.M,
+            energy=TaskEnergy.FOCUS,
+            continuity=TaskContinuity.CHAIN,
+            clarity=TaskClarity.CLEAR,
+            risk=TaskRisk.GREEN,
+        ),
+    )
+
+
+def existing_task(project_id, dependencies=()):
+    """Build a stored task."""
+    now = datetime.now(UTC)
+    return Task(
+        id=uuid4(),
+        project_id=project_id,
+        title="Existing",
+        status="todo",
+        dependencies=list(dependencies),
+        size=TaskSize.S,
+        energy=TaskEnergy.LIGHT,
+        continuity=TaskContinuity.LINKED,
+        clarity=TaskClarity.CLEAR,
+        risk=TaskRisk.GREEN,
+        context="",
+        date_created=now,
+        date_updated=now,
+    )
+
+
+def plan(items, *tasks, projects=None):
+    """Plan a batch against the given stored tasks; every project exists unless given."""
+    if projects is None:
+        projects, _ = batch_scope(items)
+    return plan_task_batch(items, {t.id: t for t in tasks}, projects, DagValidator())
+
+
+class TestPlanTaskBatch:
+    """Test per-item validation and the single combined-graph check."""
+
+    def test_items_may_depend_on_later_items(self):
+        """Test that references resolve against the state after the whole batch."""
+        project_id, later_id = uuid4(), uuid4()
+        items = [
+            create_item(project_id, [later_id]),
+            create_item(project_id, task_id=later_id),
+        ]
+
+        result = plan(items)
+
+        assert result.created[0].dependencies == [later_id]
+        assert result.created[1].id == later_id
+
+    def test_update_merges_and_records_version(self):
+        """Test that updates keep unchanged fields and remember the seen version."""
+        project_id = uuid4()
+        stored = existing_task(project_id)
+
+        result = plan([TaskBatchUpdate(stored.id, UpdateTaskInput(status="done"))], stored)
+
+        assert result.updated[0].status == "done"
+        assert result.updated[0].title == "Existing"
+        assert result.versions == {stored.id: (0, stored.date_updated)}
+
+    def test_reports_every_invalid_item(self):
+        """Test that problems are collected per item index instead of stopping early."""
+        project_id, other_project = uuid4(), uuid4()
+        stored = existing_task(project_id)
+        foreign = existing_task(other_project)
+        items = [
+            create_item(project_id, [foreign.id]),
+            TaskBatchDelete(uuid4()),
+            create_item(project_id, [stored.id]),
+            TaskBatchUpdate(stored.id, UpdateTaskInput(title="Twice")),
+            TaskBatchDelete(stored.id),
+        ]
+
+        with pytest.raises(BatchRejectedError) as info:
+            plan(items, stored, foreign)
+
+        assert info.value.errors == {
+            0: f"Dependency task {foreign.id} not found in project {project_id}",
+            1: "Task not found",
+            4: f"Task {stored.id} appears more than once in the batch",
+        }
+
+    def test_create_in_unknown_project_is_rejected(self):
+        """Test that a missing project is an item problem, not a failed write later."""
+        known, unknown = uuid4(), uuid4()
+        items = [create_item(known), create_item(unknown)]
+
+        with pytest.raises(BatchRejectedError) as info:
+            plan(items, projects={known})
+
+        assert info.value.errors == {1: f"Project {unknown} not found"}
+
+    def test_delete_with_remaining_dependents_is_rejected(self):
+        """Test that a delete is allowed only if no remaining task depends on it."""
+        project_id = uuid4()
+        base = existing_task(project_id)
+        dependent = existing_task(project_id, [base.id])
+
+        with pytest.raises(BatchRejectedError, match="invalid item"):
+            plan([TaskBatchDelete(base.id)], base, dependent)
+        result = plan(
+            [
+                TaskBatchUpdate(dependent.id, UpdateTaskInput(dependencies=[])),
+                TaskBatchDelete(base.id),
+            ],
+            base,
+            dependent,
+        )
+
+        assert list(result.deleted) == [1]
+
+    def test_cycle_across_items_is_found_once(self):
+        """Test that a cycle closed by several items is attributed to each of them."""
+        project_id, a, b = uuid4(), uuid4(), uuid4()
+        stored = existing_task(project_id)
+        items = [
+            create_item(project_id, [b], task_id=a),
+            create_item(project_id, [a, stored.id], task_id=b),
+        ]
+
+        with pytest.raises(BatchRejectedError) as info:
+            plan(items, stored)
+
+        assert set(info.value.errors) == {0, 1}
+        assert info.value.errors[0].startswith("Cycle detected in dependency graph")
+
+    def test_batch_scope(self):
+        """Test that creates contribute projects and updates/deletes contribute tasks."""
+        project_id, task_id = uuid4(), uuid4()
+        items = [create_item(project_id), TaskBatchDelete(task_id)]
+
+        assert batch_scope(items) == ({project_id}, {task_id})
@@ -0,0 +1,65 @@
+"""Tests for the application-scoped dependency container."""
+
+from ai_life_backend.container import Container, dispose_container, get_container
+from ai_life_backend.core.public import CacheSettings
+from ai_life_backend.database import get_engine
+from ai_life_backend.goals.api.routes import get_repository as get_goal_repository
+from ai_life_backend.goals.repository import CachedGoalRepository, PostgresGoalRepository
+from ai_life_backend.milestones.api.routes import get_repository as get_milestone_repository
+from ai_life_backend.milestones.repository.cached_milestone_repository import (
+    CachedMilestoneRepository,
+)
+from ai_life_backend.projects.api.routes import (
+    get_next_task_scheduler,
+    get_project_repository,
+    get_scheduler,
+    get_task_repository,
+)
+from ai_life_backend.projects.repository import CachedTaskRepository, PostgresTaskRepository
+
+
+class TestContainer:
+    """Test container lifetime and wiring."""
+
+    async def test_routes_resolve_to_shared_instances(self):
+        """Test that route dependencies return the container's repositories every time."""
+        await dispose_container()
+        container = get_container()
+
+        assert get_container() is container
+        assert get_goal_repository() is container.goals
+        assert get_goal_repository() is get_goal_repository()
+        assert get_milestone_repository() is container.milestones
+        assert get_project_repository() is container.projects
+        assert get_task_repository() is container.tasks
+        assert get_scheduler() is container.scheduler
+        assert get_next_task_scheduler() is container.next_tasks
+        await dispose_container()
+
+    async def test_dispose_builds_fresh_container(self):
+        """Test that a disposed container is replaced on next use."""
+        first = get_container()
+        await dispose_container()
+
+        second = get_container()
+
+        assert isinstance(second, Container)
+        assert second is not first
+        assert second.engine is not first.engine
+        await dispose_container()
+
+    async def test_cache_settings_select_repositories(self):
+        """Test that goal/milestone reads and schedules are cached unless the cache is disabled."""
+        engine = get_engine()
+
+        cached = Container.build(engine, CacheSettings(ttl_seconds=5, max_entries=10))
+        uncached = Container.build(engine, CacheSettings(ttl_seconds=0))
+
+        assert isinstance(cached.goals, CachedGoalRepository)
+        assert isinstance(cached.milestones, CachedMilestoneRepository)
+        assert isinstance(cached.tasks, CachedTaskRepository)
+        assert cached.cache is not None
+        assert type(uncached.goals) is PostgresGoalRepository
+        assert type(uncached.tasks) is PostgresTaskRepository
+        assert uncached.cache is None
+        await dispose_container()
@@ -0,0 +1,290 @@
+"""Tests for bulk import parsing, validation and the import route."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+import json
+from uuid import uuid4
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+import pytest
+
+from ai_life_backend.container import get_container
+from ai_life_backend.transfer.api.routes import router
+from ai_life_backend.transfer.services.bulk_import import import_batch
+from ai_life_backend.transfer.services.import_format import (
+    ImportValidationError,
+    parse_csv,
+    parse_ndjson,
+)
+from ai_life_backend.transfer.services.ndjson_export import encode_record, meta_record
+
+
+def task_data(project_id, dependencies=(), **overrides):
+    """Build a valid task record."""
+    data = {
+        "id": str(uuid4()),
+        "project_id": str(project_id),
+        "title": "Task",
+        "dependencies": [str(d) for d in dependencies],
+        "size": "M",
+        "energy": "Focus",
+        "continuity": "chain",
+        "clarity": "clear",
+        "risk": "green",
+    }
+    data.update(overrides)
+    return data
+
+
+def ndjson(*records):
+    """Join (type, data) pairs into NDJSON lines."""
+    return [encode_record(kind, data) for kind, data in records]
+
+
+class FakeDriver:
+    """asyncpg connection stand-in recording COPY calls."""
+
+    def __init__(self):
+        """Start with no copies."""
+        self.copies = {}
+
+    async def copy_records_to_table(self, table_name, *, records, columns):
+        """Record the copied rows."""
+        self.copies[table_name] = (columns, list(records))
+
+
+class FakeResult:
+    """Result of the set-based check query."""
+
+    def __init__(self, problems):
+        """Hold problem messages."""
+        self._problems = problems
+
+    def scalars(self):
+        """Return self for `.scalars().all()`."""
+        return self
+
+    def all(self):
+        """Return the problems."""
+        return self._problems
+
+
+class FakeConnection:
+    """Transaction stand-in recording statements; the check query returns `problems`."""
+
+    def __init__(self, problems):
+        """Start empty."""
+        self.problems = problems
+        self.statements = []
+        self.driver = FakeDriver()
+
+    async def execute(self, statement, parameters=None):
+        """Record a statement."""
+        self.statements.append(str(statement))
+        return FakeResult(self.problems if "UNION ALL" in str(statement) else [])
+
+    async def get_raw_connection(self):
+        """Return an object exposing the driver connection."""
+        return self
+
+    @property
+    def driver_connection(self):
+        """The fake asyncpg connection."""
+        return self.driver
+
+
+class FakeEngine:
+    """Engine stand-in with one transaction."""
+
+    def __init__(self, problems=()):
+        """Create the connection."""
+        self.connection = FakeConnection(list(problems))
+
+    @asynccontextmanager
+    async def begin(self):
+        """Yield the connection."""
+        yield self.connection
+
+
+class TestParsing:
+    """Test record conversion and per-record errors."""
+
+    def test_parses_export_format(self):
+        """Test that export lines round-trip and edge records are skipped."""
+        goal_id, project_id = uuid4(), uuid4()
+        now = datetime.now(timezone.utc)
+        lines = [meta_record()] + ndjson(
+            ("goal", {"id": str(goal_id), "title": "G", "is_done": False}),
+            ("project", {"id": str(project_id), "title": "P", "priority": "P1", "risk": "red"}),
+            ("task", task_data(project_id, date_created=now.isoformat())),
+            ("project_dependency", {"project_id": str(project_id), "depends_on_id": str(goal_id)}),
+        )
+
+        batch = parse_ndjson(lines)
+
+        assert batch.errors == []
+        assert batch.counts() == {"goal": 1, "milestone": 0, "project": 1, "task": 1}
+        assert batch.rows["goal"][0][:3] == (goal_id, "G", False)
+        assert batch.rows["task"][0][11] == now
+
+    def test_defaults_fill_optional_columns(self):
+        """Test that ids, statuses, lists and timestamps are defaulted."""
+        batch = parse_ndjson(ndjson(("project", {"title": "P", "priority": "P0", "risk": "green"})))
+
+        row = batch.rows["project"][0]
+        assert row[1] is None
+        assert row[3] == "todo"
+        assert row[7] == []
+        assert row[8] == []
+
+    def test_reports_errors_with_line_numbers(self):
+        """Test that bad records are collected instead of aborting the parse."""
+        lines = [
+            *ndjson(("goal", {"title": " "})),
+            b"not json\n",
+            *ndjson(("task", task_data(uuid4(), size="XXL")), ("widget", {})),
+        ]
+
+        batch = parse_ndjson(lines)
+
+        assert batch.errors == [
+            "line 1: goal title cannot be empty",
+            "line 2: invalid JSON",
+            "line 3: task size 'XXL' is not a valid TaskSize",
+            "line 4: unknown record type 'widget'",
+        ]
+        with pytest.raises(ImportValidationError, match=r"4 problem\(s\)"):
+            batch.raise_errors()
+
+    def test_rejects_foreign_meta(self):
+        """Test that a header of another format is rejected."""
+        batch = parse_ndjson(ndjson(("meta", {"format": "other", "version": 1})))
+
+        assert batch.errors == ["line 1: meta record is not an ai-life-os.ndjson header"]
+
+    def test_csv_with_list_columns(self):
+        """Test CSV parsing with `|`-separated lists and string booleans."""
+        project_id, dep_a, dep_b = uuid4(), uuid4(), uuid4()
+        text = (
+            "project_id,title,dependencies,size,energy,continuity,clarity,risk\n"
+            f"{project_id},Write,{dep_a}|{dep_b},S,Deep,linked,cloudy,yellow\n"
+        )
+
+        batch = parse_csv("task", text)
+
+        assert batch.errors == []
+        assert batch.rows["task"][0][4] == [dep_a, dep_b]
+
+
+class TestImportBatch:
+    """Test the staged, set-validated write path."""
+
+    async def test_copies_validates_and_moves(self):
+        """Test that rows are COPYed to staging before checks and inserts."""
+        project_id = uuid4()
+        first = task_data(project_id)
+        batch = parse_ndjson(
+            ndjson(("task", first), ("task", task_data(project_id, [first["id"]])))
+        )
+        engine = FakeEngine()
+
+        summary = await import_batch(engine, batch)
+
+        statements = engine.connection.statements
+        columns, records = engine.connection.driver.copies["import_tasks"]
+        assert summary.tasks == 2
+        assert "open_blocker_count" not in columns
+        assert len(records) == 2
+        assert statements[0].startswith("CREATE TEMP TABLE import_goals")
+        assert any(s.startswith("INSERT INTO task_dependencies") for s in statements)
+        assert any(s.startswith("UPDATE tasks SET open_blocker_count") for s in statements)
+        assert statements[-1].startswith("INSERT INTO project_progress")
+
+    async def test_cycle_is_rejected_before_writing(self):
+        """Test that a dependency cycle among imported tasks is found in one pass."""
+        project_id, a, b = uuid4(), str(uuid4()), str(uuid4())
+        batch = parse_ndjson(
+            ndjson(
+                ("task", task_data(project_id, [b], id=a)),
+                ("task", task_data(project_id, [a], id=b)),
+            )
+        )
+        engine = FakeEngine()
+
+        with pytest.raises(ImportValidationError, match="task dependency cycle"):
+            await import_batch(engine, batch)
+        assert engine.connection.statements == []
+
+    async def test_set_check_problems_abort(self):
+        """Test that problems reported by the set-based checks reject the batch."""
+        batch = parse_ndjson(ndjson(("goal", {"title": "G"})))
+        engine = FakeEngine(problems=["goal x already exists"])
+
+        with pytest.raises(ImportValidationError, match="already exists"):
+            await import_batch(engine, batch)
+        assert not any(s.startswith("INSERT") for s in engine.connection.statements)
+
+
+@pytest.fixture
+async def client():
+    """Create a client for the transfer router; parse failures never reach the DB."""
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.dependency_overrides[get_container] = lambda: None
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+class TestImportRoute:
+    """Test request handling of POST /api/import."""
+
+    async def test_invalid_ndjson_is_422(self, client):
+        """Test that per-record problems are reported without touching the DB."""
+        body = b"".join(ndjson(("goal", {"title": ""})))
+
+        response = await client.post(
+            "/api/import", content=body, headers={"Content-Type": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 422
+        assert "goal title is required" in response.json()["detail"]
+
+    async def test_csv_requires_kind(self, client):
+        """Test that CSV bodies must name their entity type."""
+        response = await client.post(
+            "/api/import", content=b"title\nG\n", headers={"Content-Type": "text/csv"}
+        )
+
+        assert response.status_code == 422
+        assert json.loads(response.text)["detail"] == "CSV import requires the kind parameter"
+
+    async def test_non_utf8_csv_is_422(self, client):
+        """Test that an undecodable CSV body is a client error, not a 500."""
+        response = await client.post(
+            "/api/import",
+            params={"kind": "goal"},
+            content=b"\xff\xfetitle\nG\n",
+            headers={"Content-Type": "text/csv"},
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "CSV body must be UTF-8 encoded"
+
+    @pytest.mark.parametrize("headers", [{"Content-Type": "application/json"}, {}])
+    async def test_other_media_types_are_415(self, client, headers):
+        """Test that only NDJSON and CSV bodies are accepted (a missing type included)."""
+        response = await client.post("/api/import", content=b"{}", headers=headers)
+
+        assert response.status_code == 415
+
+    async def test_media_type_parameters_are_ignored(self, client):
+        """Test that a charset parameter does not change the body format."""
+        response = await client.post(
+            "/api/import",
+            content=b"title\nG\n",
+            headers={"Content-Type": "text/csv; charset=utf-8"},
+        )
+
+        assert response.json()["detail"] == "CSV import requires the kind parameter"
@@ -0,0 +1,147 @@
+"""Tests for the streaming NDJSON export."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+import json
+from uuid import uuid4
+
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+
+from ai_life_backend.transfer.services.ndjson_export import (
+    EXPORT_FORMAT,
+    EXPORT_SECTIONS,
+    encode_record,
+    stream_export,
+)
+
+
+class FakeStreamResult:
+    """Server-side cursor stand-in yielding rows in `yield_per` partitions."""
+
+    def __init__(self, columns, rows, batch_size):
+        """Hold the rows of one statement."""
+        self._rows = IteratorResult(SimpleResultMetaData(columns), iter(rows)).all()
+        self._batch_size = batch_size
+
+    async def partitions(self):
+        """Yield consecutive batches."""
+        for start in range(0, len(self._rows), self._batch_size):
+            yield self._rows[start : start + self._batch_size]
+
+
+class FakeConnection:
+    """Connection stand-in serving rows per table and recording its options."""
+
+    def __init__(self, tables):
+        """Serve `tables` (name -> list of tuples in selected-column order)."""
+        self.tables = tables
+        self.options = {}
+        self.in_transaction = False
+        self.statements = []
+
+    async def execution_options(self, **options):
+        """Record connection options."""
+        self.options.update(options)
+        return self
+
+    @asynccontextmanager
+    async def begin(self):
+        """Open a transaction."""
+        self.in_transaction = True
+        yield self
+        self.in_transaction = False
+
+    async def stream(self, statement):
+        """Return a streamed result for a single-table select."""
+        assert self.in_transaction
+        self.statements.append(statement)
+        table = statement.get_final_froms()[0]
+        columns = [column.name for column in statement.selected_columns]
+        batch_size = statement.get_execution_options()["yield_per"]
+        return FakeStreamResult(columns, self.tables.get(table.name, []), batch_size)
+
+
+class FakeEngine:
+    """Engine stand-in handing out one fake connection."""
+
+    def __init__(self, tables):
+        """Create the connection."""
+        self.connection = FakeConnection(tables)
+
+    @asynccontextmanager
+    async def connect(self):
+        """Yield the connection."""
+        yield self.connection
+
+
+async def collect(engine, batch_size=2):
+    """Run the export and return (chunks, parsed records)."""
+    chunks = [chunk async for chunk in stream_export(engine, batch_size)]
+    records = [json.loads(line) for line in b"".join(chunks).splitlines()]
+    return chunks, records
+
+
+class TestNdjsonExport:
+    """Test record encoding, section order and streaming behaviour."""
+
+    def test_encode_record(self):
+        """Test that UUIDs and datetimes become strings on one line."""
+        goal_id = uuid4()
+        moment = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+        line = encode_record("goal", {"id": goal_id, "date_updated": moment, "is_done": False})
+
+        assert line.endswith(b"\n")
+        assert line.count(b"\n") == 1
+        assert json.loads(line) == {
+            "type": "goal",
+            "data": {"id": str(goal_id), "date_updated": "2025-01-02T03:04:05Z", "is_done": False},
+        }
+
+    def test_sections_are_parent_first_and_skip_derived_columns(self):
+        """Test section order and that open_blocker_count is not exported."""
+        kinds = [section.kind for section in EXPORT_SECTIONS]
+        task_columns = next(s for s in EXPORT_SECTIONS if s.kind == "task").statement()
+
+        assert kinds == [
+            "goal",
+            "milestone",
+            "project",
+            "task",
+            "project_dependency",
+            "task_dependency",
+        ]
+        assert "open_blocker_count" not in [c.name for c in task_columns.selected_columns]
+        assert "dependencies" in [c.name for c in task_columns.selected_columns]
+
+    async def test_streams_meta_then_every_section_in_batches(self):
+        """Test that rows arrive in yield_per chunks after a meta header."""
+        now = datetime.now(timezone.utc)
+        goals = [(uuid4(), f"Goal {i}", False, now, now) for i in range(5)]
+        edge = (uuid4(), uuid4())
+        engine = FakeEngine({"goals": goals, "task_dependencies": [edge]})
+
+        chunks, records = await collect(engine, batch_size=2)
+
+        assert records[0]["type"] == "meta"
+        assert records[0]["data"]["format"] == EXPORT_FORMAT
+        assert [r["data"]["title"] for r in records if r["type"] == "goal"] == [
+            f"Goal {i}" for i in range(5)
+        ]
+        assert records[-1] == {
+            "type": "task_dependency",
+            "data": {"task_id": str(edge[0]), "depends_on_id": str(edge[1])},
+        }
+        assert len(chunks) == 1 + 3 + 1  # meta, goals in 2+2+1, one edge batch
+
+    async def test_reads_one_read_only_snapshot(self):
+        """Test that all sections are read in one REPEATABLE READ read-only transaction."""
+        engine = FakeEngine({})
+
+        await collect(engine)
+
+        assert engine.connection.options == {
+            "isolation_level": "REPEATABLE READ",
+            "postgresql_readonly": True,
+        }
+        assert len(engine.connection.statements) == len(EXPORT_SECTIONS)